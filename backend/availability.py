@@ -0,0 +1,333 @@
+# Disponibilités des praticiens : modèle hebdomadaire structuré (plages
+# d'ouverture par jour, pauses, exceptions datées), lecture du texte libre
+# "Lun-Ven 9h-18h" et calcul des créneaux libres par arithmétique
+# d'intervalles, en minutes depuis l'epoch (UTC).
+
+import asyncio
+import os
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+
+from booking import MAX_DURATION, practitioner_timezone
+from normalize import fold
+
+MAX_SLOT_DAYS = 62
+
+# availability_source: where a practitioner's template comes from
+SOURCE_SCHEDULE = "schedule"  # parsed from the free-text schedule, re-parsed when it changes
+SOURCE_MANUAL = "manual"  # set explicitly, kept until replaced or reset
+
+# Candidates whose appointments are fetched together by the availability search
+AVAILABILITY_BATCH_SIZE = int(os.environ.get('AVAILABILITY_BATCH_SIZE', 500))
+# Candidates checked per search request at most; a sparse filter returns a
+# short page and a cursor rather than walking the whole directory. The
+# free-slot check costs about 40-70 us of CPU per candidate (0.4-0.7 s per
+# 10k in benchmarks/bench_availability_search.py), so up to 80-140 ms per
+# request, spent batch by batch in the default executor
+AVAILABILITY_MAX_SCANNED = int(os.environ.get('AVAILABILITY_MAX_SCANNED', 2000))
+
+# Widest UTC offsets: a window of local dates, whatever the timezone, fits in
+# [day_from - 14h, day_to + 1 day + 12h] UTC
+_UTC_MARGIN = (timedelta(hours=14), timedelta(hours=12))
+
+DAYS = {
+    "lundi": 0, "lun": 0, "mardi": 1, "mar": 1, "mercredi": 2, "mer": 2, "jeudi": 3, "jeu": 3,
+    "vendredi": 4, "ven": 4, "samedi": 5, "sam": 5, "dimanche": 6, "dim": 6,
+}
+
+_DAY = r"\b(lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche|lun|mar|mer|jeu|ven|sam|dim)\b\.?"
+_HOUR = r"(\d{1,2})\s*(?:h|:)\s*(\d{2})?"
+_TOKEN_RE = re.compile(
+    rf"(?P<days>{_DAY}(?:\s*(?:-|a|au)\s*{_DAY})?)"
+    rf"|(?P<hours>{_HOUR}\s*(?:-|a)\s*{_HOUR})"
+)
+_TIME_RE = re.compile(r"^([01]\d|2[0-3]):([0-5]\d)$|^24:00$")
+
+
+class InvalidAvailability(ValueError):
+    pass
+
+
+def _minutes(value):
+    """Minutes since midnight of "HH:MM" ("24:00" closes a day)"""
+    if not _TIME_RE.match(value or ""):
+        raise InvalidAvailability(f"Invalid time '{value}', expected HH:MM")
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _hhmm(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _merge(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _gaps(intervals, removed):
+    i = 0
+    for start, end in intervals:
+        while i < len(removed) and removed[i][1] <= start:
+            i += 1
+        j = i
+        while j < len(removed) and removed[j][0] < end:
+            if removed[j][0] > start:
+                yield start, removed[j][0]
+            start = max(start, removed[j][1])
+            j += 1
+        if start < end:
+            yield start, end
+
+
+def subtract(intervals, removed):
+    """Sorted, disjoint intervals minus sorted, disjoint removed intervals"""
+    return list(_gaps(intervals, removed))
+
+
+def _ranges(value, label):
+    if not isinstance(value, (list, tuple)):
+        raise InvalidAvailability(f"{label} must be a list of [start, end] ranges")
+    ranges = []
+    for item in value:
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            raise InvalidAvailability(f"{label} must be a list of [start, end] ranges")
+        start, end = _minutes(item[0]), _minutes(item[1])
+        if start >= end:
+            raise InvalidAvailability(f"{label}: {item[0]}-{item[1]} ends before it starts")
+        ranges.append((start, end))
+    return [[_hhmm(start), _hhmm(end)] for start, end in _merge(ranges)]
+
+
+def validate_template(template):
+    """Normalized copy of an availability template; raises InvalidAvailability.
+
+    {"weekly": 7 lists (Monday first) of ["HH:MM", "HH:MM"] opening ranges,
+     "breaks": ranges closed on every day,
+     "exceptions": {"YYYY-MM-DD": ranges replacing that day, [] = closed}}
+    """
+    weekly = template.get("weekly")
+    if not isinstance(weekly, (list, tuple)) or len(weekly) != 7:
+        raise InvalidAvailability("weekly must list the opening ranges of the 7 weekdays, Monday first")
+    exceptions = {}
+    for day, ranges in (template.get("exceptions") or {}).items():
+        try:
+            day = date.fromisoformat(day).isoformat()
+        except ValueError:
+            raise InvalidAvailability(f"Invalid exception date '{day}', expected YYYY-MM-DD")
+        exceptions[day] = _ranges(ranges, day)
+    return {
+        "weekly": [_ranges(ranges, f"weekly[{i}]") for i, ranges in enumerate(weekly)],
+        "breaks": _ranges(template.get("breaks") or [], "breaks"),
+        "exceptions": exceptions,
+    }
+
+
+def parse_schedule(text):
+    """Template read from a free-text schedule such as "Lun-Ven 9h-12h, 14h-18h; Sam 9h-12h".
+
+    Returns None when no day with opening hours is recognized.
+    """
+    weekly = [[] for _ in range(7)]
+    days, days_have_hours = [], False
+    for match in _TOKEN_RE.finditer(fold(text)):
+        if match.group("days"):
+            if days_have_hours:
+                days, days_have_hours = [], False
+            first, last = DAYS[match.group(2)], DAYS[match.group(3) or match.group(2)]
+            span = range(first, last + 1) if first <= last else [*range(first, 7), *range(0, last + 1)]
+            days.extend(span)
+        elif days:
+            start = int(match.group(5)) * 60 + int(match.group(6) or 0)
+            end = int(match.group(7)) * 60 + int(match.group(8) or 0)
+            if start < end <= 24 * 60:
+                for day in days:
+                    weekly[day].append([_hhmm(start), _hhmm(end)])
+                days_have_hours = True
+    if not any(weekly):
+        return None
+    return validate_template({"weekly": weekly})
+
+
+def follows_schedule(practitioner):
+    """Whether the stored template is derived from the free-text schedule.
+
+    Documents written before availability_source existed count as derived
+    when their template is exactly what the schedule parses to.
+    """
+    source = practitioner.get("availability_source")
+    if source:
+        return source == SOURCE_SCHEDULE
+    template = practitioner.get("availability")
+    return not template or template == parse_schedule(practitioner.get("schedule"))
+
+
+def practitioner_availability(practitioner):
+    """Stored template, or the one read from the free-text schedule"""
+    return practitioner.get("availability") or parse_schedule(practitioner.get("schedule"))
+
+
+def epoch_minutes(value):
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp()) // 60
+
+
+def _from_epoch_minutes(minutes):
+    return datetime.fromtimestamp(minutes * 60, tz=timezone.utc)
+
+
+@lru_cache(maxsize=8192)
+def _local_epoch_minutes(day, minutes, tz):
+    if minutes == 24 * 60:
+        day, minutes = day + timedelta(days=1), 0
+    return epoch_minutes(datetime.combine(day, time(minutes // 60, minutes % 60), tzinfo=tz))
+
+
+def _opening(template, tz, day_from, day_to):
+    # Lazy, so that has_free_slot() stops at the first free day
+    breaks = [(_minutes(s), _minutes(e)) for s, e in template.get("breaks", [])]
+    weekly = [subtract([(_minutes(s), _minutes(e)) for s, e in ranges], breaks) for ranges in template["weekly"]]
+    exceptions = template.get("exceptions") or {}
+    day = day_from
+    while day <= day_to:
+        ranges = weekly[day.weekday()]
+        if exceptions:
+            key = day.isoformat()
+            if key in exceptions:
+                ranges = subtract([(_minutes(s), _minutes(e)) for s, e in exceptions[key]], breaks)
+        for start, end in ranges:
+            yield _local_epoch_minutes(day, start, tz), _local_epoch_minutes(day, end, tz)
+        day += timedelta(days=1)
+
+
+def opening_intervals(template, tz, day_from, day_to):
+    """Opening hours between two local dates (inclusive), as epoch-minute intervals"""
+    return list(_opening(template, tz, day_from, day_to))
+
+
+def free_slots(template, tz, day_from, day_to, busy, duration, not_before=None):
+    """Back-to-back slots of duration minutes left once busy intervals are removed.
+
+    busy holds (start, end) epoch minutes, in any order; not_before (epoch
+    minutes) drops slots that already started. Returns epoch-minute pairs.
+    """
+    free = subtract(opening_intervals(template, tz, day_from, day_to), _merge(busy))
+    slots = []
+    for start, end in free:
+        if not_before is not None and start < not_before:
+            # Keep slots aligned on the start of the free interval
+            start += -(-(not_before - start) // duration) * duration
+        while start + duration <= end:
+            slots.append((start, start + duration))
+            start += duration
+    return slots
+
+
+def has_free_slot(template, tz, day_from, day_to, busy, duration, not_before=None):
+    """Whether free_slots() would return at least one slot, stopping at the first one"""
+    for start, end in _gaps(_opening(template, tz, day_from, day_to), _merge(busy)):
+        if not_before is not None and start < not_before:
+            start += -(-(not_before - start) // duration) * duration
+        if start + duration <= end:
+            return True
+    return False
+
+
+def slot_payload(slots, tz):
+    payload = []
+    for start, end in slots:
+        start_at, end_at = _from_epoch_minutes(start), _from_epoch_minutes(end)
+        local = start_at.astimezone(tz)
+        payload.append({
+            "date": local.strftime("%Y-%m-%d"),
+            "time": local.strftime("%H:%M"),
+            "start_at": start_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "end_at": end_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+    return payload
+
+
+def window_bounds(tz, day_from, day_to):
+    """UTC instants bounding local dates day_from..day_to (inclusive)"""
+    start = datetime.combine(day_from, time(0), tzinfo=tz).astimezone(timezone.utc)
+    end = datetime.combine(day_to + timedelta(days=1), time(0), tzinfo=tz).astimezone(timezone.utc)
+    return start, end
+
+
+async def fetch_busy(db, practitioner_ids, start, end):
+    """Booked (start, end) epoch-minute intervals per practitioner overlapping [start, end), in one query"""
+    busy = {practitioner_id: [] for practitioner_id in practitioner_ids}
+    cursor = db.appointments.find(
+        {
+            "practitioner_id": {"$in": list(practitioner_ids)},
+            "start_at": {"$gt": start - MAX_DURATION, "$lt": end},
+            "end_at": {"$gt": start},
+        },
+        {"_id": 0, "practitioner_id": 1, "start_at": 1, "end_at": 1}
+    )
+    async for appointment in cursor:
+        busy[appointment["practitioner_id"]].append(
+            (epoch_minutes(appointment["start_at"]), epoch_minutes(appointment["end_at"]))
+        )
+    return busy
+
+
+def _with_free_slot(batch, busy, day_from, day_to, duration, not_before):
+    """The (doc, position) pairs of a batch with a free slot; pure CPU, run in an executor"""
+    return [
+        (doc, position) for doc, position, template in batch
+        if has_free_slot(template, practitioner_timezone(doc), day_from, day_to, busy[doc["id"]], duration, not_before)
+    ]
+
+
+async def select_available(db, candidates, day_from, day_to, duration, wanted, not_before=None,
+                           batch_size=AVAILABILITY_BATCH_SIZE, max_scanned=AVAILABILITY_MAX_SCANNED):
+    """The first wanted (doc, position) pairs of candidates with a free slot in the window.
+
+    candidates is an async iterator of (practitioner doc, position) in
+    result order; docs need id, schedule, availability and timezone.
+    Appointments are fetched with one query per batch of candidates, so a
+    page usually costs a single round trip.
+
+    Returns (selected, resume): when max_scanned candidates were checked
+    before finding wanted ones, resume is the last checked candidate's
+    position, to continue the search from; otherwise None.
+    """
+    start = datetime.combine(day_from, time(0), tzinfo=timezone.utc) - _UTC_MARGIN[0]
+    end = datetime.combine(day_to + timedelta(days=1), time(0), tzinfo=timezone.utc) + _UTC_MARGIN[1]
+    selected = []
+    batch = []
+    scanned, resume = 0, None
+
+    async def check(batch):
+        busy = await fetch_busy(db, [doc["id"] for doc, _, _ in batch], start, end)
+        # Off the event loop: a batch is tens of milliseconds of CPU
+        selected.extend(await asyncio.get_running_loop().run_in_executor(
+            None, _with_free_slot, batch, busy, day_from, day_to, duration, not_before
+        ))
+
+    async for doc, position in candidates:
+        scanned += 1
+        template = practitioner_availability(doc)
+        if template:
+            batch.append((doc, position, template))
+        if scanned >= max_scanned:
+            resume = position
+            break
+        if len(batch) >= batch_size:
+            await check(batch)
+            batch = []
+            if len(selected) >= wanted:
+                break
+    if batch and len(selected) < wanted:
+        await check(batch)
+    if len(selected) >= wanted:
+        resume = None
+    return selected[:wanted], resume
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Recherche par disponibilité : coût du test "au moins un créneau libre"
+(has_free_slot) vs calcul complet des créneaux (free_slots), sur des
+praticiens synthétiques aux agendas variés, y compris complets.
+
+    python benchmarks/bench_availability_search.py [--candidates N] [--days N] [--repeat N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from availability import (  # noqa: E402
+    epoch_minutes, free_slots, has_free_slot, opening_intervals, parse_schedule, window_bounds
+)
+from booking import practitioner_timezone  # noqa: E402
+
+SCHEDULES = [
+    "Lun-Ven 9h-18h",
+    "Lun-Ven 9h-12h, 14h-19h; Sam 9h-13h",
+    "Mar, Jeu 8h30-20h",
+    "Lun-Sam 10h-12h",
+    "Mer 14h-18h",
+]
+TIMEZONES = ["Europe/Paris", "Europe/London", "America/Montreal", "Indian/Reunion"]
+
+
+def candidates(n, day_from, day_to, booked_ratio, seed=1):
+    """(template, tz, busy) per practitioner; booked_ratio of the opening hours is taken"""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        template = parse_schedule(rng.choice(SCHEDULES))
+        tz = practitioner_timezone({"timezone": rng.choice(TIMEZONES)})
+        busy = []
+        for start, end in opening_intervals(template, tz, day_from, day_to):
+            while start + 30 <= end:
+                length = rng.choice((30, 45, 60))
+                if rng.random() < booked_ratio:
+                    busy.append((start, min(start + length, end)))
+                start += length
+        rng.shuffle(busy)
+        rows.append((template, tz, busy))
+    return rows
+
+
+def measure(fn, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--duration", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    day_from = date(2025, 1, 6)
+    day_to = day_from + timedelta(days=args.days - 1)
+    not_before = epoch_minutes(window_bounds(practitioner_timezone({}), day_from, day_to)[0])
+    print(f"{args.candidates} candidates, {args.days} days, {args.duration} min slots, "
+          f"median of {args.repeat} runs")
+    for label, ratio in (("half booked", 0.5), ("mostly booked", 0.9), ("fully booked", 1.0)):
+        rows = candidates(args.candidates, day_from, day_to, ratio)
+
+        def full():
+            return sum(bool(free_slots(t, tz, day_from, day_to, busy, args.duration, not_before))
+                       for t, tz, busy in rows)
+
+        def early_exit():
+            return sum(has_free_slot(t, tz, day_from, day_to, busy, args.duration, not_before)
+                       for t, tz, busy in rows)
+
+        assert full() == early_exit()
+        before = measure(full, args.repeat)
+        after = measure(early_exit, args.repeat)
+        print(f"{label:<14} available {early_exit():6d}   free_slots {before:9.1f} ms   "
+              f"has_free_slot {after:9.1f} ms   x{before / after:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Temps de chargement du catalogue : modules Python vs artefact compilé
+
+    python benchmarks/bench_catalog_import.py [--repeat N]
+"""
+
+import argparse
+import json
+import marshal
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+SOURCE_MODULES = ["categories.py", "specialties_descriptions.py"]
+CATALOG_PATH = BACKEND_DIR / "data" / "catalog.json"
+
+
+def load_python_modules_from_source():
+    # What a worker pays without a usable __pycache__: parse + compile + execute
+    for name in SOURCE_MODULES:
+        path = BACKEND_DIR / name
+        code = compile(path.read_text(encoding="utf-8"), str(path), "exec")
+        exec(code, {"__name__": path.stem})
+
+
+def load_python_modules_from_bytecode(bytecode):
+    # What import does with a warm __pycache__: unmarshal + execute
+    for data in bytecode:
+        exec(marshal.loads(data), {"__name__": "bench"})
+
+
+def load_catalog_json():
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        json.load(f)
+
+
+def measure(fn, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    bytecode = [
+        marshal.dumps(compile((BACKEND_DIR / name).read_text(encoding="utf-8"), name, "exec"))
+        for name in SOURCE_MODULES
+    ]
+    results = {
+        "python modules (source)": measure(load_python_modules_from_source, args.repeat),
+        "python modules (bytecode)": measure(lambda: load_python_modules_from_bytecode(bytecode), args.repeat),
+        "data/catalog.json": measure(load_catalog_json, args.repeat),
+    }
+    for label, ms in results.items():
+        print(f"{label:<28} {ms:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Import de patients : POST /api/patients ligne par ligne vs import en masse
+(patient_import.py), contre le MongoDB de MONGO_URL dans une base jetable
+
+    python benchmarks/bench_patient_import.py [--rows N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+load_dotenv(BACKEND_DIR / '.env')
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "therapycare")
+
+from indexes import ensure_indexes  # noqa: E402
+from patient_import import import_patients  # noqa: E402
+from practitioner_stats import record_patients  # noqa: E402
+from server import Patient, PatientCreate  # noqa: E402
+
+
+def patient_rows(n, prefix):
+    return [{
+        "full_name": f"Patient {i}",
+        "email": f"{prefix}{i}@example.com",
+        "phone": "0600000000",
+        "notes": "Importé depuis l'ancien logiciel",
+    } for i in range(n)]
+
+
+async def one_by_one(db, practitioner_id, rows):
+    # What POST /api/patients does, once per row
+    for row in rows:
+        patient = Patient(practitioner_id=practitioner_id, **PatientCreate(**row).model_dump())
+        doc = patient.model_dump()
+        doc['created_at'] = doc['created_at'].isoformat()
+        await db.patients.insert_one(doc)
+        await record_patients(db, practitioner_id, 1)
+
+
+async def run(rows):
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME'] + "_bench_import"]
+    try:
+        await ensure_indexes(db)
+        results = {}
+        for label in ("one by one", "bulk import"):
+            practitioner_id = str(uuid.uuid4())
+            data = patient_rows(rows, label.replace(" ", "-"))
+            start = time.perf_counter()
+            if label == "one by one":
+                await one_by_one(db, practitioner_id, data)
+            else:
+                await import_patients(db, practitioner_id, data, PatientCreate, Patient)
+            results[label] = time.perf_counter() - start
+        for label, seconds in results.items():
+            print(f"{label:<12} {seconds * 1000:10.1f} ms   {rows / seconds:10.0f} rows/s")
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
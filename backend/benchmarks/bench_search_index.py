@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Recherche publique sur l'index en mémoire : temps par page (première page et
+page suivante) sur un annuaire synthétique, par filtre et par tri.
+
+    python benchmarks/bench_search_index.py [--practitioners N] [--repeat N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from search_engine import PractitionerSearchIndex  # noqa: E402
+
+FIRST_NAMES = ["Marie", "Jean", "Sophie", "Pierre", "Camille", "Lucas", "Emma", "Louis", "Chloé", "Hugo"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+              "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier"]
+SPECIALTIES = [("Psychologue", "psychologie"), ("Psychothérapeute", "psychologie"), ("Sophrologue", "bien-etre"),
+               ("Ostéopathe", "corps"), ("Naturopathe", "bien-etre"), ("Hypnothérapeute", "psychologie"),
+               ("Kinésithérapeute", "corps"), ("Diététicien", "nutrition")]
+# Paris weighs like a big city in a national directory
+CITIES = ["Paris"] * 6 + ["Lyon", "Marseille", "Toulouse", "Nantes", "Lille", "Bordeaux", "Saint-Étienne",
+                          "Rennes", "Montpellier", "Strasbourg", "Nice", "Grenoble", "Dijon", "Angers"]
+
+QUERIES = [
+    ("no filter", {}),
+    ("city=paris", {"city": "paris"}),
+    ("specialty=psycho", {"specialty": "psycho"}),
+    ("specialty=osteo", {"specialty": "osteo"}),
+    ("city=lyon", {"city": "lyon"}),
+    ("category", {"category": "corps"}),
+    ("q=martin psycho", {"q": "martin psycho"}),
+    ("q=dubois lyon", {"q": "dubois lyon"}),
+]
+
+
+def directory(n, seed=1):
+    rng = random.Random(seed)
+    for _ in range(n):
+        specialty, category = rng.choice(SPECIALTIES)
+        reviews_count = rng.randint(0, 60)
+        yield {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "specialty": specialty,
+            "category": category,
+            "city": rng.choice(CITIES),
+            "description": f"{specialty} à l'écoute, thérapies brèves et accompagnement",
+            "reviews_count": reviews_count,
+            "rating_score": round(rng.uniform(3, 5), 3) if reviews_count else 3.5,
+        }
+
+
+def measure(fn, repeat, setup=None):
+    durations = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--practitioners", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    index = PractitionerSearchIndex()
+    index._bulk_loading = True
+    for doc in directory(args.practitioners):
+        index.upsert(doc)
+    index._finish_bulk_load()
+    print(f"{args.practitioners} practitioners, {args.limit} per page, median of {args.repeat} runs")
+
+    for sort_by in ("rating", "name"):
+        for label, filters in QUERIES:
+            _, position = index.search(sort_by=sort_by, limit=args.limit, **filters)
+            # First page with nothing cached, next page with the matches of the first
+            first = measure(
+                lambda: index.search(sort_by=sort_by, limit=args.limit, **filters), args.repeat, index._matches.clear
+            )
+            after = measure(
+                lambda: index.search(sort_by=sort_by, limit=args.limit, after=position, **filters), args.repeat
+            )
+            print(f"sort={sort_by:<7} {label:<18} first page {first:7.2f} ms   next page {after:7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Coût de sérialisation des listes : validation Pydantic ligne par ligne
+(response_model) vs chemin rapide de fast_json.py
+
+    python benchmarks/bench_serialization.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+from pydantic import TypeAdapter
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+# server.py reads these at import time; the client never connects here
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "bench")
+
+import fast_json  # noqa: E402
+from server import Patient, PractitionerPublic  # noqa: E402
+
+
+def practitioner_rows(n):
+    return [{
+        "id": str(uuid.uuid4()),
+        "full_name": f"Praticien {i}",
+        "specialty": "Psychologue clinicien",
+        "description": "Accompagnement des adultes et adolescents. " * 4,
+        "phone": "0600000000",
+        "schedule": "Lun-Ven 9h-18h",
+        "address": f"{i} rue de la Paix",
+        "city": "Paris",
+        "photo_url": "",
+        "rating": 4.5,
+        "reviews_count": i % 50,
+        "category": "psychologie",
+    } for i in range(n)]
+
+
+def patient_rows(n):
+    return [{
+        "id": str(uuid.uuid4()),
+        "practitioner_id": "p1",
+        "full_name": f"Patient {i}",
+        "email": f"patient{i}@example.com",
+        "phone": "0600000000",
+        "notes": "",
+        "created_at": "2025-01-15T10:00:00+00:00",
+    } for i in range(n)]
+
+
+def response_model_path(rows, model, build_models):
+    # What the endpoints did before: model(**row) in the handler, then FastAPI
+    # validates again against response_model, dumps, and json.dumps the result
+    content = [model(**row) for row in rows] if build_models else rows
+    adapter = TypeAdapter(List[model])
+    value = adapter.validate_python(content, from_attributes=True)
+    return json.dumps(adapter.dump_python(value, mode="json"), ensure_ascii=False,
+                      allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def measure(fn, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    cases = [
+        ("practitioners", practitioner_rows(args.rows), PractitionerPublic, True),
+        ("patients", patient_rows(args.rows), Patient, False),
+    ]
+    encoder = "orjson" if fast_json.orjson is not None else "json"
+    print(f"{args.rows} rows, median of {args.repeat} runs ({encoder})")
+    for label, rows, model, build_models in cases:
+        before = measure(lambda: response_model_path(rows, model, build_models), args.repeat)
+        after = measure(lambda: fast_json.fast_list_response(rows, model).body, args.repeat)
+        print(f"{label:<14} response_model {before:8.3f} ms   fast path {after:8.3f} ms   x{before / after:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# Détection des chevauchements de rendez-vous : chaque rendez-vous est stocké
+# avec start_at / end_at (dates BSON, UTC, calculées dans le fuseau du
+# praticien) et une réservation ne passe que si aucun intervalle existant ne
+# la croise. Un verrou à bail par praticien (collection booking_locks)
+# sérialise les créations concurrentes.
+
+import asyncio
+import os
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+# Longest bookable appointment: bounds how far back an overlapping start can be
+MAX_APPOINTMENT_MINUTES = int(os.environ.get('MAX_APPOINTMENT_MINUTES', 480))
+MAX_DURATION = timedelta(minutes=MAX_APPOINTMENT_MINUTES)
+
+DEFAULT_TIMEZONE = os.environ.get('DEFAULT_TIMEZONE', 'Europe/Paris')
+
+BOOKING_LOCK_TTL = int(os.environ.get('BOOKING_LOCK_TTL', 10))  # seconds
+BOOKING_LOCK_TIMEOUT = float(os.environ.get('BOOKING_LOCK_TIMEOUT', 5))
+
+CONFLICT_FIELDS = {"_id": 0, "id": 1, "patient_name": 1, "date": 1, "time": 1, "duration": 1}
+
+
+class InvalidSlot(ValueError):
+    pass
+
+
+class BookingBusy(Exception):
+    """Another request held the practitioner's booking lock for too long"""
+
+
+def valid_timezone(name):
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+    return True
+
+
+def practitioner_timezone(practitioner):
+    """The practitioner's ZoneInfo, DEFAULT_TIMEZONE when unset or unknown"""
+    name = (practitioner or {}).get("timezone") or DEFAULT_TIMEZONE
+    return ZoneInfo(name if valid_timezone(name) else DEFAULT_TIMEZONE)
+
+
+def local_date_time(start_at, tz):
+    """YYYY-MM-DD date and HH:MM time of a UTC instant, as shown in tz"""
+    if start_at.tzinfo is None:
+        start_at = start_at.replace(tzinfo=timezone.utc)
+    local = start_at.astimezone(tz)
+    return local.strftime("%Y-%m-%d"), local.strftime("%H:%M")
+
+
+def appointment_interval(date, time, duration, tz):
+    """(start_at, end_at) in UTC for a YYYY-MM-DD date and HH:MM time local to tz"""
+    try:
+        local = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        raise InvalidSlot("Invalid date or time, expected YYYY-MM-DD and HH:MM")
+    if not 0 < duration <= MAX_APPOINTMENT_MINUTES:
+        raise InvalidSlot(f"duration must be between 1 and {MAX_APPOINTMENT_MINUTES} minutes")
+    start = local.replace(tzinfo=tz).astimezone(timezone.utc)
+    return start, start + timedelta(minutes=duration)
+
+
+async def relocalize_appointments(db, practitioner_id, tz, since=None):
+    """Re-derive date and time in tz for the appointments starting from since (default now).
+
+    start_at and end_at do not move. Returns (old date, new date) for every
+    appointment whose local date or time changed.
+    """
+    since = since or datetime.now(timezone.utc)
+    moved, operations = [], []
+    async for appointment in db.appointments.find(
+        {"practitioner_id": practitioner_id, "start_at": {"$gte": since}},
+        {"_id": 0, "id": 1, "start_at": 1, "date": 1, "time": 1}
+    ):
+        local_date, local_time = local_date_time(appointment["start_at"], tz)
+        if (local_date, local_time) != (appointment.get("date"), appointment.get("time")):
+            operations.append(UpdateOne({"id": appointment["id"]}, {"$set": {"date": local_date, "time": local_time}}))
+            moved.append((appointment.get("date"), local_date))
+    if operations:
+        await db.appointments.bulk_write(operations, ordered=False)
+    return moved
+
+
+def _overlap_clause(practitioner_id, start, end):
+    # An overlapping appointment starts before end and ends after start. As
+    # none lasts longer than MAX_DURATION it also starts after start - MAX_DURATION,
+    # which bounds the scan on (practitioner_id, start_at, end_at).
+    return {
+        "practitioner_id": practitioner_id,
+        "start_at": {"$gt": start - MAX_DURATION, "$lt": end},
+        "end_at": {"$gt": start},
+    }
+
+
+async def find_conflicts(db, practitioner_id, intervals, exclude_ids=()):
+    """Appointments overlapping any (start_at, end_at) interval, in one query"""
+    clauses = [_overlap_clause(practitioner_id, start, end) for start, end in intervals]
+    query = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+    if exclude_ids:
+        query = {"$and": [query, {"id": {"$nin": list(exclude_ids)}}]}
+    return await db.appointments.find(query, CONFLICT_FIELDS).sort("start_at", 1).to_list(None)
+
+
+@asynccontextmanager
+async def booking_lock(db, practitioner_id, timeout=BOOKING_LOCK_TIMEOUT):
+    """Hold the practitioner's booking lease while checking and writing.
+
+    The lease expires after BOOKING_LOCK_TTL seconds so a crashed request
+    cannot block the calendar; a TTL index cleans up leftovers.
+    """
+    owner = str(uuid.uuid4())
+    deadline = time.monotonic() + timeout
+    while True:
+        now = datetime.now(timezone.utc)
+        try:
+            # Matches only a free or expired lease; otherwise the upsert
+            # collides with the holder's _id
+            await db.booking_locks.update_one(
+                {"_id": practitioner_id, "expires_at": {"$lte": now}},
+                {"$set": {"owner": owner, "expires_at": now + timedelta(seconds=BOOKING_LOCK_TTL)}},
+                upsert=True
+            )
+            break
+        except DuplicateKeyError:
+            if time.monotonic() >= deadline:
+                raise BookingBusy(practitioner_id)
+            await asyncio.sleep(0.05)
+    try:
+        yield
+    finally:
+        await db.booking_locks.delete_one({"_id": practitioner_id, "owner": owner})
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compile le catalogue des spécialités en un seul fichier de données
+
+Sources éditées à la main :
+    categories.py                 -> CATEGORIES
+    specialties_descriptions.py   -> SPECIALTIES_DESCRIPTIONS
+
+Artefact chargé par l'API (catalog.py) :
+    data/catalog.json
+
+    python build_catalog.py [--allow-missing-descriptions]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from categories import CATEGORIES
+from specialties_descriptions import SPECIALTIES_DESCRIPTIONS
+
+CATALOG_PATH = Path(__file__).parent / 'data' / 'catalog.json'
+
+
+def validate(categories, descriptions):
+    """Return (errors, warnings) found in the catalog sources"""
+    errors, warnings = [], []
+    owner = {}
+    for slug, category in categories.items():
+        for specialty in category["specialties"]:
+            if specialty in owner:
+                warnings.append(f"'{specialty}' is listed in both '{owner[specialty]}' and '{slug}'")
+                continue
+            owner[specialty] = slug
+            if specialty not in descriptions:
+                errors.append(f"'{specialty}' ({slug}) has no description")
+
+    for name, description in descriptions.items():
+        if name not in owner:
+            warnings.append(f"description '{name}' does not match any specialty in CATEGORIES")
+        elif description.get("category") != owner[name]:
+            warnings.append(f"'{name}' is described in '{description.get('category')}' but listed in '{owner[name]}'")
+    return errors, warnings
+
+
+def compile_catalog(categories, descriptions):
+    # First category listing a specialty wins, as in catalog.get_all_specialties()
+    specialty_categories = {}
+    for slug, category in categories.items():
+        for specialty in category["specialties"]:
+            specialty_categories.setdefault(specialty, slug)
+
+    category_descriptions = {slug: [] for slug in categories}
+    for name, description in descriptions.items():
+        category_descriptions.setdefault(description.get("category", ""), []).append(name)
+
+    catalog = {
+        "categories": categories,
+        "descriptions": descriptions,
+        "specialty_categories": specialty_categories,
+        "category_descriptions": category_descriptions,
+    }
+    body = json.dumps(catalog, ensure_ascii=False, separators=(",", ":"))
+    catalog["version"] = hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
+    return catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile data/catalog.json")
+    parser.add_argument("--allow-missing-descriptions", action="store_true",
+                        help="Build even if some specialties have no description")
+    parser.add_argument("--output", type=Path, default=CATALOG_PATH)
+    args = parser.parse_args(argv)
+
+    errors, warnings = validate(CATEGORIES, SPECIALTIES_DESCRIPTIONS)
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    for error in errors:
+        print(f"❌ {error}")
+    if errors and not args.allow_missing_descriptions:
+        print(f"❌ {len(errors)} specialties without description, catalog not written")
+        return 1
+
+    catalog = compile_catalog(CATEGORIES, SPECIALTIES_DESCRIPTIONS)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"✅ {args.output} written (version {catalog['version']}, "
+          f"{len(catalog['specialty_categories'])} specialties, {len(catalog['descriptions'])} descriptions)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +0,0 @@
-#!/bin/bash
-# Script pour construire le fichier complet des spécialités
-
-echo "🔨 Construction du fichier specialties_descriptions.py complet..."
-
-# Le fichier sera volumineux (~150KB) donc on le construit progressivement
-# J'utilise une approche de génération automatique
-
-python3 << 'EOFPYTHON'
-# Ce script génère automatiquement le fichier specialties_descriptions.py
-# avec les 192 spécialités à partir des données extraites
-
-print("📝 Génération en cours...")
-print("⏱️  Temps estimé: 30 secondes")
-
-# Ici on génèrera le fichier complet
-# Pour l'instant, indiquons simplement que nous sommes prêts
-
-print("✅ Script de génération prêt!")
-print("")
-print("💡 Prochaine étape: Exécution de la génération complète")
-
-EOFPYTHON
-
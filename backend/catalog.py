@@ -0,0 +1,68 @@
+# Accès en lecture seule au catalogue compilé (data/catalog.json, généré par
+# build_catalog.py). Le fichier est chargé à la première utilisation puis
+# partagé par tout le processus ; les workers qui le chargent lisent le même
+# fichier depuis le cache de pages du système.
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+CATALOG_PATH = Path(__file__).parent / 'data' / 'catalog.json'
+
+
+@lru_cache(maxsize=1)
+def load_catalog():
+    with open(CATALOG_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    return MappingProxyType({key: MappingProxyType(value) if isinstance(value, dict) else value
+                             for key, value in data.items()})
+
+
+def categories():
+    return load_catalog()["categories"]
+
+
+def specialty_descriptions():
+    return load_catalog()["descriptions"]
+
+
+def specialty_categories():
+    """Specialty name -> slug of the first category listing it"""
+    return load_catalog()["specialty_categories"]
+
+
+def catalog_version():
+    return load_catalog()["version"]
+
+
+def get_all_categories():
+    return [{
+        "slug": slug,
+        "name": data["name"],
+        "description": data["description"],
+        "specialties_count": len(data["specialties"])
+    } for slug, data in categories().items()]
+
+
+def get_category_by_slug(slug):
+    return categories().get(slug)
+
+
+def get_all_specialties():
+    return [{
+        "name": specialty,
+        "category_slug": category_slug,
+        "category_name": category_data["name"]
+    } for category_slug, category_data in categories().items() for specialty in category_data["specialties"]]
+
+
+def get_specialty_description(specialty_name):
+    """Retourne la description complète d'une spécialité"""
+    return specialty_descriptions().get(specialty_name)
+
+
+def get_specialties_by_category(category_slug):
+    """Retourne toutes les spécialités d'une catégorie avec leurs descriptions"""
+    names = load_catalog()["category_descriptions"].get(category_slug, [])
+    return {name: specialty_descriptions()[name] for name in names}
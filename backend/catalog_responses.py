@@ -0,0 +1,57 @@
+# Réponses JSON du catalogue (catégories, spécialités) rendues une seule fois
+# au démarrage : le catalogue ne change qu'au déploiement.
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+
+from catalog import (
+    categories, get_all_categories, get_all_specialties, get_category_by_slug, get_specialties_by_category,
+    specialty_descriptions
+)
+
+CATALOG_MAX_AGE = int(os.environ.get('CATALOG_MAX_AGE', 86400))
+
+
+@dataclass(frozen=True)
+class PrecomputedResponse:
+    body: bytes
+    etag: str
+
+
+def render(payload) -> PrecomputedResponse:
+    # Same encoding as FastAPI's JSONResponse
+    body = json.dumps(payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return PrecomputedResponse(body=body, etag='"%s"' % hashlib.sha256(body).hexdigest()[:32])
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def cached_response(request: Request, precomputed: PrecomputedResponse) -> Response:
+    """200 with the prebuilt body, or 304 when the client already has it"""
+    headers = {
+        "ETag": precomputed.etag,
+        "Cache-Control": f"public, max-age={CATALOG_MAX_AGE}",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, precomputed.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=precomputed.body, media_type="application/json", headers=headers)
+
+
+CATEGORIES_RESPONSE = render(get_all_categories())
+CATEGORY_RESPONSES = {slug: render(get_category_by_slug(slug)) for slug in categories()}
+CATEGORY_SPECIALTIES_RESPONSES = {slug: render(get_specialties_by_category(slug)) for slug in categories()}
+SPECIALTIES_RESPONSE = render(get_all_specialties())
+SPECIALTY_RESPONSES = {
+    name: render({"name": name, **description})
+    for name, description in specialty_descriptions().items()
+}
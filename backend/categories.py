@@ -1,4 +1,5 @@
 # Liste des catégories et spécialités TherapyCare
+# Source du catalogue : après modification, régénérer data/catalog.json avec build_catalog.py
 
 CATEGORIES = {
     "psychologie": {
@@ -210,25 +211,3 @@ CATEGORIES = {
         ]
     }
 }
-
-def get_all_categories():
-    return [{
-        "slug": slug,
-        "name": data["name"],
-        "description": data["description"],
-        "specialties_count": len(data["specialties"])
-    } for slug, data in CATEGORIES.items()]
-
-def get_category_by_slug(slug):
-    return CATEGORIES.get(slug)
-
-def get_all_specialties():
-    specialties = []
-    for category_slug, category_data in CATEGORIES.items():
-        for specialty in category_data["specialties"]:
-            specialties.append({
-                "name": specialty,
-                "category_slug": category_slug,
-                "category_name": category_data["name"]
-            })
-    return specialties
@@ -0,0 +1,83 @@
+# Export de l'historique d'un praticien en NDJSON ou CSV. Les documents sont
+# lus par lots depuis un curseur Mongo et encodés au fil de l'eau : la mémoire
+# utilisée par requête ne dépend que de EXPORT_BATCH_SIZE.
+
+import csv
+import io
+import os
+from datetime import date, datetime, timedelta
+
+from fastapi.responses import StreamingResponse
+
+from fast_json import dumps
+
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', 500))
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def date_range_filter(field, date_from=None, date_to=None, timestamp=False):
+    """Mongo filter on field for the inclusive YYYY-MM-DD range [date_from, date_to].
+
+    With timestamp=True the field holds isoformat() datetimes, so the upper
+    bound becomes "before the next day". Raises ValueError on a bad date.
+    """
+    condition = {}
+    if date_from:
+        condition["$gte"] = date.fromisoformat(date_from).isoformat()
+    if date_to:
+        end = date.fromisoformat(date_to)
+        if timestamp:
+            condition["$lt"] = (end + timedelta(days=1)).isoformat()
+        else:
+            condition["$lte"] = end.isoformat()
+    return {field: condition} if condition else {}
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def _ndjson_chunks(cursor, fields):
+    lines = []
+    async for doc in cursor:
+        lines.append(dumps({name: doc.get(name) for name in fields}))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def _csv_chunks(cursor, fields):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    rows = 0
+    async for doc in cursor:
+        writer.writerow([_csv_value(doc.get(name)) for name in fields])
+        rows += 1
+        if rows >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+def export_response(cursor, fields, format, filename) -> StreamingResponse:
+    """Stream the documents of cursor as NDJSON or CSV, one chunk per batch"""
+    fields = list(fields)
+    chunks = _csv_chunks(cursor, fields) if format == "csv" else _ndjson_chunks(cursor, fields)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'},
+    )
@@ -0,0 +1,84 @@
+# Chemin de réponse rapide pour les listes : les documents Mongo, déjà
+# projetés sur les champs du modèle, sont sérialisés directement (orjson si
+# disponible) sans revalider chaque ligne avec Pydantic.
+
+import json
+import os
+from datetime import date, datetime, timedelta
+from typing import List
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional dependency, see requirements.txt
+    orjson = None
+
+# Set FAST_JSON_RESPONSES=0 to validate every row against its model again
+FAST_JSON_RESPONSES = os.environ.get('FAST_JSON_RESPONSES', '1') == '1'
+
+_ADAPTERS = {}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def projection(model) -> dict:
+    """Mongo projection returning exactly the fields of model"""
+    return {"_id": 0, **{name: 1 for name in model.model_fields}}
+
+
+def _trusted_row(row, fields):
+    out = {}
+    for name, field in fields.items():
+        value = row.get(name)
+        if value is None and not field.is_required():
+            value = field.get_default(call_default_factory=True)
+        # Timestamps are stored as isoformat() strings or BSON dates (UTC);
+        # Pydantic renders UTC as "Z"
+        if isinstance(value, datetime) and value.utcoffset() in (None, timedelta(0)):
+            value = value.replace(tzinfo=None).isoformat() + "Z"
+        elif isinstance(value, str) and name.endswith("_at") and value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        out[name] = value
+    return out
+
+
+def _response_headers(headers):
+    # Headers set on the injected Response (e.g. X-Next-Cursor), minus the ones
+    # the returned response computes itself
+    if headers is None:
+        return None
+    return {key: value for key, value in headers.items() if key not in ("content-length", "content-type")}
+
+
+def fast_list_response(rows, model, headers=None) -> Response:
+    """Serialize rows (projected with projection(model)) as a JSON list of model"""
+    headers = _response_headers(headers)
+    if FAST_JSON_RESPONSES:
+        fields = model.model_fields
+        return FastJSONResponse([_trusted_row(row, fields) for row in rows], headers=headers)
+
+    adapter = _ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _ADAPTERS[model] = TypeAdapter(List[model])
+    return Response(adapter.dump_json(adapter.validate_python(rows)), media_type="application/json", headers=headers)
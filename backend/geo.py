@@ -0,0 +1,49 @@
+# Géocodage hors ligne des praticiens à partir du répertoire de communes
+# embarqué (data/communes.csv : nom, code_postal, latitude, longitude).
+# Le fichier peut être remplacé par un export complet des communes
+# françaises ayant les mêmes colonnes.
+
+import csv
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from normalize import search_key
+
+GAZETTEER_PATH = Path(__file__).parent / 'data' / 'communes.csv'
+
+_POSTAL_CODE_RE = re.compile(r"\b(\d{5})\b")
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer():
+    """Return ({city_key: (lon, lat)}, {postal_code: (lon, lat)})"""
+    by_name, by_postal_code = {}, {}
+    with open(GAZETTEER_PATH, encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            point = (float(row['longitude']), float(row['latitude']))
+            by_name.setdefault(search_key(row['nom']), point)
+            by_postal_code.setdefault(row['code_postal'], point)
+    return by_name, by_postal_code
+
+
+def geocode(city: Optional[str], address: Optional[str] = "") -> Optional[dict]:
+    """GeoJSON point for a city (or a postal code in the address), if known"""
+    by_name, by_postal_code = load_gazetteer()
+    tokens = search_key(city).split()
+    # "Paris 15e", "Lyon 3ème arrondissement": retry on shorter prefixes
+    for size in range(len(tokens), 0, -1):
+        point = by_name.get(" ".join(tokens[:size]))
+        if point:
+            return {"type": "Point", "coordinates": list(point)}
+    for postal_code in _POSTAL_CODE_RE.findall(f"{address or ''} {city or ''}"):
+        point = by_postal_code.get(postal_code)
+        if point:
+            return {"type": "Point", "coordinates": list(point)}
+    return None
+
+
+def practitioner_location(doc) -> dict:
+    """Fields to $set for a practitioner's location (None when unknown)"""
+    return {"location": geocode(doc.get("city"), doc.get("address"))}
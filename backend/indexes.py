@@ -0,0 +1,249 @@
+# Index declarations for every MongoDB collection used by the API, plus an
+# explain()-based check that each query shape emitted by the routes is covered.
+
+import logging
+from datetime import datetime
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, IndexModel
+
+logger = logging.getLogger(__name__)
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "practitioners": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        # Keyset pagination of the public search, one per sort_by mode
+        IndexModel([("rating_score", DESCENDING), ("id", ASCENDING)], name="rating_score_id"),
+        IndexModel([("reviews_count", DESCENDING), ("id", ASCENDING)], name="reviews_count_id"),
+        IndexModel([("full_name", ASCENDING), ("id", ASCENDING)], name="full_name_id"),
+        IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+        IndexModel([("city_key", ASCENDING)], name="city_key"),
+        IndexModel([("specialty_slug", ASCENDING)], name="specialty_slug"),
+        IndexModel(
+            [("category", ASCENDING), ("rating_score", DESCENDING), ("id", ASCENDING)], name="category_rating_score_id"
+        ),
+        IndexModel([("location", GEOSPHERE)], name="location_2dsphere"),
+    ],
+    "clients": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ],
+    "patients": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("practitioner_id", ASCENDING), ("id", ASCENDING)], name="practitioner_id_id"),
+        # id included so the export's (created_at, id) order is read from the index
+        IndexModel(
+            [("practitioner_id", ASCENDING), ("created_at", ASCENDING), ("id", ASCENDING)],
+            name="practitioner_id_created_at_id",
+        ),
+        IndexModel([("practitioner_id", ASCENDING), ("email_key", ASCENDING)], name="practitioner_id_email_key"),
+    ],
+    "appointments": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel(
+            [("practitioner_id", ASCENDING), ("date", ASCENDING), ("time", ASCENDING)],
+            name="practitioner_id_date_time",
+        ),
+        IndexModel([("practitioner_id", ASCENDING), ("created_at", ASCENDING)], name="practitioner_id_created_at"),
+        # Patient history and the $lookup of the patient list (patient_history.py)
+        IndexModel(
+            [("practitioner_id", ASCENDING), ("patient_id", ASCENDING), ("date", ASCENDING), ("time", ASCENDING)],
+            name="practitioner_id_patient_id_date_time",
+        ),
+        IndexModel(
+            [("practitioner_id", ASCENDING), ("series_id", ASCENDING), ("date", ASCENDING)],
+            name="practitioner_id_series_id_date",
+        ),
+        # Overlap checks: bounded range on start_at, then end_at (booking.py)
+        IndexModel(
+            [("practitioner_id", ASCENDING), ("start_at", ASCENDING), ("end_at", ASCENDING)],
+            name="practitioner_id_start_at_end_at",
+        ),
+    ],
+    "reviews": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        # One review per client and practitioner
+        IndexModel(
+            [("practitioner_id", ASCENDING), ("client_id", ASCENDING)],
+            name="practitioner_id_client_id_unique", unique=True,
+        ),
+        IndexModel(
+            [("practitioner_id", ASCENDING), ("created_at", DESCENDING), ("id", ASCENDING)],
+            name="practitioner_id_created_at_id",
+        ),
+    ],
+    "practitioner_stats": [
+        IndexModel([("practitioner_id", ASCENDING)], name="practitioner_id_unique", unique=True),
+    ],
+    "booking_locks": [
+        # Expired leases are taken over anyway; this only cleans them up
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+}
+
+# Placeholder values used when explaining query shapes; only the plan matters.
+_ID = "00000000-0000-0000-0000-000000000000"
+_EMAIL = "index-check@example.com"
+
+
+def _find(collection, filter, sort=None):
+    command = {"find": collection, "filter": filter}
+    if sort:
+        command["sort"] = sort
+    return command
+
+
+def _update(collection, filter):
+    return {"update": collection, "updates": [{"q": filter, "u": {"$set": {}}}]}
+
+
+def _aggregate(collection, pipeline):
+    return {"aggregate": collection, "pipeline": pipeline, "cursor": {}}
+
+
+def _find_and_update(collection, filter):
+    return {"findAndModify": collection, "query": filter, "update": {"$set": {}}}
+
+
+def _find_and_delete(collection, filter):
+    return {"findAndModify": collection, "query": filter, "remove": True}
+
+
+def _delete(collection, filter):
+    return {"delete": collection, "deletes": [{"q": filter, "limit": 1}]}
+
+
+# Every query shape the routes in server.py send to MongoDB, keyed by route.
+QUERY_SHAPES = [
+    ("get_current_user", _find("practitioners", {"id": _ID})),
+    ("POST /auth/register/client", _find("practitioners", {"email": _EMAIL})),
+    ("POST /auth/login", _find("practitioners", {"email": _EMAIL})),
+    ("POST /auth/login (rehash)", _update("practitioners", {"id": _ID})),
+    ("GET /public/practitioners (rating)", _find("practitioners", {}, sort={"rating_score": -1, "id": 1})),
+    ("GET /public/practitioners (reviews)", _find("practitioners", {}, sort={"reviews_count": -1, "id": 1})),
+    ("GET /public/practitioners (name)", _find("practitioners", {}, sort={"full_name": 1, "id": 1})),
+    ("GET /public/practitioners (next page)", _find("practitioners", {"$or": [
+        {"rating_score": {"$lt": 4.5}}, {"rating_score": 4.5, "id": {"$gt": _ID}},
+    ]}, sort={"rating_score": -1, "id": 1})),
+    ("GET /public/practitioners (specialty)", _find("practitioners", {"specialty_slug": "psychologue"}, sort={"rating_score": -1, "id": 1})),
+    ("GET /public/practitioners (category)", _find("practitioners", {"category": "psychologie"}, sort={"rating_score": -1, "id": 1})),
+    ("GET /public/practitioners (city)", _find("practitioners", {"city_key": {"$regex": "^saint etienne"}}, sort={"rating_score": -1, "id": 1})),
+    ("GET /public/practitioners/near", _aggregate("practitioners", [{"$geoNear": {
+        "near": {"type": "Point", "coordinates": [2.3522, 48.8566]},
+        "distanceField": "distance", "maxDistance": 10000, "spherical": True,
+    }}])),
+    ("search index refresh", _find("practitioners", {"updated_at": {"$gte": "2025-01-01T00:00:00"}})),
+    ("GET /public/practitioner/{id}", _find("practitioners", {"id": _ID})),
+    ("GET /public/practitioner/{id}/slots (busy)", _find("appointments", {
+        "practitioner_id": {"$in": [_ID]},
+        "start_at": {"$gt": datetime(2025, 1, 5, 15), "$lt": datetime(2025, 1, 12, 23)},
+        "end_at": {"$gt": datetime(2025, 1, 5, 23)},
+    })),
+    ("GET /public/practitioners (available, busy)", _find("appointments", {
+        "practitioner_id": {"$in": [_ID, "00000000-0000-0000-0000-000000000001"]},
+        "start_at": {"$gt": datetime(2025, 1, 5, 2), "$lt": datetime(2025, 1, 13, 12)},
+        "end_at": {"$gt": datetime(2025, 1, 5, 10)},
+    })),
+    ("GET /public/practitioner/{id}/reviews", _find("reviews", {"practitioner_id": _ID}, sort={"created_at": -1, "id": 1})),
+    ("GET /public/practitioner/{id}/reviews (next page)", _find("reviews", {"$and": [{"practitioner_id": _ID}, {"$or": [
+        {"created_at": {"$lt": "2025-01-01T00:00:00"}}, {"created_at": "2025-01-01T00:00:00", "id": {"$gt": _ID}},
+    ]}]}, sort={"created_at": -1, "id": 1})),
+    ("POST /public/practitioner/{id}/reviews", _find_and_update("practitioners", {"id": _ID})),
+    ("get_current_client", _find("clients", {"id": _ID})),
+    ("PUT /practitioner/profile", _find_and_update("practitioners", {"id": _ID})),
+    ("PUT /practitioner/profile (timezone)", _find("appointments", {
+        "practitioner_id": _ID, "start_at": {"$gte": datetime(2025, 1, 6, 9)},
+    })),
+    ("GET /patients", _aggregate("patients", [{"$match": {"practitioner_id": _ID}}, {"$limit": 1000}])),
+    ("GET /patients ($lookup)", _find("appointments", {"practitioner_id": _ID, "patient_id": _ID})),
+    ("GET /patients/{id}/appointments", _find("appointments", {
+        "practitioner_id": _ID, "patient_id": _ID,
+    }, sort={"date": -1, "time": -1, "id": 1})),
+    ("GET /patients/export", _find("patients", {
+        "practitioner_id": _ID, "created_at": {"$gte": "2025-01-01", "$lt": "2026-01-01"},
+    }, sort={"created_at": 1, "id": 1})),
+    ("POST /patients/import", _find("patients", {"practitioner_id": _ID, "email_key": {"$in": [_EMAIL, None]}})),
+    ("PUT /patients/{id}", _find_and_update("patients", {"id": _ID, "practitioner_id": _ID})),
+    ("DELETE /patients/{id}", _delete("patients", {"id": _ID, "practitioner_id": _ID})),
+    ("GET /appointments", _find("appointments", {"practitioner_id": _ID}, sort={"date": 1, "time": 1})),
+    ("GET /appointments (window)", _find("appointments", {
+        "practitioner_id": _ID, "date": {"$gte": "2025-01-06", "$lte": "2025-01-12"},
+    }, sort={"date": 1, "time": 1})),
+    ("GET /appointments/export", _find("appointments", {
+        "practitioner_id": _ID, "date": {"$gte": "2025-01-01", "$lte": "2025-12-31"},
+    }, sort={"date": 1, "time": 1})),
+    ("POST /appointments (conflicts)", _find("appointments", {
+        "practitioner_id": _ID,
+        "start_at": {"$gt": datetime(2025, 1, 6, 1), "$lt": datetime(2025, 1, 6, 10)},
+        "end_at": {"$gt": datetime(2025, 1, 6, 9)},
+    }, sort={"start_at": 1})),
+    ("POST /appointments/series (conflicts)", _find("appointments", {"$or": [
+        {"practitioner_id": _ID, "start_at": {"$gt": datetime(2025, 1, d, 1), "$lt": datetime(2025, 1, d, 10)},
+         "end_at": {"$gt": datetime(2025, 1, d, 9)}}
+        for d in (6, 13)
+    ]}, sort={"start_at": 1})),
+    ("booking lock", _update("booking_locks", {"_id": _ID, "expires_at": {"$lte": datetime(2025, 1, 1)}})),
+    ("PUT /appointments/series/{id}", _update("appointments", {
+        "practitioner_id": _ID, "series_id": _ID, "date": {"$gte": "2025-01-01"},
+    })),
+    ("DELETE /appointments/series/{id}", _find("appointments", {"practitioner_id": _ID, "series_id": _ID})),
+    ("DELETE /appointments/{id}", _find_and_delete("appointments", {"id": _ID, "practitioner_id": _ID})),
+    ("GET /stats (rollup)", _find("practitioner_stats", {"practitioner_id": _ID})),
+    ("GET /stats (recent)", _find("appointments", {"practitioner_id": _ID}, sort={"created_at": 1})),
+    ("stats rollup $inc", _update("practitioner_stats", {"practitioner_id": _ID})),
+    ("stats rebuild (appointments)", _aggregate("appointments", [{"$match": {"practitioner_id": _ID}}])),
+    ("stats rebuild (patients)", _aggregate("patients", [{"$match": {"practitioner_id": _ID}}, {"$count": "n"}])),
+]
+
+
+async def ensure_indexes(db):
+    """Create every declared index; a no-op for indexes that already exist"""
+    for collection, indexes in INDEXES.items():
+        names = await db[collection].create_indexes(indexes)
+        logger.info("Indexes ensured on %s: %s", collection, ", ".join(names))
+
+
+async def missing_unique_indexes(db, collections=None):
+    """"collection.name" of the declared unique indexes absent from the database"""
+    missing = []
+    for collection, indexes in INDEXES.items():
+        if collections is not None and collection not in collections:
+            continue
+        existing = await db[collection].index_information()
+        for index in indexes:
+            spec = index.document
+            if spec.get("unique") and not existing.get(spec["name"], {}).get("unique"):
+                missing.append(f"{collection}.{spec['name']}")
+    return missing
+
+
+def _has_stage(node, stage):
+    if isinstance(node, dict):
+        if node.get("stage") == stage:
+            return True
+        return any(_has_stage(v, stage) for k, v in node.items() if k != "rejectedPlans")
+    if isinstance(node, list):
+        return any(_has_stage(v, stage) for v in node)
+    return False
+
+
+async def check_index_coverage(db):
+    """Explain every query shape; returns the names (uncovered, unverified).
+
+    Uncovered shapes are planned as COLLSCAN. Unverified ones target a
+    missing collection or got an EOF plan, which says nothing about indexes.
+    """
+    existing = set(await db.list_collection_names())
+    uncovered, unverified = [], []
+    for name, command in QUERY_SHAPES:
+        collection = next(iter(command.values()))
+        if collection not in existing:
+            unverified.append(name)
+            continue
+        plan = await db.command({"explain": command, "verbosity": "queryPlanner"})
+        if _has_stage(plan, "COLLSCAN"):
+            uncovered.append(name)
+        elif _has_stage(plan, "EOF"):
+            unverified.append(name)
+    return uncovered, unverified
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Commandes d'administration TherapyCare
+
+    python manage.py ensure-indexes
+    python manage.py check-indexes
+    python manage.py calibrate-bcrypt --target-ms 250
+    python manage.py rebuild-stats [--practitioner ID]
+    python manage.py migrate <migration> [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from indexes import check_index_coverage, ensure_indexes
+from migrations import MIGRATIONS
+from passwords import calibrate
+from practitioner_stats import rebuild_all_statistics, rebuild_statistics
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+
+def get_database():
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    return client, client[os.environ['DB_NAME']]
+
+
+async def cmd_ensure_indexes(db, args):
+    await ensure_indexes(db)
+    print("✅ Indexes created")
+    return 0
+
+
+async def cmd_check_indexes(db, args):
+    uncovered, unverified = await check_index_coverage(db)
+    for name in uncovered:
+        print(f"❌ COLLSCAN: {name}")
+    for name in unverified:
+        print(f"❌ Not verified (missing collection or EOF plan): {name}")
+    if uncovered or unverified:
+        return 1
+    print("✅ Every query shape uses an index")
+    return 0
+
+
+async def cmd_calibrate_bcrypt(db, args):
+    rounds, timings = calibrate(args.target_ms)
+    for cost, ms in timings.items():
+        print(f"  rounds={cost}: {ms:.0f} ms")
+    print(f"BCRYPT_ROUNDS={rounds}")
+    return 0
+
+
+async def cmd_rebuild_stats(db, args):
+    if args.practitioner:
+        await rebuild_statistics(db, args.practitioner)
+        count = 1
+    else:
+        count = await rebuild_all_statistics(db)
+    print(f"✅ Rebuilt statistics for {count} practitioner(s)")
+    return 0
+
+
+async def cmd_migrate(db, args):
+    updated = await MIGRATIONS[args.migration](db, batch_size=args.batch_size)
+    print(f"✅ {args.migration}: {updated} document(s) updated")
+    return 0
+
+
+# Commands that do not talk to MongoDB
+OFFLINE_COMMANDS = {"calibrate-bcrypt"}
+
+COMMANDS = {
+    "ensure-indexes": cmd_ensure_indexes,
+    "check-indexes": cmd_check_indexes,
+    "calibrate-bcrypt": cmd_calibrate_bcrypt,
+    "rebuild-stats": cmd_rebuild_stats,
+    "migrate": cmd_migrate,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TherapyCare management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("ensure-indexes", help="Create the MongoDB indexes declared in indexes.py")
+    subparsers.add_parser("check-indexes", help="Fail if any route query shape would COLLSCAN or cannot be verified")
+    calibrate_parser = subparsers.add_parser("calibrate-bcrypt", help="Pick BCRYPT_ROUNDS for a target hash latency")
+    calibrate_parser.add_argument("--target-ms", type=float, default=250.0)
+    rebuild_parser = subparsers.add_parser("rebuild-stats", help="Recompute practitioner_stats rollups from scratch")
+    rebuild_parser.add_argument("--practitioner", help="Only rebuild this practitioner id")
+    migrate_parser = subparsers.add_parser("migrate", help="Run a batched online data migration")
+    migrate_parser.add_argument("migration", choices=sorted(MIGRATIONS))
+    migrate_parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    async def run():
+        if args.command in OFFLINE_COMMANDS:
+            return await COMMANDS[args.command](None, args)
+        client, db = get_database()
+        try:
+            return await COMMANDS[args.command](db, args)
+        finally:
+            client.close()
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# Migrations de données en ligne, par lots, reprenables (tri sur _id)
+
+import logging
+from datetime import datetime, timezone
+
+from pymongo import UpdateOne
+
+from availability import SOURCE_SCHEDULE, parse_schedule
+from booking import InvalidSlot, appointment_interval, practitioner_timezone
+from geo import practitioner_location
+from normalize import email_key, practitioner_search_keys, specialty_category
+from reviews import rating_fields
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+async def backfill(collection, projection, compute, query=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Apply compute(doc) -> $set fields to every matching document.
+
+    Documents are walked in _id order in batches of batch_size, each batch
+    written with one unordered bulk_write, so the migration can run while
+    the API is serving traffic. Returns the number of documents updated.
+    """
+    query = query or {}
+    last_id = None
+    updated = 0
+    while True:
+        batch_query = {"$and": [query, {"_id": {"$gt": last_id}}]} if last_id is not None else query
+        batch = await collection.find(batch_query, {"_id": 1, **projection}).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not batch:
+            break
+        operations = []
+        for doc in batch:
+            fields = await compute(doc)
+            if fields:
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+        if operations:
+            result = await collection.bulk_write(operations, ordered=False)
+            updated += result.modified_count
+        last_id = batch[-1]["_id"]
+        logger.info("%s: %d documents updated so far", collection.name, updated)
+    return updated
+
+
+def _touched(fields):
+    # Bump updated_at on fields the in-memory search index keeps, so every
+    # worker's periodic refresh picks the change up without a restart
+    return {**fields, "updated_at": datetime.now(timezone.utc).isoformat()}
+
+
+async def backfill_search_keys(db, batch_size=DEFAULT_BATCH_SIZE):
+    async def compute(doc):
+        # category is kept by the search index
+        return _touched(practitioner_search_keys(doc))
+    return await backfill(db.practitioners, {"city": 1, "specialty": 1}, compute, batch_size=batch_size)
+
+
+async def backfill_locations(db, batch_size=DEFAULT_BATCH_SIZE):
+    async def compute(doc):
+        return practitioner_location(doc)
+    return await backfill(db.practitioners, {"city": 1, "address": 1}, compute, batch_size=batch_size)
+
+
+async def backfill_categories(db, batch_size=DEFAULT_BATCH_SIZE):
+    async def compute(doc):
+        return _touched({"category": specialty_category(doc.get("specialty"))})
+    return await backfill(db.practitioners, {"specialty": 1}, compute, batch_size=batch_size)
+
+
+async def backfill_availability(db, batch_size=DEFAULT_BATCH_SIZE):
+    async def compute(doc):
+        return _touched({"availability": parse_schedule(doc.get("schedule")), "availability_source": SOURCE_SCHEDULE})
+    return await backfill(
+        db.practitioners, {"schedule": 1}, compute, query={"availability": {"$exists": False}}, batch_size=batch_size
+    )
+
+
+async def backfill_patient_email_keys(db, batch_size=DEFAULT_BATCH_SIZE):
+    """email_key, the case-insensitive key the patient import de-duplicates on"""
+    async def compute(doc):
+        return {"email_key": email_key(doc.get("email"))}
+    return await backfill(
+        db.patients, {"email": 1}, compute, query={"email_key": {"$exists": False}}, batch_size=batch_size
+    )
+
+
+async def backfill_ratings(db, batch_size=DEFAULT_BATCH_SIZE):
+    """rating_sum and rating_score (sort key of sort_by=rating) from rating and reviews_count"""
+    async def compute(doc):
+        count = doc.get("reviews_count") or 0
+        return _touched(rating_fields((doc.get("rating") or 0) * count, count))
+    return await backfill(
+        db.practitioners, {"rating": 1, "reviews_count": 1}, compute,
+        query={"rating_score": {"$exists": False}}, batch_size=batch_size
+    )
+
+
+async def backfill_appointment_datetimes(db, batch_size=DEFAULT_BATCH_SIZE):
+    """start_at/end_at (UTC) for appointments created before they were stored"""
+    timezones = {}
+
+    async def compute(doc):
+        practitioner_id = doc.get("practitioner_id")
+        if practitioner_id not in timezones:
+            practitioner = await db.practitioners.find_one({"id": practitioner_id}, {"_id": 0, "timezone": 1})
+            timezones[practitioner_id] = practitioner_timezone(practitioner)
+        try:
+            start, end = appointment_interval(
+                doc.get("date"), doc.get("time"), doc.get("duration") or 60, timezones[practitioner_id]
+            )
+        except InvalidSlot as e:
+            logger.warning("appointment %s left without start_at: %s", doc["_id"], e)
+            return None
+        return {"start_at": start, "end_at": end}
+
+    return await backfill(
+        db.appointments, {"practitioner_id": 1, "date": 1, "time": 1, "duration": 1}, compute,
+        query={"start_at": {"$exists": False}}, batch_size=batch_size
+    )
+
+
+MIGRATIONS = {
+    "search-keys": backfill_search_keys,
+    "locations": backfill_locations,
+    "categories": backfill_categories,
+    "appointment-datetimes": backfill_appointment_datetimes,
+    "availability": backfill_availability,
+    "ratings": backfill_ratings,
+    "patient-email-keys": backfill_patient_email_keys,
+}
@@ -0,0 +1,67 @@
+# Normalisation de texte pour la recherche : minuscules, sans accents
+
+import re
+import unicodedata
+
+from catalog import specialty_categories
+
+_LIGATURES = str.maketrans({"œ": "oe", "Œ": "oe", "æ": "ae", "Æ": "ae", "ß": "ss"})
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def fold(text) -> str:
+    """Lowercase and strip accents ("Thérapeute" -> "therapeute")"""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(text).translate(_LIGATURES))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text):
+    """Accent-folded alphanumeric tokens of text"""
+    return _TOKEN_RE.findall(fold(text))
+
+
+def search_key(text) -> str:
+    """Folded tokens joined by spaces ("Saint-Étienne" -> "saint etienne")"""
+    return " ".join(tokenize(text))
+
+
+def email_key(email) -> str:
+    """Case-insensitive lookup key of an email (EmailStr keeps the local part as typed)"""
+    return (email or "").strip().lower()
+
+
+def slugify(text) -> str:
+    return "-".join(tokenize(text))
+
+
+# Catalog specialties by search key, so "THERAPEUTE de Couple" resolves to
+# the slug and category of "Thérapeute de couple"
+_CATALOG_SPECIALTIES = {
+    search_key(specialty): (slugify(specialty), category_slug)
+    for specialty, category_slug in specialty_categories().items()
+}
+
+
+def specialty_slug(specialty):
+    """Return (slug, in_catalog) for a free-text specialty"""
+    match = _CATALOG_SPECIALTIES.get(search_key(specialty))
+    if match:
+        return match[0], True
+    return slugify(specialty), False
+
+
+def specialty_category(specialty) -> str:
+    """Slug of the catalog category of a free-text specialty, or """""
+    match = _CATALOG_SPECIALTIES.get(search_key(specialty))
+    return match[1] if match else ""
+
+
+def practitioner_search_keys(doc) -> dict:
+    """Normalized, indexed search fields derived from city and specialty"""
+    return {
+        "city_key": search_key(doc.get("city")),
+        "specialty_slug": specialty_slug(doc.get("specialty"))[0],
+        "category": specialty_category(doc.get("specialty")),
+    }
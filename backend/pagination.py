@@ -0,0 +1,48 @@
+# Pagination par curseur (keyset) : le curseur opaque encode la clé de tri
+# du dernier élément renvoyé.
+
+import base64
+import json
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(data: dict) -> str:
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _is_scalar(value) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Cursor data, whose values are scalars or lists of scalars: an object would act as a query operator"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise InvalidCursor(cursor)
+    if not isinstance(data, dict):
+        raise InvalidCursor(cursor)
+    for value in data.values():
+        if not (_is_scalar(value) or isinstance(value, list) and all(_is_scalar(v) for v in value)):
+            raise InvalidCursor(cursor)
+    return data
+
+
+def keyset_filter(field: str, direction: int, value, last_id: str) -> dict:
+    """Documents strictly after (value, last_id) in (field direction, id ASC) order"""
+    return compound_keyset_filter([field], direction, [value], last_id)
+
+
+def compound_keyset_filter(fields: list, direction: int, values: list, last_id: str) -> dict:
+    """Documents strictly after (*values, last_id) in (*fields direction, id ASC) order"""
+    op = "$lt" if direction < 0 else "$gt"
+    clauses = []
+    for i, field in enumerate(fields):
+        clauses.append({**dict(zip(fields[:i], values[:i])), field: {op: values[i]}})
+    clauses.append({**dict(zip(fields, values)), "id": {"$gt": last_id}})
+    return {"$or": clauses}
@@ -0,0 +1,104 @@
+# Hachage bcrypt hors de la boucle d'événements, dans un pool borné
+
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+
+DEFAULT_ROUNDS = 12
+
+
+class PasswordPoolSaturated(Exception):
+    """Raised when too many hashing jobs are already running or queued"""
+
+
+def _hashpw(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _checkpw(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+def hash_rounds(hashed: str) -> int:
+    """Cost factor encoded in a bcrypt hash ($2b$<rounds>$...)"""
+    return int(hashed.split('$')[2])
+
+
+class PasswordHasher:
+    """Runs bcrypt in a thread or process pool with a bounded backlog.
+
+    bcrypt releases the GIL, so threads are enough to keep the event loop
+    responsive; processes isolate CPU usage further at a higher startup cost.
+    """
+
+    def __init__(self, rounds=DEFAULT_ROUNDS, workers=None, max_pending=None, kind="thread"):
+        self.rounds = rounds
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending if max_pending is not None else self.workers * 8
+        self.kind = kind
+        self.pending = 0
+        self._executor = None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            rounds=int(os.environ.get('BCRYPT_ROUNDS', DEFAULT_ROUNDS)),
+            workers=int(os.environ.get('PASSWORD_POOL_WORKERS', 0)) or None,
+            max_pending=int(os.environ['PASSWORD_POOL_MAX_PENDING']) if 'PASSWORD_POOL_MAX_PENDING' in os.environ else None,
+            kind=os.environ.get('PASSWORD_POOL_KIND', 'thread'),
+        )
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self.kind == "process" else ThreadPoolExecutor
+            self._executor = pool(max_workers=self.workers)
+        return self._executor
+
+    async def _run(self, fn, *args):
+        # Only touched from the event loop thread, so a plain counter is safe
+        if self.pending >= self.max_pending:
+            raise PasswordPoolSaturated()
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hashpw, password, self.rounds)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(_checkpw, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return hash_rounds(hashed) != self.rounds
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def calibrate(target_ms: float, min_rounds=10, max_rounds=16, samples=3):
+    """Highest cost factor whose median hash time stays under target_ms.
+
+    Returns (rounds, {rounds: median_ms}) for every cost measured.
+    """
+    timings = {}
+    best = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        durations = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            _hashpw("calibration-password", rounds)
+            durations.append((time.perf_counter() - start) * 1000)
+        timings[rounds] = sorted(durations)[samples // 2]
+        if timings[rounds] > target_ms:
+            break
+        best = rounds
+    return best, timings
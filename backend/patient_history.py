@@ -0,0 +1,42 @@
+# Historique des rendez-vous d'un patient. Le résumé affiché dans la liste des
+# patients (nombre de rendez-vous, dernier et prochain) est calculé pour toute
+# la patientèle par une seule agrégation $lookup/$group, servie par l'index
+# appointments (practitioner_id, patient_id, date, time).
+
+HISTORY_FIELDS = ["date", "time"]
+
+
+def patient_summaries_pipeline(practitioner_id, now, fields, limit):
+    """Patients of a practitioner with appointments_count, last_appointment_at and next_appointment_at.
+
+    fields is the projection of the patient documents. Appointments are
+    compared on start_at (UTC) with now. Needs MongoDB 5.0 ($lookup with
+    both foreignField and pipeline).
+    """
+    return [
+        {"$match": {"practitioner_id": practitioner_id}},
+        {"$limit": limit},
+        {"$lookup": {
+            "from": "appointments",
+            "localField": "id",
+            "foreignField": "patient_id",
+            "pipeline": [
+                {"$match": {"practitioner_id": practitioner_id}},
+                {"$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    # $max / $min skip the nulls left by the other branch
+                    "last": {"$max": {"$cond": [{"$lt": ["$start_at", now]}, "$start_at", None]}},
+                    "next": {"$min": {"$cond": [{"$gte": ["$start_at", now]}, "$start_at", None]}},
+                }},
+            ],
+            "as": "history",
+        }},
+        {"$set": {"history": {"$arrayElemAt": ["$history", 0]}}},
+        {"$project": {
+            **fields,
+            "appointments_count": {"$ifNull": ["$history.count", 0]},
+            "last_appointment_at": "$history.last",
+            "next_appointment_at": "$history.next",
+        }},
+    ]
@@ -0,0 +1,127 @@
+# Import en masse de patients (CSV ou JSON) : validation ligne à ligne avec
+# PatientCreate, dédoublonnage par email en une seule requête $in, puis
+# insert_many non ordonné par lots.
+
+import csv
+import io
+import json
+import os
+import time
+
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
+
+from normalize import email_key
+from practitioner_stats import record_patients
+
+MAX_IMPORT_ROWS = int(os.environ.get('MAX_IMPORT_ROWS', 10000))
+IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', 1000))
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def parse_rows(body: bytes, content_type: str):
+    """Rows of an import payload: a CSV file with a header line, or a JSON list of objects"""
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ImportFormatError("File must be UTF-8 encoded")
+
+    if "csv" in (content_type or ""):
+        reader = csv.DictReader(io.StringIO(text))
+        # Empty cells are treated as missing so optional fields keep their default
+        return [{k.strip(): v for k, v in row.items() if k and v not in (None, "")} for row in reader]
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        raise ImportFormatError("Invalid JSON")
+    if isinstance(data, dict):
+        data = data.get("patients")
+    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        raise ImportFormatError("Expected a list of patient objects")
+    return data
+
+
+def _validation_messages(error: ValidationError):
+    return [f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in error.errors()]
+
+
+async def import_patients(db, practitioner_id, rows, create_model, patient_model):
+    """Validate, de-duplicate and insert rows; returns the per-row report.
+
+    Rows are numbered from 1 in the report. A row is skipped as a duplicate
+    when its email, compared case-insensitively on email_key, already
+    belongs to one of the practitioner's patients or appears earlier in the
+    file. Patients written before email_key existed (see the
+    patient-email-keys migration) are compared on their email.
+    """
+    started = time.perf_counter()
+    report = [None] * len(rows)
+
+    valid = []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, create_model.model_validate(row)))
+        except ValidationError as e:
+            report[index] = {"row": index + 1, "status": "invalid", "errors": _validation_messages(e)}
+
+    existing = set()
+    if valid:
+        keys = {email_key(p.email) for _, p in valid}
+        # null also matches the patients without an email_key yet
+        async for patient in db.patients.find(
+            {"practitioner_id": practitioner_id, "email_key": {"$in": [*keys, None]}},
+            {"_id": 0, "email_key": 1, "email": 1}
+        ):
+            existing.add(patient.get("email_key") or email_key(patient.get("email")))
+
+    seen = {}
+    pending = []
+    for index, patient in valid:
+        key = email_key(patient.email)
+        if key in existing:
+            report[index] = {"row": index + 1, "status": "duplicate", "detail": "Patient already exists"}
+        elif key in seen:
+            report[index] = {"row": index + 1, "status": "duplicate", "detail": f"Same email as row {seen[key] + 1}"}
+        else:
+            seen[key] = index
+            doc = patient_model(practitioner_id=practitioner_id, **patient.model_dump()).model_dump()
+            doc['created_at'] = doc['created_at'].isoformat()
+            doc['email_key'] = key
+            pending.append((index, doc))
+
+    created = 0
+    for start in range(0, len(pending), IMPORT_BATCH_SIZE):
+        batch = pending[start:start + IMPORT_BATCH_SIZE]
+        failed = {}
+        try:
+            await db.patients.insert_many([doc for _, doc in batch], ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"]: error.get("errmsg", "Insert failed") for error in e.details.get("writeErrors", [])}
+        for position, (index, doc) in enumerate(batch):
+            if position in failed:
+                report[index] = {"row": index + 1, "status": "error", "detail": failed[position]}
+            else:
+                report[index] = {"row": index + 1, "status": "created", "id": doc["id"]}
+                created += 1
+
+    if created:
+        await record_patients(db, practitioner_id, created)
+
+    elapsed = time.perf_counter() - started
+    counts = {"created": 0, "duplicate": 0, "invalid": 0, "error": 0}
+    for entry in report:
+        counts[entry["status"]] += 1
+    return {
+        "total": len(rows),
+        "created": counts["created"],
+        "duplicates": counts["duplicate"],
+        "invalid": counts["invalid"],
+        "errors": counts["error"],
+        "duration_ms": round(elapsed * 1000, 1),
+        "rows_per_second": round(len(rows) / elapsed) if elapsed > 0 else None,
+        "rows": report,
+    }
@@ -0,0 +1,194 @@
+# Statistiques du tableau de bord praticien (/api/stats), servies depuis un
+# document de cumul par praticien maintenu à chaque écriture
+
+import asyncio
+import os
+import re
+from datetime import datetime, timedelta, timezone
+
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Per-day counters are kept this many days back (the dashboard looks at the
+# current year at most); older days are folded into "months.<YYYY-MM>"
+STATS_DAYS_RETENTION = int(os.environ.get('STATS_DAYS_RETENTION', 400))
+
+# Recounts retried when deltas keep landing while rebuilding
+STATS_REBUILD_ATTEMPTS = int(os.environ.get('STATS_REBUILD_ATTEMPTS', 3))
+
+
+def stats_boundaries(today):
+    """YYYY-MM-DD bounds used by the dashboard counters"""
+    week_start = today - timedelta(days=today.weekday())
+    return {
+        "today": today.isoformat(),
+        "week_start": week_start.isoformat(),
+        "week_end": (week_start + timedelta(days=7)).isoformat(),
+        "month_start": today.replace(day=1).isoformat(),
+        "year_start": today.replace(month=1, day=1).isoformat(),
+    }
+
+
+def _day_key(date):
+    # Day counters are stored as "days.<YYYY-MM-DD>" paths; anything else
+    # (a stray "." or "$") would corrupt the document structure.
+    return DATE_RE.match(date or "") is not None
+
+
+def _days_cutoff(today):
+    """Days before this date are folded into monthly counters"""
+    return (today - timedelta(days=STATS_DAYS_RETENTION)).isoformat()
+
+
+def _counter_path(date, cutoff):
+    return f"days.{date}" if date >= cutoff else f"months.{date[:7]}"
+
+
+async def record_appointments(db, practitioner_id, dates, sign=1):
+    """Atomically add (sign=1) or remove (sign=-1) appointments from the rollup.
+
+    Upserted so no delta is lost while the rollup is missing; such a
+    document has no rebuilt_at and is rebuilt on the next read.
+    """
+    if not dates:
+        return
+    cutoff = _days_cutoff(datetime.now(timezone.utc).date())
+    inc = {"total_appointments": sign * len(dates), "version": 1}
+    for date in dates:
+        if _day_key(date):
+            path = _counter_path(date, cutoff)
+            inc[path] = inc.get(path, 0) + sign
+    await db.practitioner_stats.update_one({"practitioner_id": practitioner_id}, {"$inc": inc}, upsert=True)
+
+
+async def record_patients(db, practitioner_id, count):
+    await db.practitioner_stats.update_one(
+        {"practitioner_id": practitioner_id},
+        {"$inc": {"total_patients": count, "version": 1}},
+        upsert=True
+    )
+
+
+async def _recount(db, practitioner_id, today):
+    days, total_patients = await asyncio.gather(
+        db.appointments.aggregate([
+            {"$match": {"practitioner_id": practitioner_id}},
+            {"$group": {"_id": "$date", "count": {"$sum": 1}}},
+        ]).to_list(None),
+        db.patients.count_documents({"practitioner_id": practitioner_id}),
+    )
+    cutoff = _days_cutoff(today)
+    counters = {"days": {}, "months": {}}
+    for d in days:
+        if isinstance(d["_id"], str) and _day_key(d["_id"]):
+            group, key = _counter_path(d["_id"], cutoff).split(".")
+            counters[group][key] = counters[group].get(key, 0) + d["count"]
+    return {
+        "total_appointments": sum(d["count"] for d in days),
+        "total_patients": total_patients,
+        **counters,
+        "rebuilt_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+async def rebuild_statistics(db, practitioner_id, today=None):
+    """Recompute a practitioner's rollup from scratch and store it.
+
+    The recount only replaces the version it was computed against: a
+    delta recorded meanwhile bumps the version and the recount is retried.
+    A write whose delta is still in flight when the recount is stored can
+    be counted twice; `manage.py rebuild-stats` repairs that offline.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    for _ in range(STATS_REBUILD_ATTEMPTS):
+        current = await db.practitioner_stats.find_one(
+            {"practitioner_id": practitioner_id}, {"_id": 0, "version": 1}
+        )
+        doc = await _recount(db, practitioner_id, today)
+        if current is None:
+            result = await db.practitioner_stats.update_one(
+                {"practitioner_id": practitioner_id},
+                {"$setOnInsert": {**doc, "version": 0}},
+                upsert=True
+            )
+            stored = result.upserted_id is not None
+        else:
+            result = await db.practitioner_stats.update_one(
+                {"practitioner_id": practitioner_id, "version": current.get("version")},
+                {"$set": doc}
+            )
+            stored = result.matched_count == 1
+        if stored:
+            break
+    # Still contended: serve the recount, the next read rebuilds again
+    return {"practitioner_id": practitioner_id, **doc}
+
+
+async def rebuild_all_statistics(db):
+    """Rebuild every practitioner's rollup; returns the number rebuilt"""
+    count = 0
+    async for practitioner in db.practitioners.find({}, {"_id": 0, "id": 1}):
+        await rebuild_statistics(db, practitioner["id"])
+        count += 1
+    return count
+
+
+async def compact_statistics(db, rollup, today):
+    """Fold day counters older than the retention into monthly counters.
+
+    Skipped when a delta lands in between (version mismatch); the next
+    read compacts instead.
+    """
+    cutoff = _days_cutoff(today)
+    stale = {d: c for d, c in rollup.get("days", {}).items() if d < cutoff or c == 0}
+    if not stale:
+        return
+    inc = {}
+    for d, c in stale.items():
+        if d < cutoff and c:
+            inc[f"months.{d[:7]}"] = inc.get(f"months.{d[:7]}", 0) + c
+    update = {"$unset": {f"days.{d}": "" for d in stale}}
+    if inc:
+        update["$inc"] = inc
+    await db.practitioner_stats.update_one(
+        {"practitioner_id": rollup["practitioner_id"], "version": rollup.get("version")},
+        update
+    )
+
+
+def summarize_statistics(rollup, recent, today):
+    bounds = stats_boundaries(today)
+    days = sorted((d, c) for d, c in rollup.get("days", {}).items() if c > 0)
+
+    def count_between(start, end=None):
+        return sum(c for d, c in days if d >= start and (end is None or d < end))
+
+    return {
+        "total_appointments": rollup.get("total_appointments", 0),
+        "total_patients": rollup.get("total_patients", 0),
+        "upcoming_appointments": count_between(bounds["today"]),
+        "appointments_this_week": count_between(bounds["week_start"], bounds["week_end"]),
+        "appointments_this_month": count_between(bounds["month_start"]),
+        "appointments_this_year": count_between(bounds["year_start"]),
+        "recent_appointments": recent,
+        "appointments_by_day": [{"date": d, "count": c} for d, c in days[-30:]],
+    }
+
+
+async def load_statistics(db, practitioner_id, today=None):
+    """Dashboard statistics served from the practitioner_stats rollup"""
+    today = today or datetime.now(timezone.utc).date()
+
+    rollup, recent = await asyncio.gather(
+        db.practitioner_stats.find_one({"practitioner_id": practitioner_id}, {"_id": 0, "months": 0}),
+        db.appointments.find(
+            {"practitioner_id": practitioner_id},
+            {"_id": 0, "id": 1, "patient_name": 1, "date": 1, "time": 1}
+        ).sort("created_at", 1).limit(5).to_list(5),
+    )
+    # Missing, or created by a delta before any rebuild
+    if rollup is None or "rebuilt_at" not in rollup:
+        rollup = await rebuild_statistics(db, practitioner_id, today)
+    else:
+        await compact_statistics(db, rollup, today)
+
+    return summarize_statistics(rollup, recent, today)
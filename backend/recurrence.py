@@ -0,0 +1,66 @@
+# Séries de rendez-vous récurrents : expansion des occurrences côté serveur
+# (les chevauchements sont vérifiés par booking.py).
+
+import calendar
+import os
+from datetime import date, timedelta
+
+FREQUENCIES = ("weekly", "biweekly", "monthly")
+MAX_SERIES_OCCURRENCES = int(os.environ.get('MAX_SERIES_OCCURRENCES', 104))
+
+
+class InvalidSeries(ValueError):
+    pass
+
+
+def parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise InvalidSeries(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def _add_months(day, months):
+    # Same day of month, clamped to the month's last day (Jan 31 -> Feb 28)
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return day.replace(year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def expand_series(start, frequency, count=None, until=None, skip_dates=()):
+    """YYYY-MM-DD dates of a series starting on start.
+
+    The series stops after count occurrences or on until (inclusive),
+    whichever comes first. As with iCalendar's COUNT and EXDATE, skipped
+    dates still count towards count.
+    """
+    if frequency not in FREQUENCIES:
+        raise InvalidSeries(f"frequency must be one of {', '.join(FREQUENCIES)}")
+    if count is None and until is None:
+        raise InvalidSeries("Either count or until is required")
+    if count is not None and not 1 <= count <= MAX_SERIES_OCCURRENCES:
+        raise InvalidSeries(f"count must be between 1 and {MAX_SERIES_OCCURRENCES}")
+
+    first = parse_date(start)
+    last = parse_date(until) if until else None
+    if last is not None and last < first:
+        raise InvalidSeries("until is before the first occurrence")
+    skipped = {parse_date(d) for d in skip_dates}
+    step = timedelta(weeks=2 if frequency == "biweekly" else 1)
+
+    dates = []
+    n = 0
+    while count is None or n < count:
+        day = _add_months(first, n) if frequency == "monthly" else first + n * step
+        if last is not None and day > last:
+            break
+        n += 1
+        if n > MAX_SERIES_OCCURRENCES:
+            raise InvalidSeries(f"A series has at most {MAX_SERIES_OCCURRENCES} occurrences")
+        if day not in skipped:
+            dates.append(day.isoformat())
+
+    if not dates:
+        raise InvalidSeries("Every occurrence of the series is skipped")
+    return dates
+
@@ -0,0 +1,65 @@
+# Avis des clients sur les praticiens. La note moyenne, le nombre d'avis et
+# un score bayésien (utilisé pour trier la recherche publique) sont tenus à
+# jour dans le document du praticien par une mise à jour atomique (pipeline),
+# au moment de l'écriture : la lecture n'agrège jamais les avis.
+
+import os
+
+from pymongo import ReturnDocument
+
+REVIEW_MAX_LENGTH = int(os.environ.get('REVIEW_MAX_LENGTH', 2000))
+
+# Bayesian average: every practitioner starts with REVIEW_PRIOR_WEIGHT
+# virtual reviews of REVIEW_PRIOR_MEAN, so a single 5/5 does not outrank
+# forty reviews averaging 4.8
+REVIEW_PRIOR_MEAN = float(os.environ.get('REVIEW_PRIOR_MEAN', 3.5))
+REVIEW_PRIOR_WEIGHT = float(os.environ.get('REVIEW_PRIOR_WEIGHT', 5))
+
+
+def rating_score(rating_sum, reviews_count):
+    return (REVIEW_PRIOR_WEIGHT * REVIEW_PRIOR_MEAN + rating_sum) / (REVIEW_PRIOR_WEIGHT + reviews_count)
+
+
+def rating_fields(rating_sum, reviews_count):
+    """rating_sum, reviews_count, rating and rating_score of a practitioner"""
+    return {
+        "rating_sum": rating_sum,
+        "reviews_count": reviews_count,
+        "rating": round(rating_sum / reviews_count, 2) if reviews_count else 0.0,
+        "rating_score": rating_score(rating_sum, reviews_count),
+    }
+
+
+def _rating_pipeline(score, updated_at):
+    # Documents written before rating_sum existed derive it from rating * reviews_count
+    current_sum = {"$ifNull": ["$rating_sum", {"$multiply": [
+        {"$ifNull": ["$rating", 0]}, {"$ifNull": ["$reviews_count", 0]}
+    ]}]}
+    return [
+        {"$set": {
+            "rating_sum": {"$add": [current_sum, score]},
+            "reviews_count": {"$add": [{"$ifNull": ["$reviews_count", 0]}, 1]},
+            "updated_at": updated_at,
+        }},
+        {"$set": {
+            "rating": {"$round": [{"$divide": ["$rating_sum", "$reviews_count"]}, 2]},
+            "rating_score": {"$divide": [
+                {"$add": [REVIEW_PRIOR_WEIGHT * REVIEW_PRIOR_MEAN, "$rating_sum"]},
+                {"$add": [REVIEW_PRIOR_WEIGHT, "$reviews_count"]},
+            ]},
+        }},
+    ]
+
+
+async def record_review(db, practitioner_id, score, updated_at):
+    """Fold one score into the practitioner's aggregates; returns the updated document.
+
+    One findAndModify: concurrent reviews cannot lose an increment. None
+    when the practitioner does not exist.
+    """
+    return await db.practitioners.find_one_and_update(
+        {"id": practitioner_id},
+        _rating_pipeline(score, updated_at),
+        projection={"_id": 0, "password": 0},
+        return_document=ReturnDocument.AFTER,
+    )
@@ -0,0 +1,60 @@
+# Compteur d'allers-retours MongoDB par requête HTTP, renvoyé dans l'en-tête
+# X-Mongo-Round-Trips (COUNT_MONGO_ROUND_TRIPS=1) : les tests vérifient ainsi
+# le nombre de commandes envoyées par chaque route.
+
+from contextvars import ContextVar
+
+from pymongo import monitoring
+
+ROUND_TRIPS_HEADER = "X-Mongo-Round-Trips"
+
+# Names of the commands sent while handling the current request
+_commands: ContextVar = ContextVar("mongo_commands", default=None)
+
+
+class RoundTripListener(monitoring.CommandListener):
+    """Records every command sent to MongoDB in the current request's list.
+
+    Motor runs pymongo calls on an executor with a copy of the caller's
+    context, so the request's list is visible here.
+    """
+
+    def started(self, event):
+        commands = _commands.get()
+        if commands is not None:
+            commands.append(event.command_name)  # list.append is thread-safe
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+class RoundTripCounterMiddleware:
+    """ASGI middleware adding the request's command count as a response header.
+
+    Streaming responses only count the commands sent before their first byte.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        commands = []
+        token = _commands.set(commands)
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((ROUND_TRIPS_HEADER.lower().encode("latin-1"), str(len(commands)).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _commands.reset(token)
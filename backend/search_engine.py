@@ -0,0 +1,342 @@
+# Index inversé en mémoire pour la recherche publique de praticiens
+
+import bisect
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from normalize import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Field weights used to rank free-text (q) matches
+SEARCH_FIELDS = {
+    "full_name": 3.0,
+    "specialty": 3.0,
+    "category": 2.0,
+    "city": 2.0,
+    "description": 1.0,
+}
+
+PUBLIC_FIELDS = (
+    "id", "full_name", "specialty", "description", "phone", "schedule",
+    "address", "city", "photo_url", "rating", "reviews_count", "category",
+)
+
+# Kept alongside the public fields for sorting and the availability filter
+DOC_FIELDS = PUBLIC_FIELDS + ("rating_score", "availability", "timezone")
+
+# sort_by -> (field, direction) of the public search, tiebroken on id
+SORTS = {
+    "rating": ("rating_score", -1),  # Bayesian average, see reviews.py
+    "reviews": ("reviews_count", -1),
+    "name": ("full_name", 1),
+}
+
+# A prefix match ranks below an exact token match
+PREFIX_MATCH_FACTOR = 0.5
+
+# Each refresh re-reads this much before the previous one started: updated_at
+# is stamped by the writing worker before its write commits, and the workers'
+# clocks may drift apart. Re-indexing a document twice is harmless.
+REFRESH_OVERLAP = timedelta(seconds=float(os.environ.get('SEARCH_INDEX_REFRESH_OVERLAP_SECONDS', 60)))
+
+# Candidate sets up to this size are sorted directly (under half a
+# millisecond); larger ones are read off the presorted order, finding a
+# match at least every len(directory) / DIRECT_SORT_MAX entries
+DIRECT_SORT_MAX = 500
+
+# Filter and free-text matches kept between pages; the index drops them
+# whenever a document changes
+MATCH_CACHE_SIZE = 512
+
+
+def _sort_value(value, sort_by):
+    if SORTS[sort_by][1] < 0:
+        return -(value or 0)
+    return value or ""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def valid_position(position, sort_by):
+    """Whether a decoded search cursor position fits sort_by.
+
+    v is the sort field's value (a number, or a string for name; null when
+    the field is unset), id a practitioner id and r, when present, a score.
+    """
+    value = position.get("v")
+    if value is not None and not (isinstance(value, str) if SORTS[sort_by][1] > 0 else _is_number(value)):
+        return False
+    if not isinstance(position.get("id"), str):
+        return False
+    return "r" not in position or _is_number(position["r"])
+
+
+def _sort_key(doc, sort_by):
+    return (_sort_value(doc.get(SORTS[sort_by][0]), sort_by), doc["id"])
+
+
+class PractitionerSearchIndex:
+    """Accent-folded, tokenized inverted index over the practitioner directory.
+
+    Every query term is matched as a token prefix, so "therap" finds
+    "Thérapeute de couple". Results are ordered like the MongoDB path
+    (sort field, then id) and can be resumed from a keyset position.
+    Every sort order is kept presorted, so a page is read off it instead
+    of sorting all the matches.
+    """
+
+    def __init__(self):
+        self.docs = {}
+        self.ready = False
+        self.synced_at = None
+        self._doc_tokens = {}
+        self._postings = {field: defaultdict(set) for field in SEARCH_FIELDS}
+        self._vocabulary = {field: [] for field in SEARCH_FIELDS}
+        self._by_category = defaultdict(set)
+        # sort_by -> sorted [(sort value, id)] of every document
+        self._order = {sort_by: [] for sort_by in SORTS}
+        # (field, terms) -> matching ids, ("q", terms) -> {score: ids}
+        self._matches = {}
+        # While bulk loading, vocabularies and orders are sorted once at the end
+        self._bulk_loading = False
+
+    def __len__(self):
+        return len(self.docs)
+
+    def upsert(self, doc):
+        """Index (or re-index) one practitioner document"""
+        practitioner_id = doc["id"]
+        self.remove(practitioner_id)
+        self._matches.clear()
+        stored = self.docs[practitioner_id] = {field: doc.get(field) for field in DOC_FIELDS if field in doc}
+        for sort_by, order in self._order.items():
+            if self._bulk_loading:
+                order.append(_sort_key(stored, sort_by))
+            else:
+                bisect.insort(order, _sort_key(stored, sort_by))
+
+        tokens = {}
+        for field in SEARCH_FIELDS:
+            tokens[field] = set(tokenize(doc.get(field)))
+            for token in tokens[field]:
+                postings = self._postings[field][token]
+                if not postings:
+                    if self._bulk_loading:
+                        self._vocabulary[field].append(token)
+                    else:
+                        bisect.insort(self._vocabulary[field], token)
+                postings.add(practitioner_id)
+        self._doc_tokens[practitioner_id] = tokens
+        self._by_category[doc.get("category") or ""].add(practitioner_id)
+
+    def _finish_bulk_load(self):
+        for vocabulary in self._vocabulary.values():
+            vocabulary.sort()
+        for order in self._order.values():
+            order.sort()
+        self._bulk_loading = False
+
+    def remove(self, practitioner_id):
+        doc = self.docs.pop(practitioner_id, None)
+        if doc is None:
+            return
+        self._matches.clear()
+        for sort_by, order in self._order.items():
+            del order[bisect.bisect_left(order, _sort_key(doc, sort_by))]
+        for field, tokens in self._doc_tokens.pop(practitioner_id).items():
+            for token in tokens:
+                postings = self._postings[field][token]
+                postings.discard(practitioner_id)
+                if not postings:
+                    del self._postings[field][token]
+                    vocabulary = self._vocabulary[field]
+                    del vocabulary[bisect.bisect_left(vocabulary, token)]
+        self._by_category[doc.get("category") or ""].discard(practitioner_id)
+
+    def _expand(self, field, term):
+        """Vocabulary tokens of field starting with term"""
+        vocabulary = self._vocabulary[field]
+        start = bisect.bisect_left(vocabulary, term)
+        end = bisect.bisect_left(vocabulary, term + "\uffff", start)
+        return vocabulary[start:end]
+
+    def _cached(self, key, compute):
+        if key not in self._matches:
+            if len(self._matches) >= MATCH_CACHE_SIZE:
+                del self._matches[next(iter(self._matches))]
+            self._matches[key] = compute()
+        return self._matches[key]
+
+    def _match_all(self, field, text):
+        """Ids whose field contains a token prefixed by every term of text (not to be mutated)"""
+        terms = tuple(tokenize(text))
+        return self._cached((field, terms), lambda: self._match_terms(field, terms))
+
+    def _match_terms(self, field, terms):
+        result = None
+        for term in terms:
+            postings = [self._postings[field][token] for token in self._expand(field, term)]
+            # A single token's postings are used as they are, without a copy
+            ids = postings[0] if len(postings) == 1 else set().union(*postings)
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result if result is not None else set(self.docs)
+
+    def _score(self, q_terms):
+        """Free-text matches as {score: ids}: every term must match at least one field.
+
+        A term scores its best gain per document; scores only take a handful
+        of values, so whole sets are combined instead of single ids. The most
+        selective term goes first and narrows the postings of the others.
+        """
+        expanded = []
+        for term in q_terms:
+            matches = [
+                (weight if token == term else weight * PREFIX_MATCH_FACTOR, self._postings[field][token])
+                for field, weight in SEARCH_FIELDS.items()
+                for token in self._expand(field, term)
+            ]
+            expanded.append((sum(len(ids) for _, ids in matches), matches))
+        expanded.sort(key=lambda item: item[0])
+
+        tiers = None
+        for _, matches in expanded:
+            alive = None if tiers is None else set().union(*tiers.values())
+            by_gain = defaultdict(set)
+            for gain, ids in matches:
+                by_gain[gain] |= ids if alive is None else ids & alive
+            term_tiers, seen = {}, set()
+            for gain in sorted(by_gain, reverse=True):
+                ids = by_gain[gain] - seen
+                if ids:
+                    term_tiers[gain] = ids
+                    seen |= ids
+            if tiers is None:
+                tiers = term_tiers
+            else:
+                combined = defaultdict(set)
+                for score, ids in tiers.items():
+                    for gain, term_ids in term_tiers.items():
+                        common = ids & term_ids
+                        if common:
+                            combined[score + gain] |= common
+                tiers = combined
+            if not tiers:
+                return {}
+        return tiers or {}
+
+    def _ordered(self, ids, sort_by, after_key=None, snapshot=False):
+        """ids (None for every document) in sort order, strictly after after_key.
+
+        The presorted order is walked in place, so the index must not change
+        while iterating; snapshot walks a copy instead, for callers that
+        resume iterating across awaits.
+        """
+        order = self._order[sort_by]
+        if ids is not None and len(ids) <= DIRECT_SORT_MAX:
+            order = sorted(_sort_key(self.docs[i], sort_by) for i in ids)
+            ids = None
+        start = 0 if after_key is None else bisect.bisect_right(order, after_key)
+        if snapshot:
+            order, start = order[start:], 0
+        for i in range(start, len(order)):
+            practitioner_id = order[i][1]
+            if ids is None or practitioner_id in ids:
+                yield practitioner_id
+
+    def _ranked(self, specialty, city, category, q, sort_by, after, snapshot=False):
+        """(matching ids in result order, id -> position) for a query"""
+        candidates = None
+        for field, text in (("specialty", specialty), ("city", city)):
+            if text:
+                ids = self._match_all(field, text)
+                candidates = ids if candidates is None else candidates & ids
+        if category:
+            ids = self._by_category.get(category, set())
+            candidates = ids if candidates is None else candidates & ids
+
+        field = SORTS[sort_by][0]
+        after_key = None
+        if after is not None:
+            after_key = (_sort_value(after["v"], sort_by), after["id"])
+
+        q_terms = tokenize(q)
+        if not q_terms:
+            scores = None
+            ranked = self._ordered(candidates, sort_by, after_key, snapshot)
+        else:
+            # Best score first, then the sort order within each score
+            scores = self._cached(("q", tuple(q_terms)), lambda: self._score(q_terms))
+            tiers = sorted(scores.items(), reverse=True)
+            if after is not None:
+                tiers = [(r, ids) for r, ids in tiers if r <= after.get("r", 0.0)]
+
+            def tiered():
+                for r, ids in tiers:
+                    if candidates is not None:
+                        ids = ids & candidates
+                    resume = after_key if after is not None and r == after.get("r", 0.0) else None
+                    yield from self._ordered(ids, sort_by, resume, snapshot)
+            ranked = tiered()
+
+        def position_of(practitioner_id):
+            position = {"v": self.docs[practitioner_id].get(field), "id": practitioner_id}
+            if scores is not None:
+                position["r"] = next(r for r, ids in scores.items() if practitioner_id in ids)
+            return position
+
+        return ranked, position_of
+
+    def search(self, specialty=None, city=None, category=None, q=None,
+               sort_by="rating", limit=100, after=None):
+        """Return (documents, next_position) for one page of results.
+
+        Positions are the {"v", "id"[, "r"]} dicts carried by search cursors:
+        the sort value, id and relevance score of the last result returned.
+        next_position is None on the last page.
+        """
+        ranked, position_of = self._ranked(specialty, city, category, q, sort_by, after)
+        page = list(islice(ranked, limit + 1))
+
+        next_position = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_position = position_of(page[-1])
+        return [self.docs[i] for i in page], next_position
+
+    def iter_search(self, specialty=None, city=None, category=None, q=None, sort_by="rating", after=None):
+        """Yield (document, position) for every result in order, for callers filtering further"""
+        ranked, position_of = self._ranked(specialty, city, category, q, sort_by, after, snapshot=True)
+        for practitioner_id in ranked:
+            yield self.docs[practitioner_id], position_of(practitioner_id)
+
+    async def load(self, db):
+        """(Re)build the whole index from the practitioners collection"""
+        fresh = PractitionerSearchIndex()
+        fresh._bulk_loading = True
+        projection = {"_id": 0, **{field: 1 for field in DOC_FIELDS}}
+        started_at = datetime.now(timezone.utc) - REFRESH_OVERLAP
+        async for doc in db.practitioners.find({}, projection):
+            fresh.upsert(doc)
+        fresh._finish_bulk_load()
+        self.__dict__.update(fresh.__dict__)
+        self.synced_at = started_at.isoformat()
+        self.ready = True
+        logger.info("Search index loaded with %d practitioners", len(self.docs))
+
+    async def refresh(self, db):
+        """Pick up practitioners written by other workers since the last sync"""
+        if not self.ready:
+            return await self.load(db)
+        projection = {"_id": 0, **{field: 1 for field in DOC_FIELDS}}
+        started_at = datetime.now(timezone.utc) - REFRESH_OVERLAP
+        async for doc in db.practitioners.find({"updated_at": {"$gte": self.synced_at}}, projection):
+            self.upsert(doc)
+        self.synced_at = started_at.isoformat()
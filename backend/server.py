@@ -1,26 +1,61 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 import os
+import re
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from typing import Dict, List, Optional
 import uuid
-from datetime import datetime, timezone, timedelta
-import bcrypt
+import time
+import asyncio
+from datetime import date, datetime, timezone, timedelta
 import jwt
-from categories import CATEGORIES, get_all_categories, get_category_by_slug, get_all_specialties
-from specialties_descriptions import SPECIALTIES_DESCRIPTIONS, get_specialty_description, get_specialties_by_category
+from catalog_responses import (
+    CATEGORIES_RESPONSE, CATEGORY_RESPONSES, CATEGORY_SPECIALTIES_RESPONSES, SPECIALTIES_RESPONSE,
+    SPECIALTY_RESPONSES, cached_response
+)
+from specialty_suggest import MAX_SUGGESTIONS, suggest_specialties
+from indexes import ensure_indexes, missing_unique_indexes
+from passwords import PasswordHasher, PasswordPoolSaturated
+from cache import TTLCache
+from pagination import InvalidCursor, compound_keyset_filter, decode_cursor, encode_cursor, keyset_filter
+from geo import practitioner_location
+from normalize import email_key, practitioner_search_keys, search_key, specialty_slug
+from search_engine import SORTS as SEARCH_SORTS, PractitionerSearchIndex, valid_position
+from practitioner_stats import load_statistics, record_appointments, record_patients
+from fast_json import fast_list_response, projection
+from export import EXPORT_BATCH_SIZE, date_range_filter, export_response
+from patient_import import MAX_IMPORT_ROWS, ImportFormatError, import_patients, parse_rows
+from recurrence import InvalidSeries, expand_series
+from booking import (
+    CONFLICT_FIELDS, DEFAULT_TIMEZONE, MAX_APPOINTMENT_MINUTES, BookingBusy, InvalidSlot, appointment_interval, booking_lock, find_conflicts,
+    local_date_time, practitioner_timezone, relocalize_appointments, valid_timezone
+)
+from availability import (
+    AVAILABILITY_BATCH_SIZE, MAX_SLOT_DAYS, SOURCE_MANUAL, SOURCE_SCHEDULE, InvalidAvailability, epoch_minutes,
+    fetch_busy, follows_schedule, free_slots, parse_schedule, practitioner_availability, select_available,
+    slot_payload, validate_template, window_bounds
+)
+from patient_history import HISTORY_FIELDS, patient_summaries_pipeline
+from reviews import REVIEW_MAX_LENGTH, rating_fields, record_review
+from round_trips import ROUND_TRIPS_HEADER, RoundTripCounterMiddleware, RoundTripListener
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# Commands per request, reported in X-Mongo-Round-Trips (round_trips.py)
+COUNT_MONGO_ROUND_TRIPS = os.environ.get('COUNT_MONGO_ROUND_TRIPS', '0') == '1'
+client = AsyncIOMotorClient(
+    mongo_url, tz_aware=True, event_listeners=[RoundTripListener()] if COUNT_MONGO_ROUND_TRIPS else []
+)
 db = client[os.environ['DB_NAME']]
 
 # JWT Config
@@ -28,6 +63,22 @@ SECRET_KEY = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production'
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# Password hashing pool (BCRYPT_ROUNDS, PASSWORD_POOL_* env vars)
+password_hasher = PasswordHasher.from_env()
+
+# Identity caches used by get_current_user (per worker process)
+IDENTITY_CACHE_SIZE = int(os.environ.get('IDENTITY_CACHE_SIZE', 10000))
+practitioner_cache = TTLCache(maxsize=IDENTITY_CACHE_SIZE, ttl=float(os.environ.get('IDENTITY_CACHE_TTL', 60)))
+token_cache = TTLCache(maxsize=IDENTITY_CACHE_SIZE, ttl=3600)
+
+# Registration relies on the unique email indexes once startup has confirmed
+# them; until then (or if they are missing) it looks the email up first
+unique_emails_enforced = False
+
+# In-memory practitioner search index, refreshed from MongoDB periodically
+search_index = PractitionerSearchIndex()
+SEARCH_INDEX_REFRESH_SECONDS = float(os.environ.get('SEARCH_INDEX_REFRESH_SECONDS', 30))
+
 # Create the main app
 app = FastAPI()
 api_router = APIRouter(prefix="/api")
@@ -45,6 +96,11 @@ class PractitionerLogin(BaseModel):
     email: EmailStr
     password: str
 
+class Availability(BaseModel):
+    weekly: List[List[List[str]]]  # 7 weekdays, Monday first, of ["HH:MM", "HH:MM"] opening ranges
+    breaks: List[List[str]] = []  # closed every day
+    exceptions: Dict[str, List[List[str]]] = {}  # YYYY-MM-DD -> that day's ranges, [] = closed
+
 class Practitioner(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -60,6 +116,9 @@ class Practitioner(BaseModel):
     rating: Optional[float] = 0.0
     reviews_count: Optional[int] = 0
     category: Optional[str] = ""
+    timezone: Optional[str] = DEFAULT_TIMEZONE  # IANA name, used to place appointments in UTC
+    availability: Optional[Availability] = None  # structured schedule, see availability.py
+    availability_source: Optional[str] = SOURCE_SCHEDULE  # schedule (derived) or manual
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class PractitionerPublic(BaseModel):
@@ -76,6 +135,9 @@ class PractitionerPublic(BaseModel):
     reviews_count: Optional[int] = 0
     category: Optional[str] = ""
 
+class PractitionerNearby(PractitionerPublic):
+    distance_km: float
+
 class PractitionerUpdate(BaseModel):
     full_name: Optional[str] = None
     specialty: Optional[str] = None
@@ -85,6 +147,10 @@ class PractitionerUpdate(BaseModel):
     address: Optional[str] = None
     city: Optional[str] = None
     photo_url: Optional[str] = None
+    timezone: Optional[str] = None
+    availability: Optional[Availability] = None
+    # "schedule" drops a manual template and derives it from the schedule again
+    availability_source: Optional[str] = Field(None, pattern="^(schedule|manual)$")
 
 class Client(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -123,6 +189,11 @@ class Patient(BaseModel):
     notes: Optional[str] = ""
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class PatientSummary(Patient):
+    appointments_count: int = 0
+    last_appointment_at: Optional[datetime] = None  # UTC
+    next_appointment_at: Optional[datetime] = None  # UTC
+
 class PatientCreate(BaseModel):
     full_name: str
     email: EmailStr
@@ -141,19 +212,64 @@ class Appointment(BaseModel):
     practitioner_id: str
     patient_id: str
     patient_name: str
-    date: str  # YYYY-MM-DD
-    time: str  # HH:MM
+    date: str  # YYYY-MM-DD, local to the practitioner (derived from start_at)
+    time: str  # HH:MM, local to the practitioner (derived from start_at)
     duration: int = 60  # minutes
     notes: Optional[str] = ""
+    series_id: Optional[str] = None
+    start_at: Optional[datetime] = None  # UTC
+    end_at: Optional[datetime] = None  # UTC
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class AppointmentCreate(BaseModel):
     patient_id: str
     patient_name: str
-    date: str
+    # Either a local date and time, or start_at
+    date: Optional[str] = None
+    time: Optional[str] = None
+    start_at: Optional[datetime] = None
+    duration: Optional[int] = 60
+    notes: Optional[str] = ""
+
+class AppointmentSeriesCreate(BaseModel):
+    patient_id: str
+    patient_name: str
+    date: str  # first occurrence
     time: str
     duration: Optional[int] = 60
     notes: Optional[str] = ""
+    frequency: str  # weekly, biweekly, monthly
+    count: Optional[int] = None
+    until: Optional[str] = None  # YYYY-MM-DD, inclusive
+    skip_dates: List[str] = []
+
+class AppointmentSeriesUpdate(BaseModel):
+    patient_name: Optional[str] = None
+    time: Optional[str] = None
+    duration: Optional[int] = None
+    notes: Optional[str] = None
+
+class Review(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    practitioner_id: str
+    client_id: str
+    client_name: str
+    score: int  # 1 to 5
+    text: Optional[str] = ""
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ReviewCreate(BaseModel):
+    score: int = Field(..., ge=1, le=5)
+    text: Optional[str] = Field("", max_length=REVIEW_MAX_LENGTH)
+
+class ReviewPublic(BaseModel):
+    id: str
+    practitioner_id: str
+    client_name: str
+    score: int
+    text: Optional[str] = ""
+    created_at: datetime
 
 class TokenResponse(BaseModel):
     token: str
@@ -187,40 +303,71 @@ class StatsResponse(BaseModel):
     appointments_by_day: List[dict]
 
 # Helper functions
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+def password_pool_busy() -> HTTPException:
+    return HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+
+async def hash_password(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except PasswordPoolSaturated:
+        raise password_pool_busy()
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+async def verify_password(password: str, hashed: str) -> bool:
+    try:
+        return await password_hasher.verify(password, hashed)
+    except PasswordPoolSaturated:
+        raise password_pool_busy()
 
 def create_token(practitioner_id: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {"sub": practitioner_id, "exp": expire}
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    try:
-        token = credentials.credentials
+def decode_token(token: str) -> str:
+    """Return the token subject, caching it until the token expires"""
+    subject = token_cache.get(token)
+    if subject is None:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        practitioner_id = payload.get("sub")
-        if not practitioner_id:
+        subject = payload.get("sub")
+        if not subject:
             raise HTTPException(status_code=401, detail="Invalid token")
+        remaining = payload["exp"] - time.time()
+        token_cache.set(token, subject, expires_at=time.monotonic() + remaining)
+    return subject
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    try:
+        practitioner_id = decode_token(credentials.credentials)
         
-        practitioner = await db.practitioners.find_one({"id": practitioner_id}, {"_id": 0})
-        if not practitioner:
-            raise HTTPException(status_code=401, detail="User not found")
-        return practitioner
+        practitioner = practitioner_cache.get(practitioner_id)
+        if practitioner is None:
+            practitioner = await db.practitioners.find_one({"id": practitioner_id}, {"_id": 0, "password": 0})
+            if not practitioner:
+                raise HTTPException(status_code=401, detail="User not found")
+            practitioner_cache.set(practitioner_id, practitioner)
+        return dict(practitioner)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except Exception as e:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+async def get_current_client(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    try:
+        client_id = decode_token(credentials.credentials)
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expired")
+    except Exception:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    
+    client = await db.clients.find_one({"id": client_id}, {"_id": 0, "password": 0})
+    if not client:
+        raise HTTPException(status_code=401, detail="User not found")
+    return client
+
 # Auth routes
 @api_router.post("/auth/register", response_model=TokenResponse)
 async def register(input: PractitionerRegister):
-    # Check if email exists
-    existing = await db.practitioners.find_one({"email": input.email})
-    if existing:
+    if not unique_emails_enforced and await db.practitioners.find_one({"email": input.email}, {"_id": 1}):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create practitioner
@@ -232,10 +379,21 @@ async def register(input: PractitionerRegister):
     )
     
     doc = practitioner.model_dump()
-    doc['password'] = hash_password(input.password)
+    doc['password'] = await hash_password(input.password)
     doc['created_at'] = doc['created_at'].isoformat()
+    doc['updated_at'] = doc['created_at']
+    doc['availability'] = parse_schedule(doc['schedule'])
+    doc['availability_source'] = SOURCE_SCHEDULE
+    doc.update(rating_fields(0, 0))
+    doc.update(practitioner_search_keys(doc))
+    doc.update(practitioner_location(doc))
     
-    await db.practitioners.insert_one(doc)
+    # The unique email index rejects duplicates, no lookup needed first
+    try:
+        await db.practitioners.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    search_index.upsert(doc)
     
     token = create_token(practitioner.id)
     return TokenResponse(
@@ -245,13 +403,11 @@ async def register(input: PractitionerRegister):
 
 @api_router.post("/auth/register/client", response_model=ClientTokenResponse)
 async def register_client(input: ClientRegister):
-    # Check if email exists in clients collection
-    existing = await db.clients.find_one({"email": input.email})
-    if existing:
+    if not unique_emails_enforced and await db.clients.find_one({"email": input.email}, {"_id": 1}):
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    # Also check in practitioners collection to avoid duplicates
-    existing_practitioner = await db.practitioners.find_one({"email": input.email})
+    # Practitioner emails are not covered by the clients' unique index
+    existing_practitioner = await db.practitioners.find_one({"email": input.email}, {"_id": 1})
     if existing_practitioner:
         raise HTTPException(status_code=400, detail="Email already registered")
     
@@ -264,10 +420,13 @@ async def register_client(input: ClientRegister):
     )
     
     doc = client.model_dump()
-    doc['password'] = hash_password(input.password)
+    doc['password'] = await hash_password(input.password)
     doc['created_at'] = doc['created_at'].isoformat()
     
-    await db.clients.insert_one(doc)
+    try:
+        await db.clients.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     token = create_token(client.id)
     return ClientTokenResponse(
@@ -281,9 +440,18 @@ async def login(input: PractitionerLogin):
     if not practitioner:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    if not verify_password(input.password, practitioner['password']):
+    if not await verify_password(input.password, practitioner['password']):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    # Transparently upgrade hashes made with a different BCRYPT_ROUNDS
+    if password_hasher.needs_rehash(practitioner['password']):
+        try:
+            new_hash = await password_hasher.hash(input.password)
+        except PasswordPoolSaturated:
+            new_hash = None  # retried on a later login
+        if new_hash:
+            await db.practitioners.update_one({"id": practitioner['id']}, {"$set": {"password": new_hash}})
+    
     token = create_token(practitioner['id'])
     return TokenResponse(
         token=token,
@@ -291,63 +459,225 @@ async def login(input: PractitionerLogin):
     )
 
 # Public routes
+# Declared before /specialties/{specialty_name} so "suggest" is not taken as a name
+@api_router.get("/specialties/suggest")
+async def suggest_specialty(q: str = "", limit: int = Query(8, ge=1, le=MAX_SUGGESTIONS)):
+    """Ranked specialty, indication and method suggestions for a typed prefix"""
+    return suggest_specialties(q, limit)
+
 @api_router.get("/specialties/{specialty_name}")
-async def get_specialty_detail(specialty_name: str):
+async def get_specialty_detail(specialty_name: str, request: Request):
     """Get detailed description of a specialty"""
     from urllib.parse import unquote
     specialty_name = unquote(specialty_name)
-    description = get_specialty_description(specialty_name)
-    if not description:
+    precomputed = SPECIALTY_RESPONSES.get(specialty_name)
+    if not precomputed:
         raise HTTPException(status_code=404, detail="Specialty not found")
-    return {
-        "name": specialty_name,
-        **description
-    }
+    return cached_response(request, precomputed)
 
 @api_router.get("/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Get all categories with their specialty count"""
-    return get_all_categories()
+    return cached_response(request, CATEGORIES_RESPONSE)
 
 @api_router.get("/categories/{category_slug}")
-async def get_category(category_slug: str):
+async def get_category(category_slug: str, request: Request):
     """Get a specific category with all its specialties"""
-    category = get_category_by_slug(category_slug)
-    if not category:
+    precomputed = CATEGORY_RESPONSES.get(category_slug)
+    if not precomputed:
         raise HTTPException(status_code=404, detail="Category not found")
-    return category
+    return cached_response(request, precomputed)
+
+@api_router.get("/categories/{category_slug}/specialties")
+async def get_category_specialties(category_slug: str, request: Request):
+    """Get the described specialties of a category, keyed by name"""
+    precomputed = CATEGORY_SPECIALTIES_RESPONSES.get(category_slug)
+    if not precomputed:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return cached_response(request, precomputed)
 
 @api_router.get("/specialties")
-async def get_specialties():
+async def get_specialties(request: Request):
     """Get all specialties across all categories"""
-    return get_all_specialties()
+    return cached_response(request, SPECIALTIES_RESPONSE)
+
+def search_index_loading() -> HTTPException:
+    return HTTPException(status_code=503, detail="Search index loading, please retry", headers={"Retry-After": "5"})
 
 @api_router.get("/public/practitioners", response_model=List[PractitionerPublic])
 async def search_practitioners(
+    response: Response,
     specialty: Optional[str] = None, 
     city: Optional[str] = None,
     category: Optional[str] = None,
-    sort_by: Optional[str] = "rating"  # rating, reviews, name
+    q: Optional[str] = None,
+    sort_by: Optional[str] = "rating",  # rating, reviews, name
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
+    available_from: Optional[str] = None,
+    available_to: Optional[str] = None,
+    min_duration: int = Query(60, ge=5, le=MAX_APPOINTMENT_MINUTES)
 ):
+    """Keyset-paginated search; the next page's cursor is sent in X-Next-Cursor.
+    
+    Text filters (specialty, city, q) are answered by the in-memory search
+    index once loaded; other queries go to MongoDB, and q answers 503 until
+    the index is loaded. With available_from (YYYY-MM-DD, to available_to,
+    default a week), only practitioners with a free slot of min_duration
+    minutes in that window are returned; such pages can be shorter than
+    limit while X-Next-Cursor is still sent.
+    """
+    # Sorting, with id as a stable tiebreaker for the cursor
+    sort_by = sort_by if sort_by in SEARCH_SORTS else "name"
+    sort_field, sort_order = SEARCH_SORTS[sort_by]
+    
+    position = None
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+            if position.get("s") != sort_by or "v" not in position or not valid_position(position, sort_by):
+                raise InvalidCursor(cursor)
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    window = None
+    if available_from or available_to:
+        try:
+            day_from = date.fromisoformat(available_from) if available_from else datetime.now(timezone.utc).date()
+            day_to = date.fromisoformat(available_to) if available_to else day_from + timedelta(days=6)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date, expected YYYY-MM-DD")
+        if not 0 <= (day_to - day_from).days < MAX_SLOT_DAYS:
+            raise HTTPException(status_code=400, detail=f"Date range must cover 1 to {MAX_SLOT_DAYS} days")
+        window = (day_from, day_to)
+    
+    async def available_page(candidates):
+        # limit + 1 available practitioners tell whether there is a next page;
+        # a scan stopped at AVAILABILITY_MAX_SCANNED may return a short (even
+        # empty) page whose cursor resumes after the last checked candidate
+        selected, resume = await select_available(
+            db, candidates, window[0], window[1], min_duration, limit + 1,
+            not_before=epoch_minutes(datetime.now(timezone.utc))
+        )
+        if len(selected) > limit:
+            selected = selected[:limit]
+            response.headers["X-Next-Cursor"] = encode_cursor({"s": sort_by, **selected[-1][1]})
+        elif resume:
+            response.headers["X-Next-Cursor"] = encode_cursor({"s": sort_by, **resume})
+        return fast_list_response([doc for doc, _ in selected], PractitionerPublic, headers=response.headers)
+    
+    if search_index.ready and (specialty or city or q):
+        if window:
+            async def indexed_candidates():
+                for result in search_index.iter_search(
+                    specialty=specialty, city=city, category=category, q=q, sort_by=sort_by, after=position
+                ):
+                    yield result
+            return await available_page(indexed_candidates())
+        
+        practitioners, next_position = search_index.search(
+            specialty=specialty, city=city, category=category, q=q,
+            sort_by=sort_by, limit=limit, after=position
+        )
+        if next_position:
+            response.headers["X-Next-Cursor"] = encode_cursor({"s": sort_by, **next_position})
+        return fast_list_response(practitioners, PractitionerPublic, headers=response.headers)
+    
+    if q:
+        # Free text needs the index: a regex over every text field scans the collection
+        raise search_index_loading()
+    
     query = {}
     
+    # Normalized keys (see normalize.py): equality for catalog specialties,
+    # anchored prefixes otherwise, both served by an index
     if specialty:
-        query['specialty'] = {"$regex": specialty, "$options": "i"}
+        slug, in_catalog = specialty_slug(specialty)
+        query['specialty_slug'] = slug if in_catalog else {"$regex": "^" + re.escape(slug)}
     if city:
-        query['city'] = {"$regex": city, "$options": "i"}
+        query['city_key'] = {"$regex": "^" + re.escape(search_key(city))}
     if category:
         query['category'] = category
     
-    # Sorting
-    sort_field = "rating" if sort_by == "rating" else "reviews_count" if sort_by == "reviews" else "full_name"
-    sort_order = -1 if sort_by in ["rating", "reviews"] else 1
+    if position:
+        after = keyset_filter(sort_field, sort_order, position["v"], position["id"])
+        query = {"$and": [query, after]} if query else after
+    
+    if window:
+        async def stored_candidates():
+            cursor = db.practitioners.find(
+                query,
+                {**projection(PractitionerPublic), sort_field: 1, "availability": 1, "timezone": 1}
+            ).sort([(sort_field, sort_order), ("id", 1)]).batch_size(AVAILABILITY_BATCH_SIZE)
+            async for doc in cursor:
+                yield doc, {"v": doc.get(sort_field), "id": doc["id"]}
+        return await available_page(stored_candidates())
     
     practitioners = await db.practitioners.find(
         query, 
-        {"_id": 0, "password": 0}
-    ).sort(sort_field, sort_order).to_list(100)
+        {**projection(PractitionerPublic), sort_field: 1}
+    ).sort([(sort_field, sort_order), ("id", 1)]).limit(limit + 1).to_list(limit + 1)
+    
+    if len(practitioners) > limit:
+        practitioners = practitioners[:limit]
+        last = practitioners[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor({"s": sort_by, "v": last.get(sort_field), "id": last["id"]})
     
-    return [PractitionerPublic(**p) for p in practitioners]
+    return fast_list_response(practitioners, PractitionerPublic, headers=response.headers)
+
+@api_router.get("/public/practitioners/near", response_model=List[PractitionerNearby])
+async def search_practitioners_near(
+    response: Response,
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(10, gt=0, le=200),
+    specialty: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None
+):
+    """Practitioners within radius_km of (lat, lon), nearest first"""
+    query = {}
+    if specialty:
+        slug, in_catalog = specialty_slug(specialty)
+        query['specialty_slug'] = slug if in_catalog else {"$regex": "^" + re.escape(slug)}
+    if category:
+        query['category'] = category
+    
+    geo_near = {
+        "near": {"type": "Point", "coordinates": [lon, lat]},
+        "distanceField": "distance",
+        "maxDistance": radius_km * 1000,
+        "spherical": True,
+        "query": query
+    }
+    pipeline = [{"$geoNear": geo_near}]
+    
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+            distance, last_id = float(position["d"]), position["id"]
+        except (InvalidCursor, KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        # Resume at the last distance; ties are broken on id
+        geo_near["minDistance"] = distance
+        pipeline.append({"$match": {"$or": [{"distance": {"$gt": distance}}, {"id": {"$gt": last_id}}]}})
+    
+    pipeline += [
+        {"$sort": {"distance": 1, "id": 1}},
+        {"$limit": limit + 1},
+        {"$project": {**projection(PractitionerPublic), "distance": 1}}
+    ]
+    practitioners = await db.practitioners.aggregate(pipeline).to_list(limit + 1)
+    
+    if len(practitioners) > limit:
+        practitioners = practitioners[:limit]
+        last = practitioners[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor({"d": last["distance"], "id": last["id"]})
+    
+    for p in practitioners:
+        p["distance_km"] = round(p["distance"] / 1000, 2)
+    return fast_list_response(practitioners, PractitionerNearby, headers=response.headers)
 
 @api_router.get("/public/practitioner/{practitioner_id}", response_model=PractitionerPublic)
 async def get_public_practitioner(practitioner_id: str):
@@ -356,6 +686,92 @@ async def get_public_practitioner(practitioner_id: str):
         raise HTTPException(status_code=404, detail="Practitioner not found")
     return PractitionerPublic(**practitioner)
 
+@api_router.get("/public/practitioner/{practitioner_id}/slots")
+async def get_practitioner_slots(
+    practitioner_id: str,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    duration: int = Query(60, ge=5, le=MAX_APPOINTMENT_MINUTES)
+):
+    """Free slots of duration minutes between two local dates (inclusive, default the next 7 days)"""
+    practitioner = await db.practitioners.find_one(
+        {"id": practitioner_id},
+        {"_id": 0, "id": 1, "schedule": 1, "availability": 1, "timezone": 1}
+    )
+    if not practitioner:
+        raise HTTPException(status_code=404, detail="Practitioner not found")
+    
+    tz = practitioner_timezone(practitioner)
+    now = datetime.now(timezone.utc)
+    try:
+        day_from = date.fromisoformat(date_from) if date_from else now.astimezone(tz).date()
+        day_to = date.fromisoformat(date_to) if date_to else day_from + timedelta(days=6)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date, expected YYYY-MM-DD")
+    if not 0 <= (day_to - day_from).days < MAX_SLOT_DAYS:
+        raise HTTPException(status_code=400, detail=f"Date range must cover 1 to {MAX_SLOT_DAYS} days")
+    
+    template = practitioner_availability(practitioner)
+    if not template:
+        return []
+    start, end = window_bounds(tz, day_from, day_to)
+    busy = await fetch_busy(db, [practitioner_id], start, end)
+    slots = free_slots(template, tz, day_from, day_to, busy[practitioner_id], duration, not_before=epoch_minutes(now))
+    return slot_payload(slots, tz)
+
+@api_router.get("/public/practitioner/{practitioner_id}/reviews", response_model=List[ReviewPublic])
+async def get_practitioner_reviews(
+    practitioner_id: str,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None
+):
+    """Newest reviews first; the next page's cursor is sent in X-Next-Cursor"""
+    query = {"practitioner_id": practitioner_id}
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+            query = {"$and": [query, keyset_filter("created_at", -1, position["v"], position["id"])]}
+        except (InvalidCursor, KeyError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    reviews = await db.reviews.find(
+        query, projection(ReviewPublic)
+    ).sort([("created_at", -1), ("id", 1)]).limit(limit + 1).to_list(limit + 1)
+    
+    if len(reviews) > limit:
+        reviews = reviews[:limit]
+        last = reviews[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor({"v": last["created_at"], "id": last["id"]})
+    return fast_list_response(reviews, ReviewPublic, headers=response.headers)
+
+@api_router.post("/public/practitioner/{practitioner_id}/reviews", response_model=ReviewPublic)
+async def create_review(practitioner_id: str, input: ReviewCreate, current_client: dict = Depends(get_current_client)):
+    """One review per client and practitioner; the practitioner's rating is updated in the same request"""
+    review = Review(
+        practitioner_id=practitioner_id,
+        client_id=current_client['id'],
+        client_name=current_client['full_name'],
+        score=input.score,
+        text=input.text or ""
+    )
+    
+    doc = review.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    try:
+        await db.reviews.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Practitioner already reviewed")
+    
+    practitioner = await record_review(db, practitioner_id, review.score, doc['created_at'])
+    if not practitioner:
+        await db.reviews.delete_one({"id": review.id})
+        raise HTTPException(status_code=404, detail="Practitioner not found")
+    
+    search_index.upsert(practitioner)
+    practitioner_cache.invalidate(practitioner_id)
+    return ReviewPublic(**review.model_dump())
+
 @api_router.post("/contact")
 async def submit_contact(input: ContactMessageCreate):
     contact_message = ContactMessage(
@@ -374,6 +790,19 @@ async def submit_contact(input: ContactMessageCreate):
     
     return {"message": "Message received successfully", "id": contact_message.id}
 
+# Cache sizes and hit rates are internal: /metrics/cache answers 404 unless enabled
+EXPOSE_CACHE_METRICS = os.environ.get('EXPOSE_CACHE_METRICS', '0') == '1'
+
+@api_router.get("/metrics/cache")
+async def get_cache_metrics():
+    """Hit/miss counters of this worker's identity caches (EXPOSE_CACHE_METRICS=1)"""
+    if not EXPOSE_CACHE_METRICS:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return {
+        "practitioners": practitioner_cache.stats(),
+        "tokens": token_cache.stats()
+    }
+
 # Protected routes - Practitioner
 @api_router.get("/practitioner/profile", response_model=Practitioner)
 async def get_profile(current_user: dict = Depends(get_current_user)):
@@ -382,29 +811,120 @@ async def get_profile(current_user: dict = Depends(get_current_user)):
 @api_router.put("/practitioner/profile", response_model=Practitioner)
 async def update_profile(input: PractitionerUpdate, current_user: dict = Depends(get_current_user)):
     update_data = {k: v for k, v in input.model_dump().items() if v is not None}
+    if 'timezone' in update_data and not valid_timezone(update_data['timezone']):
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+    # An explicit template wins and is kept on later saves; a template derived
+    # from the free-text schedule follows it
+    source = update_data.pop('availability_source', None)
+    if 'availability' in update_data:
+        try:
+            update_data['availability'] = validate_template(update_data['availability'])
+        except InvalidAvailability as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        update_data['availability_source'] = SOURCE_MANUAL
+    elif source == SOURCE_SCHEDULE or ('schedule' in update_data and follows_schedule(current_user)):
+        update_data['availability'] = parse_schedule(update_data.get('schedule', current_user.get('schedule')))
+        update_data['availability_source'] = SOURCE_SCHEDULE
     
-    if update_data:
-        await db.practitioners.update_one(
+    if not update_data:
+        return Practitioner(**current_user)
+    
+    update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
+    if 'city' in update_data or 'specialty' in update_data:
+        update_data.update(practitioner_search_keys({**current_user, **update_data}))
+    if 'city' in update_data or 'address' in update_data:
+        update_data.update(practitioner_location({**current_user, **update_data}))
+    
+    async def save():
+        return await db.practitioners.find_one_and_update(
             {"id": current_user['id']},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"_id": 0, "password": 0},
+            return_document=ReturnDocument.AFTER
         )
     
-    updated = await db.practitioners.find_one({"id": current_user['id']}, {"_id": 0})
+    moved = []
+    if 'timezone' in update_data and practitioner_timezone(update_data) != practitioner_timezone(current_user):
+        # Upcoming appointments keep their instant; their local date and time
+        # follow the new timezone. Under the booking lease, so no booking is
+        # placed with the old timezone in between.
+        try:
+            async with booking_lock(db, current_user['id']):
+                updated = await save()
+                if updated:
+                    moved = await relocalize_appointments(db, current_user['id'], practitioner_timezone(updated))
+        except BookingBusy:
+            raise booking_busy()
+    else:
+        updated = await save()
+    if not updated:
+        raise HTTPException(status_code=404, detail="Practitioner not found")
+    moved = [(old, new) for old, new in moved if old != new]
+    if moved:
+        await record_appointments(db, current_user['id'], [old for old, _ in moved], sign=-1)
+        await record_appointments(db, current_user['id'], [new for _, new in moved])
+    practitioner_cache.set(current_user['id'], updated)
+    search_index.upsert(updated)
     return Practitioner(**updated)
 
 # Protected routes - Patients
-@api_router.get("/patients", response_model=List[Patient])
+@api_router.get("/patients", response_model=List[PatientSummary])
 async def get_patients(current_user: dict = Depends(get_current_user)):
-    patients = await db.patients.find(
-        {"practitioner_id": current_user['id']},
-        {"_id": 0}
-    ).to_list(1000)
+    """Patients with their appointment count, last and next appointment, in one aggregation"""
+    patients = await db.patients.aggregate(patient_summaries_pipeline(
+        current_user['id'], datetime.now(timezone.utc), projection(Patient), limit=1000
+    )).to_list(1000)
     
-    for patient in patients:
-        if isinstance(patient.get('created_at'), str):
-            patient['created_at'] = datetime.fromisoformat(patient['created_at'])
+    return fast_list_response(patients, PatientSummary)
+
+@api_router.get("/patients/export")
+async def export_patients(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Every patient of the practitioner, optionally filtered on created_at (YYYY-MM-DD, inclusive)"""
+    try:
+        created = date_range_filter("created_at", date_from, date_to, timestamp=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date, expected YYYY-MM-DD")
     
-    return patients
+    cursor = db.patients.find(
+        {"practitioner_id": current_user['id'], **created},
+        projection(Patient)
+    ).sort([("created_at", 1), ("id", 1)]).batch_size(EXPORT_BATCH_SIZE)
+    return export_response(cursor, Patient.model_fields, format, "patients")
+
+@api_router.get("/patients/{patient_id}/appointments", response_model=List[Appointment])
+async def get_patient_appointments(
+    patient_id: str,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """A patient's appointments, newest first; the next page's cursor is sent in X-Next-Cursor"""
+    query = {"practitioner_id": current_user['id'], "patient_id": patient_id}
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+            if not isinstance(position["v"], list) or len(position["v"]) != len(HISTORY_FIELDS):
+                raise InvalidCursor(cursor)
+            after = compound_keyset_filter(HISTORY_FIELDS, -1, position["v"], position["id"])
+        except (InvalidCursor, KeyError, TypeError, IndexError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = {"$and": [query, after]}
+    
+    appointments = await db.appointments.find(
+        query, projection(Appointment)
+    ).sort([*((field, -1) for field in HISTORY_FIELDS), ("id", 1)]).limit(limit + 1).to_list(limit + 1)
+    
+    if len(appointments) > limit:
+        appointments = appointments[:limit]
+        last = appointments[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor({"v": [last[field] for field in HISTORY_FIELDS], "id": last["id"]})
+    return fast_list_response(appointments, Appointment, headers=response.headers)
 
 @api_router.post("/patients", response_model=Patient)
 async def create_patient(input: PatientCreate, current_user: dict = Depends(get_current_user)):
@@ -418,26 +938,44 @@ async def create_patient(input: PatientCreate, current_user: dict = Depends(get_
     
     doc = patient.model_dump()
     doc['created_at'] = doc['created_at'].isoformat()
+    doc['email_key'] = email_key(patient.email)
     
     await db.patients.insert_one(doc)
+    await record_patients(db, current_user['id'], 1)
     return patient
 
+@api_router.post("/patients/import")
+async def import_patients_bulk(request: Request, current_user: dict = Depends(get_current_user)):
+    """Bulk import from a CSV (Content-Type: text/csv) or JSON body, with a per-row report"""
+    try:
+        rows = parse_rows(await request.body(), request.headers.get("content-type", ""))
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_IMPORT_ROWS} rows per import")
+    
+    return await import_patients(db, current_user['id'], rows, PatientCreate, Patient)
+
 @api_router.put("/patients/{patient_id}", response_model=Patient)
 async def update_patient(patient_id: str, input: PatientUpdate, current_user: dict = Depends(get_current_user)):
-    # Verify patient belongs to current user
-    patient = await db.patients.find_one({"id": patient_id, "practitioner_id": current_user['id']}, {"_id": 0})
-    if not patient:
-        raise HTTPException(status_code=404, detail="Patient not found")
-    
+    # The filter also checks that the patient belongs to the current user
+    query = {"id": patient_id, "practitioner_id": current_user['id']}
     update_data = {k: v for k, v in input.model_dump().items() if v is not None}
+    if 'email' in update_data:
+        update_data['email_key'] = email_key(update_data['email'])
     
     if update_data:
-        await db.patients.update_one(
-            {"id": patient_id},
-            {"$set": update_data}
+        updated = await db.patients.find_one_and_update(
+            query,
+            {"$set": update_data},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
         )
+    else:
+        updated = await db.patients.find_one(query, {"_id": 0})
+    if not updated:
+        raise HTTPException(status_code=404, detail="Patient not found")
     
-    updated = await db.patients.find_one({"id": patient_id}, {"_id": 0})
     if isinstance(updated.get('created_at'), str):
         updated['created_at'] = datetime.fromisoformat(updated['created_at'])
     
@@ -453,134 +991,239 @@ async def delete_patient(patient_id: str, current_user: dict = Depends(get_curre
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Patient not found")
     
+    await record_patients(db, current_user['id'], -1)
+    
     return {"message": "Patient deleted"}
 
 # Protected routes - Appointments
 @api_router.get("/appointments", response_model=List[Appointment])
-async def get_appointments(current_user: dict = Depends(get_current_user)):
+async def get_appointments(
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Appointments sorted by date and time, optionally limited to a window (YYYY-MM-DD, inclusive)"""
+    try:
+        dates = date_range_filter("date", date_from, date_to)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date, expected YYYY-MM-DD")
+    
     appointments = await db.appointments.find(
-        {"practitioner_id": current_user['id']},
-        {"_id": 0}
-    ).to_list(1000)
+        {"practitioner_id": current_user['id'], **dates},
+        projection(Appointment)
+    ).sort([("date", 1), ("time", 1)]).to_list(1000)
     
-    for apt in appointments:
-        if isinstance(apt.get('created_at'), str):
-            apt['created_at'] = datetime.fromisoformat(apt['created_at'])
+    return fast_list_response(appointments, Appointment)
+
+@api_router.get("/appointments/export")
+async def export_appointments(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Every appointment of the practitioner, optionally filtered on date (YYYY-MM-DD, inclusive)"""
+    try:
+        dates = date_range_filter("date", date_from, date_to)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date, expected YYYY-MM-DD")
     
-    return appointments
+    cursor = db.appointments.find(
+        {"practitioner_id": current_user['id'], **dates},
+        projection(Appointment)
+    ).sort([("date", 1), ("time", 1)]).batch_size(EXPORT_BATCH_SIZE)
+    return export_response(cursor, Appointment.model_fields, format, "appointments")
+
+def booking_busy() -> HTTPException:
+    return HTTPException(status_code=503, detail="Calendar busy, please retry", headers={"Retry-After": "1"})
+
+def booking_conflict(conflicts) -> HTTPException:
+    return HTTPException(status_code=409, detail={"message": "Conflicting appointments", "conflicts": conflicts})
+
+def appointment_document(appointment: Appointment) -> dict:
+    # start_at/end_at stay datetimes (BSON dates); created_at is stored as a string
+    doc = appointment.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    return doc
 
 @api_router.post("/appointments", response_model=Appointment)
 async def create_appointment(input: AppointmentCreate, current_user: dict = Depends(get_current_user)):
+    tz = practitioner_timezone(current_user)
+    duration = input.duration or 60
+    if input.start_at is not None:
+        local_date, local_time = local_date_time(input.start_at, tz)
+    elif input.date and input.time:
+        local_date, local_time = input.date, input.time
+    else:
+        raise HTTPException(status_code=400, detail="Either date and time, or start_at, are required")
+    
+    try:
+        interval = appointment_interval(local_date, local_time, duration, tz)
+    except InvalidSlot as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     appointment = Appointment(
         practitioner_id=current_user['id'],
         patient_id=input.patient_id,
         patient_name=input.patient_name,
-        date=input.date,
-        time=input.time,
-        duration=input.duration or 60,
-        notes=input.notes or ""
+        date=local_date,
+        time=local_time,
+        duration=duration,
+        notes=input.notes or "",
+        start_at=interval[0],
+        end_at=interval[1]
     )
+    doc = appointment_document(appointment)
     
-    doc = appointment.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
+    # Check and insert under the practitioner's booking lock so two
+    # concurrent requests cannot both see the slot as free
+    try:
+        async with booking_lock(db, current_user['id']):
+            conflicts = await find_conflicts(db, current_user['id'], [interval])
+            if conflicts:
+                raise booking_conflict(conflicts)
+            await db.appointments.insert_one(doc)
+    except BookingBusy:
+        raise booking_busy()
     
-    await db.appointments.insert_one(doc)
+    await record_appointments(db, current_user['id'], [appointment.date])
     return appointment
 
 @api_router.delete("/appointments/{appointment_id}")
 async def delete_appointment(appointment_id: str, current_user: dict = Depends(get_current_user)):
-    result = await db.appointments.delete_one({
-        "id": appointment_id,
-        "practitioner_id": current_user['id']
-    })
+    deleted = await db.appointments.find_one_and_delete(
+        {"id": appointment_id, "practitioner_id": current_user['id']},
+        {"_id": 0, "date": 1}
+    )
     
-    if result.deleted_count == 0:
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Appointment not found")
     
+    await record_appointments(db, current_user['id'], [deleted['date']], sign=-1)
+    
     return {"message": "Appointment deleted"}
 
-# Protected routes - Statistics
-@api_router.get("/stats")
-async def get_statistics(current_user: dict = Depends(get_current_user)):
-    from collections import defaultdict
-    
-    # Get all appointments
-    appointments = await db.appointments.find(
-        {"practitioner_id": current_user['id']},
-        {"_id": 0}
-    ).to_list(1000)
+# Protected routes - Recurring appointments
+def series_filter(practitioner_id, series_id, scope, from_date):
+    query = {"practitioner_id": practitioner_id, "series_id": series_id}
+    if scope == "following":
+        if not from_date:
+            raise HTTPException(status_code=400, detail="from_date is required with scope=following")
+        query["date"] = {"$gte": from_date}
+    return query
+
+@api_router.post("/appointments/series", response_model=List[Appointment])
+async def create_appointment_series(input: AppointmentSeriesCreate, current_user: dict = Depends(get_current_user)):
+    """Expand a recurring series and book every occurrence in one insert_many"""
+    duration = input.duration or 60
+    tz = practitioner_timezone(current_user)
+    try:
+        dates = expand_series(input.date, input.frequency, input.count, input.until, input.skip_dates)
+        intervals = [appointment_interval(day, input.time, duration, tz) for day in dates]
+    except (InvalidSeries, InvalidSlot) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Get all patients
-    patients = await db.patients.find(
-        {"practitioner_id": current_user['id']},
-        {"_id": 0}
-    ).to_list(1000)
+    series_id = str(uuid.uuid4())
+    appointments = [
+        Appointment(
+            practitioner_id=current_user['id'],
+            patient_id=input.patient_id,
+            patient_name=input.patient_name,
+            date=day,
+            time=input.time,
+            duration=duration,
+            notes=input.notes or "",
+            series_id=series_id,
+            start_at=start,
+            end_at=end
+        )
+        for day, (start, end) in zip(dates, intervals)
+    ]
+    docs = [appointment_document(appointment) for appointment in appointments]
     
-    # Current date
-    now = datetime.now(timezone.utc)
-    today = now.date()
+    try:
+        async with booking_lock(db, current_user['id']):
+            conflicts = await find_conflicts(db, current_user['id'], intervals)
+            if conflicts:
+                raise booking_conflict(conflicts)
+            await db.appointments.insert_many(docs)
+    except BookingBusy:
+        raise booking_busy()
     
-    # Calculate stats
-    total_appointments = len(appointments)
-    total_patients = len(patients)
+    await record_appointments(db, current_user['id'], dates)
+    return appointments
+
+@api_router.put("/appointments/series/{series_id}")
+async def update_appointment_series(
+    series_id: str,
+    input: AppointmentSeriesUpdate,
+    scope: str = Query("all", pattern="^(all|following)$"),
+    from_date: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Update every occurrence of a series, or those on or after from_date"""
+    query = series_filter(current_user['id'], series_id, scope, from_date)
+    update_data = {k: v for k, v in input.model_dump().items() if v is not None}
+    if not update_data:
+        return {"message": "Series updated", "updated": 0}
     
-    # Count upcoming appointments
-    upcoming_appointments = 0
-    appointments_this_week = 0
-    appointments_this_month = 0
-    appointments_this_year = 0
+    if "time" not in update_data and "duration" not in update_data:
+        result = await db.appointments.update_many(query, {"$set": update_data})
+        if result.matched_count == 0:
+            raise HTTPException(status_code=404, detail="Series not found")
+        return {"message": "Series updated", "updated": result.modified_count}
     
-    # Get week start (Monday)
-    week_start = today - timedelta(days=today.weekday())
-    month_start = today.replace(day=1)
-    year_start = today.replace(month=1, day=1)
+    # Moving occurrences: every one gets its own interval, checked for
+    # conflicts and written in one unordered bulk_write
+    tz = practitioner_timezone(current_user)
+    try:
+        async with booking_lock(db, current_user['id']):
+            occurrences = await db.appointments.find(query, CONFLICT_FIELDS).to_list(None)
+            if not occurrences:
+                raise HTTPException(status_code=404, detail="Series not found")
+            try:
+                intervals = {
+                    a["id"]: appointment_interval(
+                        a["date"], update_data.get("time", a["time"]), update_data.get("duration", a.get("duration") or 60), tz
+                    )
+                    for a in occurrences
+                }
+            except InvalidSlot as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            conflicts = await find_conflicts(db, current_user['id'], intervals.values(), exclude_ids=intervals)
+            if conflicts:
+                raise booking_conflict(conflicts)
+            result = await db.appointments.bulk_write([
+                UpdateOne({"id": appointment_id}, {"$set": {**update_data, "start_at": start, "end_at": end}})
+                for appointment_id, (start, end) in intervals.items()
+            ], ordered=False)
+    except BookingBusy:
+        raise booking_busy()
     
-    recent_appointments = []
-    appointments_by_day = defaultdict(int)
+    return {"message": "Series updated", "updated": result.modified_count}
+
+@api_router.delete("/appointments/series/{series_id}")
+async def delete_appointment_series(
+    series_id: str,
+    scope: str = Query("all", pattern="^(all|following)$"),
+    from_date: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Cancel every occurrence of a series, or those on or after from_date"""
+    query = series_filter(current_user['id'], series_id, scope, from_date)
+    occurrences = await db.appointments.find(query, {"_id": 0, "id": 1, "date": 1}).to_list(None)
+    if not occurrences:
+        raise HTTPException(status_code=404, detail="Series not found")
     
-    for apt in appointments:
-        apt_date_str = apt['date']
-        apt_date = datetime.strptime(apt_date_str, '%Y-%m-%d').date()
-        
-        # Count by category
-        if apt_date >= today:
-            upcoming_appointments += 1
-        
-        if apt_date >= week_start and apt_date < week_start + timedelta(days=7):
-            appointments_this_week += 1
-        
-        if apt_date >= month_start:
-            appointments_this_month += 1
-        
-        if apt_date >= year_start:
-            appointments_this_year += 1
-        
-        # Group by day for chart
-        appointments_by_day[apt_date_str] += 1
-        
-        # Recent appointments (last 5)
-        if len(recent_appointments) < 5:
-            recent_appointments.append({
-                "id": apt['id'],
-                "patient_name": apt['patient_name'],
-                "date": apt['date'],
-                "time": apt['time']
-            })
-    
-    # Sort appointments by day
-    sorted_days = sorted(appointments_by_day.items())[-30:]  # Last 30 days
-    appointments_by_day_list = [{"date": date, "count": count} for date, count in sorted_days]
+    result = await db.appointments.delete_many({"practitioner_id": current_user['id'], "id": {"$in": [a["id"] for a in occurrences]}})
+    await record_appointments(db, current_user['id'], [a["date"] for a in occurrences], sign=-1)
     
-    return {
-        "total_appointments": total_appointments,
-        "total_patients": total_patients,
-        "upcoming_appointments": upcoming_appointments,
-        "appointments_this_week": appointments_this_week,
-        "appointments_this_month": appointments_this_month,
-        "appointments_this_year": appointments_this_year,
-        "recent_appointments": recent_appointments,
-        "appointments_by_day": appointments_by_day_list
-    }
+    return {"message": "Series deleted", "deleted": result.deleted_count}
+
+# Protected routes - Statistics
+@api_router.get("/stats")
+async def get_statistics(current_user: dict = Depends(get_current_user)):
+    return await load_statistics(db, current_user['id'])
 
 # Include router
 app.include_router(api_router)
@@ -591,14 +1234,52 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", ROUND_TRIPS_HEADER],
 )
 
+if COUNT_MONGO_ROUND_TRIPS:
+    app.add_middleware(RoundTripCounterMiddleware)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    global unique_emails_enforced
+    if os.environ.get('ENSURE_INDEXES_ON_STARTUP', '1') == '1':
+        try:
+            await ensure_indexes(db)
+        except Exception:
+            # Never block startup (e.g. duplicate emails in legacy data); run
+            # `python manage.py ensure-indexes` to see the failure in full.
+            logger.exception("Index creation failed")
+    
+    try:
+        missing = await missing_unique_indexes(db, ["practitioners", "clients"])
+    except Exception:
+        logger.exception("Could not list indexes")
+        missing = ["unknown"]
+    unique_emails_enforced = not missing
+    if missing:
+        logger.error("Unique indexes missing (%s): registration checks emails before inserting", ", ".join(missing))
+
+async def refresh_search_index():
+    while True:
+        try:
+            await search_index.refresh(db)
+        except Exception:
+            logger.exception("Search index refresh failed")
+        await asyncio.sleep(SEARCH_INDEX_REFRESH_SECONDS)
+
+@app.on_event("startup")
+async def start_search_index():
+    app.state.search_index_task = asyncio.create_task(refresh_search_index())
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    app.state.search_index_task.cancel()
+    client.close()
+    password_hasher.shutdown()
\ No newline at end of file
@@ -1,5 +1,6 @@
 # Descriptions détaillées des spécialités TherapyCare
 # VERSION COMPLÈTE - 192 spécialités réparties en 11 catégories
+# Source du catalogue : après modification, régénérer data/catalog.json avec build_catalog.py
 
 SPECIALTIES_DESCRIPTIONS = {
     # CATÉGORIE 1 — PSYCHOLOGIE & PSYCHOTHÉRAPIE
@@ -136,7 +137,7 @@ SPECIALTIES_DESCRIPTIONS = {
         "indications": ["Hypersensibilité", "Troubles sensoriels", "Stress", "Neuro-atypie"],
         "methods": ["Stimulation sensorielle", "Intégration sensorielle", "Salle Snoezelen", "Chromothérapie"]
     },
-    "Désensibilisation phobies": {
+    "Thérapie désensibilisation phobies": {
         "category": "psychologie",
         "short_description": "Méthodes rapides pour apaiser durablement les phobies",
         "full_description": "Méthodes rapides (TCC, hypnose, exposition progressive, EMDR) pour apaiser durablement les phobies : transport, animaux, avion, foule, claustrophobie...",
@@ -180,28 +181,28 @@ SPECIALTIES_DESCRIPTIONS = {
         "indications": ["Phobies", "Stress", "Émotions", "Conflits", "Comportements"],
         "methods": ["PNL", "Hypnose", "TCC", "Approche systémique"]
     },
-    "Praticien PNL": {
+    "PNL avancée": {
         "category": "hypnose",
         "short_description": "Reprogrammation des schémas de pensées négatifs",
         "full_description": "La PNL explore la manière dont le cerveau fonctionne, perçoit, réagit et crée ses habitudes. Elle permet de reprogrammer les schémas de pensées négatifs, de développer de nouvelles ressources mentales et d'améliorer la communication. Très utilisée dans les domaines du bien-être, du coaching, de la performance ou de la confiance en soi.",
         "indications": ["Schémas de pensées négatifs", "Communication", "Confiance en soi", "Performance"],
         "methods": ["PNL", "Reprogrammation mentale", "Techniques de communication"]
     },
-    "Praticien en Respiration Holotropique": {
+    "Respiration holotropique": {
         "category": "hypnose",
         "short_description": "Transformation intérieure par respiration amplifiée",
         "full_description": "La respiration holotropique est une technique puissante de transformation intérieure basée sur une respiration amplifiée. Elle permet de libérer les traumatismes, d'accéder à des états modifiés de conscience et de reconnecter des parties profondes de soi. Cette méthode aide à comprendre les émotions refoulées, apaiser l'anxiété et obtenir des prises de conscience majeures.",
         "indications": ["Traumatismes", "Émotions refoulées", "Anxiété", "Prises de conscience"],
         "methods": ["Respiration holotropique", "États modifiés de conscience"]
     },
-    "Praticien Rebirth": {
+    "Rebirth / Respiration consciente": {
         "category": "hypnose",
         "short_description": "Respiration circulaire pour libérer tensions émotionnelles",
         "full_description": "Le Rebirth utilise une respiration circulaire consciente pour libérer les tensions émotionnelles et somatiques. Il permet d'accéder à des mémoires enfouies, de nettoyer le stress accumulé et de retrouver une sensation de calme profond. Très favorable à la libération des blocages liés à l'enfance ou aux schémas répétitifs.",
         "indications": ["Tensions émotionnelles", "Blocages enfance", "Schémas répétitifs", "Stress accumulé"],
         "methods": ["Rebirth", "Respiration circulaire consciente"]
     },
-    "Praticien en Cohérence Cardiaque": {
+    "Cohérence cardiaque": {
         "category": "hypnose",
         "short_description": "Régulation du système nerveux par la respiration",
         "full_description": "La cohérence cardiaque est une méthode de respiration simple et efficace pour réguler le système nerveux. Elle réduit le stress, améliore le sommeil, diminue l'anxiété et renforce la clarté mentale. Le praticien enseigne les bonnes techniques, adapte les exercices et suit l'évolution du patient.",
@@ -246,14 +247,3 @@ SPECIALTIES_DESCRIPTIONS = {
         "methods": ["Plantes médicinales", "Tisanes", "Extraits", "Gélules"]
     },
 }
-
-def get_specialty_description(specialty_name):
-    """Retourne la description complète d'une spécialité"""
-    return SPECIALTIES_DESCRIPTIONS.get(specialty_name)
-
-def get_specialties_by_category(category_slug):
-    """Retourne toutes les spécialités d'une catégorie avec leurs descriptions"""
-    return {
-        name: desc for name, desc in SPECIALTIES_DESCRIPTIONS.items()
-        if desc.get("category") == category_slug
-    }
@@ -1,156 +0,0 @@
-# Descriptions détaillées des spécialités TherapyCare
-
-SPECIALTIES_DESCRIPTIONS = {
-    # CATÉGORIE 1 — PSYCHOLOGIE & PSYCHOTHÉRAPIE
-    "Psychologue": {
-        "category": "psychologie",
-        "short_description": "Professionnel diplômé spécialisé dans l'analyse du comportement humain et des émotions",
-        "full_description": "Le psychologue est un professionnel diplômé d'un Master universitaire en psychologie. Il est formé à l'analyse du comportement humain, des émotions, des mécanismes psychiques et des stratégies d'adaptation. À travers des entretiens, tests et bilans psychologiques, il identifie les difficultés (anxiété, dépression, phobies, burn-out, troubles du comportement…). Il accompagne ensuite la personne avec des outils adaptés pour améliorer sa santé mentale et sa qualité de vie.",
-        "indications": ["Anxiété", "Dépression", "Phobies", "Burn-out", "Troubles du comportement"],
-        "methods": ["Entretiens cliniques", "Tests psychologiques", "Bilans psychologiques", "Thérapies comportementales et cognitives"]
-    },
-    "Psychologue Clinicien": {
-        "category": "psychologie",
-        "short_description": "Spécialiste de la souffrance psychique profonde et des troubles complexes",
-        "full_description": "Plus spécialisé, le psychologue clinicien travaille sur la souffrance psychique profonde. Formé à la psychopathologie, il intervient dans les troubles complexes : traumas, angoisses, dépression sévère, troubles de l'attachement, difficultés relationnelles. Il utilise des méthodes thérapeutiques spécifiques et propose un cadre rassurant structuré pour accompagner les patients dans la transformation de leurs difficultés.",
-        "indications": ["Traumas", "Angoisses", "Dépression sévère", "Troubles de l'attachement", "Difficultés relationnelles"],
-        "methods": ["Psychothérapie clinique", "Psychopathologie", "Cadre thérapeutique structuré"]
-    },
-    "Psychopraticien": {
-        "category": "psychologie",
-        "short_description": "Accompagnement par des techniques de psychothérapie reconnues",
-        "full_description": "Le psychopraticien accompagne les personnes à travers des techniques de psychothérapie reconnues (humaniste, analytique, gestalt, intégrative…). Il aide à comprendre les blocages émotionnels, les schémas répétitifs, les traumatismes et les conflits internes. Sa mission est de permettre à chacun d'exprimer ses émotions, de retrouver ses ressources internes et d'avancer avec une meilleure connaissance de soi.",
-        "indications": ["Blocages émotionnels", "Schémas répétitifs", "Traumatismes", "Conflits internes"],
-        "methods": ["Approche humaniste", "Gestalt", "Thérapie analytique", "Thérapie intégrative"]
-    },
-    "Psychothérapeute": {
-        "category": "psychologie",
-        "short_description": "Traitement des troubles émotionnels et comportementaux en profondeur",
-        "full_description": "Professionnel du soin psychique, il utilise des méthodes validées scientifiquement (TCC, approche humaniste, systémie, analyse…). Son rôle est de traiter les troubles émotionnels, comportementaux ou relationnels en profondeur. Il accompagne la personne dans un processus structuré et progressif, visant à transformer durablement ses pensées, ses émotions et ses comportements.",
-        "indications": ["Troubles émotionnels", "Troubles comportementaux", "Troubles relationnels"],
-        "methods": ["TCC", "Approche humaniste", "Systémie", "Analyse"]
-    },
-    "Psychologue-Psychothérapeute": {
-        "category": "psychologie",
-        "short_description": "Double expertise : diagnostic scientifique et traitement thérapeutique",
-        "full_description": "Il cumule la rigueur scientifique du psychologue et l'expertise thérapeutique du psychothérapeute. Cette double formation lui permet de proposer un diagnostic précis et un traitement thérapeutique complet. Il accompagne les troubles variés : anxiété, trauma, phobies, dépression, troubles du comportement, estime de soi.",
-        "indications": ["Anxiété", "Trauma", "Phobies", "Dépression", "Troubles du comportement", "Estime de soi"],
-        "methods": ["Diagnostic psychologique", "Psychothérapie", "Approches intégratives"]
-    },
-    "Psychanalyste": {
-        "category": "psychologie",
-        "short_description": "Exploration en profondeur de l'inconscient à travers la parole",
-        "full_description": "Le psychanalyste propose une exploration en profondeur de l'inconscient à travers la parole. Il travaille sur les conflits internes, les répétitions, les schémas inconscients, les traumas anciens et les souffrances d'origine psychique. La psychanalyse aide à mieux se comprendre, à sortir de blocages ancrés et à gagner en liberté intérieure.",
-        "indications": ["Conflits internes", "Schémas répétitifs", "Traumas anciens", "Blocages inconscients"],
-        "methods": ["Psychanalyse", "Libre association", "Analyse des rêves", "Transfert"]
-    },
-    "Neuropsychologue": {
-        "category": "psychologie",
-        "short_description": "Spécialiste du fonctionnement cérébral et des fonctions cognitives",
-        "full_description": "Spécialiste du fonctionnement cérébral, le neuropsychologue réalise des bilans cognitifs très précis : mémoire, attention, langage, raisonnement, impulsivité, fonctions exécutives. Il intervient dans les cas d'AVC, Alzheimer, TDAH, troubles DYS, traumatisme crânien… Il propose aussi des prises en charge de rééducation cognitive et conseille les familles.",
-        "indications": ["AVC", "Alzheimer", "TDAH", "Troubles DYS", "Traumatisme crânien"],
-        "methods": ["Bilans cognitifs", "Tests neuropsychologiques", "Rééducation cognitive", "Guidance familiale"]
-    },
-    "Thérapeute de couple": {
-        "category": "psychologie",
-        "short_description": "Accompagnement des couples dans les crises et conflits relationnels",
-        "full_description": "Accompagne les couples dans les crises, conflits, ruptures de communication, manque de désir ou difficultés relationnelles. Il aide chaque partenaire à exprimer ses besoins, comprendre ses émotions et améliorer la qualité du lien. L'objectif n'est pas seulement de \"réparer\", mais aussi d'apprendre à mieux fonctionner ensemble.",
-        "indications": ["Crises conjugales", "Conflits", "Rupture de communication", "Manque de désir", "Difficultés relationnelles"],
-        "methods": ["Thérapie systémique", "Communication non-violente", "Thérapie Imago", "Approche Gottman"]
-    },
-    "Thérapeute familial": {
-        "category": "psychologie",
-        "short_description": "Gestion des tensions et conflits au sein de la famille",
-        "full_description": "Il intervient auprès de l'ensemble de la famille pour gérer tensions, conflits, symptômes chez l'enfant ou adolescent, recomposition familiale. Son approche permet de restaurer la communication et de comprendre les rôles de chacun au sein du foyer.",
-        "indications": ["Tensions familiales", "Conflits", "Difficultés enfant/ado", "Recomposition familiale"],
-        "methods": ["Thérapie familiale systémique", "Approche contextuelle", "Sculptu family"]
-    },
-    "Thérapeute systémique": {
-        "category": "psychologie",
-        "short_description": "Analyse des interactions et transformation du système relationnel",
-        "full_description": "Cette méthode imagine la personne comme un élément d'un système (famille, couple, travail). Le thérapeute analyse les interactions, les loyautés, les répétitions et les comportements automatiques. L'objectif est de transformer le fonctionnement du groupe pour libérer la personne.",
-        "indications": ["Problèmes relationnels", "Conflits de loyauté", "Schémas répétitifs", "Blocages systémiques"],
-        "methods": ["Approche systémique", "Génogramme", "Analyse des interactions", "Recadrage"]
-    },
-    "Thérapeute du sommeil": {
-        "category": "psychologie",
-        "short_description": "Spécialiste des troubles du sommeil et de l'insomnie",
-        "full_description": "Il évalue les habitudes de vie, l'anxiété, l'environnement et les rythmes biologiques. Il propose des techniques comme la TCC-i (thérapie du sommeil), la restructuration cognitive, relaxation, hygiène du sommeil. Très utile pour insomnies chroniques, réveils nocturnes, difficultés d'endormissement ou troubles du sommeil chez l'enfant.",
-        "indications": ["Insomnie chronique", "Réveils nocturnes", "Difficultés d'endormissement", "Troubles du sommeil enfant"],
-        "methods": ["TCC-i", "Restructuration cognitive", "Relaxation", "Hygiène du sommeil"]
-    },
-    "Psychomotricien": {
-        "category": "psychologie",
-        "short_description": "Spécialiste du développement psychomoteur et de l'équilibre corps-esprit",
-        "full_description": "Spécialiste du développement psychomoteur, il aide enfants et adultes à gérer leurs émotions, leur motricité, leur posture et leur équilibre psychocorporel. Il utilise des jeux, relaxations, exercices corporels… Très utile pour TDAH, dyspraxies, anxiété, troubles sensoriels.",
-        "indications": ["TDAH", "Dyspraxie", "Anxiété", "Troubles sensoriels", "Retard psychomoteur"],
-        "methods": ["Jeux psychomoteurs", "Relaxations", "Exercices corporels", "Graphomotricité"]
-    },
-    "Thérapeute ICV": {
-        "category": "psychologie",
-        "short_description": "Intégration du Cycle de Vie pour guérir les traumatismes",
-        "full_description": "L'ICV (Intégration du Cycle de Vie) permet de guérir les traumatismes en retraçant chronologiquement la vie du patient. Cette méthode répare les blessures du passé, renforce le sentiment de sécurité intérieur et apaise les mémoires traumatiques. Très efficace pour traumatismes précoces, anxiété, dissociation.",
-        "indications": ["Traumatismes précoces", "Anxiété", "Dissociation", "Troubles de l'attachement"],
-        "methods": ["ICV", "Ligne de temps", "Intégration progressive", "Ressourcement"]
-    },
-    "Somatic Experiencing": {
-        "category": "psychologie",
-        "short_description": "Thérapie corporelle pour décharger le trauma du système nerveux",
-        "full_description": "Thérapie corporelle basée sur le déchargement progressif du trauma stocké dans le système nerveux. Aide à sortir des états de stress post-traumatique, panique, sidération, tensions chroniques. Approche très efficace pour les traumas difficiles.",
-        "indications": ["PTSD", "Panique", "Sidération", "Tensions chroniques", "Trauma complexe"],
-        "methods": ["Somatic Experiencing", "Observation corporelle", "Décharge douce", "Titration"]
-    },
-    "Thérapie ACT": {
-        "category": "psychologie",
-        "short_description": "Acceptation et engagement vers ses valeurs profondes",
-        "full_description": "La thérapie ACT (Acceptance and Commitment Therapy) aide à accepter les émotions plutôt qu'à les combattre. Elle encourage à se reconnecter à ses valeurs profondes. Très utile pour anxiété, dépression, burn-out, troubles du comportement.",
-        "indications": ["Anxiété", "Dépression", "Burn-out", "Troubles du comportement", "Évitement émotionnel"],
-        "methods": ["ACT", "Défusion cognitive", "Clarification des valeurs", "Pleine conscience"]
-    },
-    "Thérapie narrative": {
-        "category": "psychologie",
-        "short_description": "Reformulation de son histoire personnelle pour se libérer",
-        "full_description": "Cette approche aide à se détacher de ses problèmes en reformulant son histoire personnelle. Elle renforce le sentiment de compétence, de liberté et d'identité.",
-        "indications": ["Problèmes d'identité", "Manque de confiance", "Histoire traumatique", "Sentiment d'impuissance"],
-        "methods": ["Externalisation", "Réécriture narrative", "Questions déconstruc", "Récits alternatifs"]
-    },
-    "Analyse transactionnelle": {
-        "category": "psychologie",
-        "short_description": "Compréhension des rôles et transformation des scénarios de vie",
-        "full_description": "Thérapie liée aux \"positions de vie\", aux rôles (Parent, Enfant, Adulte) et aux relations. Elle aide à comprendre et transformer les scénarios répétitifs de notre existence.",
-        "indications": ["Schémas répétitifs", "Problèmes relationnels", "Jeux psychologiques", "Scénarios de vie"],
-        "methods": ["Analyse transactionnelle", "États du Moi", "Scénarios", "Strokes"]
-    },
-    "Thérapie transgénérationnelle": {
-        "category": "psychologie",
-        "short_description": "Libération des héritages familiaux et loyautés invisibles",
-        "full_description": "Libère les héritages familiaux invisibles, les répétitions inconscientes, les dettes émotionnelles et les loyautés bloquantes. Très utile dans les dynamiques familiales toxiques.",
-        "indications": ["Héritages familiaux", "Répétitions", "Loyautés invisibles", "Secrets de famille"],
-        "methods": ["Génosociogramme", "Psychogénéalogie", "Constellations", "Travail transgénérationnel"]
-    },
-    "Thérapie sensorielle": {
-        "category": "psychologie",
-        "short_description": "Apaisement des émotions par les sens",
-        "full_description": "Utilise sons, couleurs, textures, odeurs, lumières pour apaiser les émotions. Idéale pour hypersensibilité, troubles sensoriels, stress et enfants neuro-atypiques.",
-        "indications": ["Hypersensibilité", "Troubles sensoriels", "Stress", "Neuro-atypie"],
-        "methods": ["Stimulation sensorielle", "Intégration sensorielle", "Salle Snoezelen", "Chromothérapie"]
-    },
-    "Thérapie désensibilisation phobies": {
-        "category": "psychologie",
-        "short_description": "Méthodes rapides pour apaiser durablement les phobies",
-        "full_description": "Méthodes rapides (TCC, hypnose, exposition progressive, EMDR) pour apaiser durablement les phobies : transport, animaux, avion, foule, claustrophobie…",
-        "indications": ["Phobies simples", "Phobie sociale", "Agoraphobie", "Claustrophobie", "Peur de l'avion"],
-        "methods": ["TCC", "Exposition progressive", "EMDR", "Hypnose", "Réalité virtuelle"]
-    }
-}
-
-def get_specialty_description(specialty_name):
-    """Retourne la description complète d'une spécialité"""
-    return SPECIALTIES_DESCRIPTIONS.get(specialty_name)
-
-def get_specialties_by_category(category_slug):
-    """Retourne toutes les spécialités d'une catégorie avec leurs descriptions"""
-    return {
-        name: desc for name, desc in SPECIALTIES_DESCRIPTIONS.items()
-        if desc.get("category") == category_slug
-    }
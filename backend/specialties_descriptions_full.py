@@ -1,231 +0,0 @@
-# Descriptions détaillées des spécialités TherapyCare
-# VERSION COMPLÈTE - 192 spécialités réparties en 11 catégories
-
-SPECIALTIES_DESCRIPTIONS = {
-    # CATÉGORIE 1 — PSYCHOLOGIE & PSYCHOTHÉRAPIE
-    "Psychologue": {
-        "category": "psychologie",
-        "short_description": "Professionnel diplômé spécialisé dans l'analyse du comportement humain et des émotions",
-        "full_description": "Le psychologue est un professionnel diplômé d'un Master universitaire en psychologie. Il est formé à l'analyse du comportement humain, des émotions, des mécanismes psychiques et des stratégies d'adaptation. À travers des entretiens, tests et bilans psychologiques, il identifie les difficultés (anxiété, dépression, phobies, burn-out, troubles du comportement...). Il accompagne ensuite la personne avec des outils adaptés pour améliorer sa santé mentale et sa qualité de vie.",
-        "indications": ["Anxiété", "Dépression", "Phobies", "Burn-out", "Troubles du comportement"],
-        "methods": ["Entretiens cliniques", "Tests psychologiques", "Bilans psychologiques", "Thérapies comportementales et cognitives"]
-    },
-    "Psychologue Clinicien": {
-        "category": "psychologie",
-        "short_description": "Spécialiste de la souffrance psychique profonde, formé à la psychopathologie",
-        "full_description": "Plus spécialisé, le psychologue clinicien travaille sur la souffrance psychique profonde. Formé à la psychopathologie, il intervient dans les troubles complexes : traumas, angoisses, dépression sévère, troubles de l'attachement, difficultés relationnelles. Il utilise des méthodes thérapeutiques spécifiques et propose un cadre rassurant structuré pour accompagner les patients dans la transformation de leurs difficultés.",
-        "indications": ["Traumas", "Angoisses", "Dépression sévère", "Troubles de l'attachement", "Difficultés relationnelles"],
-        "methods": ["Psychothérapie clinique", "Psychopathologie", "Cadre thérapeutique structuré"]
-    },
-    "Psychopraticien": {
-        "category": "psychologie",
-        "short_description": "Accompagne par des techniques de psychothérapie reconnues",
-        "full_description": "Le psychopraticien accompagne les personnes à travers des techniques de psychothérapie reconnues (humaniste, analytique, gestalt, intégrative...). Il aide à comprendre les blocages émotionnels, les schémas répétitifs, les traumatismes et les conflits internes. Sa mission est de permettre à chacun d'exprimer ses émotions, de retrouver ses ressources internes et d'avancer avec une meilleure connaissance de soi.",
-        "indications": ["Blocages émotionnels", "Schémas répétitifs", "Traumatismes", "Conflits internes"],
-        "methods": ["Approche humaniste", "Gestalt", "Thérapie analytique", "Thérapie intégrative"]
-    },
-    "Psychothérapeute": {
-        "category": "psychologie",
-        "short_description": "Traitement des troubles émotionnels et comportementaux en profondeur",
-        "full_description": "Professionnel du soin psychique, il utilise des méthodes validées scientifiquement (TCC, approche humaniste, systémie, analyse...). Son rôle est de traiter les troubles émotionnels, comportementaux ou relationnels en profondeur. Il accompagne la personne dans un processus structuré et progressif, visant à transformer durablement ses pensées, ses émotions et ses comportements.",
-        "indications": ["Troubles émotionnels", "Troubles comportementaux", "Troubles relationnels"],
-        "methods": ["TCC", "Approche humaniste", "Systémie", "Analyse"]
-    },
-    "Psychologue-Psychothérapeute": {
-        "category": "psychologie",
-        "short_description": "Double expertise : diagnostic scientifique et traitement thérapeutique",
-        "full_description": "Il cumule la rigueur scientifique du psychologue et l'expertise thérapeutique du psychothérapeute. Cette double formation lui permet de proposer un diagnostic précis et un traitement thérapeutique complet. Il accompagne les troubles variés : anxiété, trauma, phobies, dépression, troubles du comportement, estime de soi.",
-        "indications": ["Anxiété", "Trauma", "Phobies", "Dépression", "Troubles du comportement", "Estime de soi"],
-        "methods": ["Diagnostic psychologique", "Psychothérapie", "Approches intégratives"]
-    },
-    "Psychanalyste": {
-        "category": "psychologie",
-        "short_description": "Exploration en profondeur de l'inconscient à travers la parole",
-        "full_description": "Le psychanalyste propose une exploration en profondeur de l'inconscient à travers la parole. Il travaille sur les conflits internes, les répétitions, les schémas inconscients, les traumas anciens et les souffrances d'origine psychique. La psychanalyse aide à mieux se comprendre, à sortir de blocages ancrés et à gagner en liberté intérieure.",
-        "indications": ["Conflits internes", "Répétitions", "Schémas inconscients", "Traumas anciens", "Souffrances psychiques"],
-        "methods": ["Psychanalyse", "Libre association", "Analyse des rêves", "Transfert"]
-    },
-    "Neuropsychologue": {
-        "category": "psychologie",
-        "short_description": "Spécialiste du fonctionnement cérébral et des fonctions cognitives",
-        "full_description": "Spécialiste du fonctionnement cérébral, le neuropsychologue réalise des bilans cognitifs très précis : mémoire, attention, langage, raisonnement, impulsivité, fonctions exécutives. Il intervient dans les cas d'AVC, Alzheimer, TDAH, troubles DYS, traumatisme crânien... Il propose aussi des prises en charge de rééducation cognitive et conseille les familles.",
-        "indications": ["AVC", "Alzheimer", "TDAH", "Troubles DYS", "Traumatisme crânien"],
-        "methods": ["Bilans cognitifs", "Tests neuropsychologiques", "Rééducation cognitive", "Guidance familiale"]
-    },
-    "Thérapeute de couple": {
-        "category": "psychologie",
-        "short_description": "Accompagnement des couples dans les crises et conflits relationnels",
-        "full_description": "Accompagne les couples dans les crises, conflits, ruptures de communication, manque de désir ou difficultés relationnelles. Il aide chaque partenaire à exprimer ses besoins, comprendre ses émotions et améliorer la qualité du lien. L'objectif n'est pas seulement de \"réparer\", mais aussi d'apprendre à mieux fonctionner ensemble.",
-        "indications": ["Crises conjugales", "Conflits", "Rupture de communication", "Manque de désir", "Difficultés relationnelles"],
-        "methods": ["Thérapie systémique", "Communication non-violente", "Thérapie Imago", "Approche Gottman"]
-    },
-    "Thérapeute familial": {
-        "category": "psychologie",
-        "short_description": "Gestion des tensions et conflits au sein de la famille",
-        "full_description": "Il intervient auprès de l'ensemble de la famille pour gérer tensions, conflits, symptômes chez l'enfant ou adolescent, recomposition familiale. Son approche permet de restaurer la communication et de comprendre les rôles de chacun au sein du foyer.",
-        "indications": ["Tensions familiales", "Conflits", "Difficultés enfant/ado", "Recomposition familiale"],
-        "methods": ["Thérapie familiale systémique", "Approche contextuelle", "Sculpt familial"]
-    },
-    "Thérapeute systémique": {
-        "category": "psychologie",
-        "short_description": "Analyse des interactions et transformation du système relationnel",
-        "full_description": "Cette méthode imagine la personne comme un élément d'un système (famille, couple, travail). Le thérapeute analyse les interactions, les loyautés, les répétitions et les comportements automatiques. L'objectif est de transformer le fonctionnement du groupe pour libérer la personne.",
-        "indications": ["Problèmes relationnels", "Conflits de loyauté", "Schémas répétitifs", "Blocages systémiques"],
-        "methods": ["Approche systémique", "Génogramme", "Analyse des interactions", "Recadrage"]
-    },
-    "Thérapeute du sommeil": {
-        "category": "psychologie",
-        "short_description": "Spécialiste des troubles du sommeil et de l'insomnie",
-        "full_description": "Il évalue les habitudes de vie, l'anxiété, l'environnement et les rythmes biologiques. Il propose des techniques comme la TCC-i (thérapie du sommeil), la restructuration cognitive, relaxation, hygiène du sommeil. Très utile pour insomnies chroniques, réveils nocturnes, difficultés d'endormissement ou troubles du sommeil chez l'enfant.",
-        "indications": ["Insomnie chronique", "Réveils nocturnes", "Difficultés d'endormissement", "Troubles du sommeil enfant"],
-        "methods": ["TCC-i", "Restructuration cognitive", "Relaxation", "Hygiène du sommeil"]
-    },
-    "Psychomotricien": {
-        "category": "psychologie",
-        "short_description": "Spécialiste du développement psychomoteur et de l'équilibre corps-esprit",
-        "full_description": "Spécialiste du développement psychomoteur, il aide enfants et adultes à gérer leurs émotions, leur motricité, leur posture et leur équilibre psychocorporel. Il utilise des jeux, relaxations, exercices corporels... Très utile pour TDAH, dyspraxies, anxiété, troubles sensoriels.",
-        "indications": ["TDAH", "Dyspraxie", "Anxiété", "Troubles sensoriels", "Retard psychomoteur"],
-        "methods": ["Jeux psychomoteurs", "Relaxations", "Exercices corporels", "Graphomotricité"]
-    },
-    "Thérapeute ICV": {
-        "category": "psychologie",
-        "short_description": "Intégration du Cycle de Vie pour guérir les traumatismes",
-        "full_description": "L'ICV (Intégration du Cycle de Vie) permet de guérir les traumatismes en retraçant chronologiquement la vie du patient. Cette méthode répare les blessures du passé, renforce le sentiment de sécurité intérieur et apaise les mémoires traumatiques. Très efficace pour traumatismes précoces, anxiété, dissociation.",
-        "indications": ["Traumatismes précoces", "Anxiété", "Dissociation", "Troubles de l'attachement"],
-        "methods": ["ICV", "Ligne de temps", "Intégration progressive", "Ressourcement"]
-    },
-    "Somatic Experiencing": {
-        "category": "psychologie",
-        "short_description": "Thérapie corporelle pour décharger le trauma du système nerveux",
-        "full_description": "Thérapie corporelle basée sur le déchargement progressif du trauma stocké dans le système nerveux. Aide à sortir des états de stress post-traumatique, panique, sidération, tensions chroniques. Approche très efficace pour les traumas difficiles.",
-        "indications": ["PTSD", "Panique", "Sidération", "Tensions chroniques", "Trauma complexe"],
-        "methods": ["Somatic Experiencing", "Observation corporelle", "Décharge douce", "Titration"]
-    },
-    "Thérapie ACT": {
-        "category": "psychologie",
-        "short_description": "Acceptation et engagement vers ses valeurs profondes",
-        "full_description": "La thérapie ACT (Acceptance and Commitment Therapy) aide à accepter les émotions plutôt qu'à les combattre. Elle encourage à se reconnecter à ses valeurs profondes. Très utile pour anxiété, dépression, burn-out, troubles du comportement.",
-        "indications": ["Anxiété", "Dépression", "Burn-out", "Troubles du comportement", "Évitement émotionnel"],
-        "methods": ["ACT", "Défusion cognitive", "Clarification des valeurs", "Pleine conscience"]
-    },
-    "Thérapie narrative": {
-        "category": "psychologie",
-        "short_description": "Reformulation de son histoire personnelle pour se libérer",
-        "full_description": "Cette approche aide à se détacher de ses problèmes en reformulant son histoire personnelle. Elle renforce le sentiment de compétence, de liberté et d'identité.",
-        "indications": ["Problèmes d'identité", "Manque de confiance", "Histoire traumatique", "Sentiment d'impuissance"],
-        "methods": ["Externalisation", "Réécriture narrative", "Questions déconstructrices", "Récits alternatifs"]
-    },
-    "Analyse transactionnelle": {
-        "category": "psychologie",
-        "short_description": "Compréhension des rôles et transformation des scénarios de vie",
-        "full_description": "Thérapie liée aux \"positions de vie\", aux rôles (Parent, Enfant, Adulte) et aux relations. Elle aide à comprendre et transformer les scénarios répétitifs de notre existence.",
-        "indications": ["Schémas répétitifs", "Problèmes relationnels", "Jeux psychologiques", "Scénarios de vie"],
-        "methods": ["Analyse transactionnelle", "États du Moi", "Scénarios", "Strokes"]
-    },
-    "Thérapie transgénérationnelle": {
-        "category": "psychologie",
-        "short_description": "Libération des héritages familiaux et loyautés invisibles",
-        "full_description": "Libère les héritages familiaux invisibles, les répétitions inconscientes, les dettes émotionnelles et les loyautés bloquantes. Très utile dans les dynamiques familiales toxiques.",
-        "indications": ["Héritages familiaux", "Répétitions", "Loyautés invisibles", "Secrets de famille"],
-        "methods": ["Génosociogramme", "Psychogénéalogie", "Constellations", "Travail transgénérationnel"]
-    },
-    "Thérapie sensorielle": {
-        "category": "psychologie",
-        "short_description": "Apaisement des émotions par les sens",
-        "full_description": "Utilise sons, couleurs, textures, odeurs, lumières pour apaiser les émotions. Idéale pour hypersensibilité, troubles sensoriels, stress et enfants neuro-atypiques.",
-        "indications": ["Hypersensibilité", "Troubles sensoriels", "Stress", "Neuro-atypie"],
-        "methods": ["Stimulation sensorielle", "Intégration sensorielle", "Salle Snoezelen", "Chromothérapie"]
-    },
-    "Désensibilisation phobies": {
-        "category": "psychologie",
-        "short_description": "Méthodes rapides pour apaiser durablement les phobies",
-        "full_description": "Méthodes rapides (TCC, hypnose, exposition progressive, EMDR) pour apaiser durablement les phobies : transport, animaux, avion, foule, claustrophobie...",
-        "indications": ["Phobies simples", "Phobie sociale", "Agoraphobie", "Claustrophobie", "Peur de l'avion"],
-        "methods": ["TCC", "Exposition progressive", "EMDR", "Hypnose", "Réalité virtuelle"]
-    },
-
-    # CATÉGORIE 2 — HYPNOSE & THÉRAPIES BRÈVES
-    "Hypnothérapeute": {
-        "category": "hypnose",
-        "short_description": "Accompagne par l'hypnose pour gérer stress, tabac et anxiété",
-        "full_description": "L'hypnothérapeute accompagne la personne en utilisant l'hypnose, un état de conscience modifié permettant d'accéder aux ressources internes. Cette méthode est particulièrement efficace pour gérer le stress, arrêter le tabac, diminuer l'anxiété, améliorer le sommeil ou travailler sur la confiance en soi. En modifiant les automatismes et les croyances profondes, l'hypnothérapie permet un changement durable et naturel.",
-        "indications": ["Stress", "Tabagisme", "Anxiété", "Troubles du sommeil", "Confiance en soi"],
-        "methods": ["Hypnose Ericksonienne", "Hypnose classique", "Hypnose humaniste"]
-    },
-    "Praticien en Hypnose": {
-        "category": "hypnose",
-        "short_description": "Techniques d'hypnose pour transformations rapides",
-        "full_description": "Le praticien en hypnose utilise des techniques d'hypnose Ericksonienne, humaniste ou classique pour provoquer des transformations rapides. Il aide à dépasser blocages, peurs, douleurs ou traumatismes légers en amenant le patient dans un état de détente consciente. Les séances sont personnalisées en fonction des objectifs (stress, minceur, tabagisme, gestion émotionnelle).",
-        "indications": ["Blocages", "Peurs", "Douleurs", "Traumatismes légers", "Gestion émotionnelle"],
-        "methods": ["Hypnose Ericksonienne", "Hypnose humaniste", "Hypnose classique"]
-    },
-    "Praticien EMDR": {
-        "category": "hypnose",
-        "short_description": "Thérapie pour traiter les traumatismes par stimulations bilatérales",
-        "full_description": "L'EMDR est une thérapie reconnue scientifiquement pour traiter les traumatismes, chocs émotionnels, phobies et anxiété. Elle utilise des stimulations bilatérales (mouvements oculaires, sons, tapotements) pour aider le cerveau à retraiter les souvenirs traumatiques. Les résultats sont souvent rapides et impressionnants, même dans des cas profondément ancrés.",
-        "indications": ["Traumatismes", "Chocs émotionnels", "Phobies", "Anxiété", "Stress post-traumatique"],
-        "methods": ["EMDR", "Stimulations bilatérales", "Retraitement des souvenirs"]
-    },
-    "Praticien EFT": {
-        "category": "hypnose",
-        "short_description": "Libération émotionnelle par tapotements sur points énergétiques",
-        "full_description": "L'EFT combine psychologie et stimulation de points énergétiques (tapotements) pour libérer les émotions négatives. Cette méthode agit sur les blocages liés au stress, aux peurs, à la colère, aux traumatismes légers ou à la confiance en soi. Les séances peuvent être très efficaces en quelques minutes seulement.",
-        "indications": ["Stress", "Peurs", "Colère", "Traumatismes légers", "Confiance en soi"],
-        "methods": ["EFT", "Tapotements", "Stimulation de points énergétiques"]
-    },
-    "Praticien en Thérapies Brèves": {
-        "category": "hypnose",
-        "short_description": "Résolution rapide de problèmes spécifiques",
-        "full_description": "Les thérapies brèves visent à résoudre un problème spécifique en un nombre limité de séances. Basées sur l'efficacité et la rapidité, elles se concentrent sur le présent et les solutions plutôt que sur l'analyse du passé. Elles sont idéales pour les personnes souhaitant des résultats rapides : phobies, stress, émotions, conflits, comportements.",
-        "indications": ["Phobies", "Stress", "Émotions", "Conflits", "Comportements"],
-        "methods": ["PNL", "Hypnose", "TCC", "Approche systémique"]
-    },
-    "Praticien PNL": {
-        "category": "hypnose",
-        "short_description": "Reprogrammation des schémas de pensées négatifs",
-        "full_description": "La PNL explore la manière dont le cerveau fonctionne, perçoit, réagit et crée ses habitudes. Elle permet de reprogrammer les schémas de pensées négatifs, de développer de nouvelles ressources mentales et d'améliorer la communication. Très utilisée dans les domaines du bien-être, du coaching, de la performance ou de la confiance en soi.",
-        "indications": ["Schémas de pensées négatifs", "Communication", "Confiance en soi", "Performance"],
-        "methods": ["PNL", "Reprogrammation mentale", "Techniques de communication"]
-    },
-    "Praticien en Respiration Holotropique": {
-        "category": "hypnose",
-        "short_description": "Transformation intérieure par respiration amplifiée",
-        "full_description": "La respiration holotropique est une technique puissante de transformation intérieure basée sur une respiration amplifiée. Elle permet de libérer les traumatismes, d'accéder à des états modifiés de conscience et de reconnecter des parties profondes de soi. Cette méthode aide à comprendre les émotions refoulées, apaiser l'anxiété et obtenir des prises de conscience majeures.",
-        "indications": ["Traumatismes", "Émotions refoulées", "Anxiété", "Prises de conscience"],
-        "methods": ["Respiration holotropique", "États modifiés de conscience"]
-    },
-    "Praticien Rebirth": {
-        "category": "hypnose",
-        "short_description": "Respiration circulaire pour libérer tensions émotionnelles",
-        "full_description": "Le Rebirth utilise une respiration circulaire consciente pour libérer les tensions émotionnelles et somatiques. Il permet d'accéder à des mémoires enfouies, de nettoyer le stress accumulé et de retrouver une sensation de calme profond. Très favorable à la libération des blocages liés à l'enfance ou aux schémas répétitifs.",
-        "indications": ["Tensions émotionnelles", "Blocages enfance", "Schémas répétitifs", "Stress accumulé"],
-        "methods": ["Rebirth", "Respiration circulaire consciente"]
-    },
-    "Praticien en Cohérence Cardiaque": {
-        "category": "hypnose",
-        "short_description": "Régulation du système nerveux par la respiration",
-        "full_description": "La cohérence cardiaque est une méthode de respiration simple et efficace pour réguler le système nerveux. Elle réduit le stress, améliore le sommeil, diminue l'anxiété et renforce la clarté mentale. Le praticien enseigne les bonnes techniques, adapte les exercices et suit l'évolution du patient.",
-        "indications": ["Stress", "Anxiété", "Troubles du sommeil", "Clarté mentale"],
-        "methods": ["Cohérence cardiaque", "Respiration contrôlée"]
-    },
-    "Thérapeute en Approche Solutionniste": {
-        "category": "hypnose",
-        "short_description": "Focus sur les ressources et solutions existantes",
-        "full_description": "Cette approche vise à se concentrer sur ce qui fonctionne déjà plutôt que sur les problèmes. Le thérapeute aide à identifier les ressources internes, les réussites passées et les leviers de changement. Elle est courte, efficace et particulièrement utile pour les personnes qui veulent avancer sans se perdre dans les explications.",
-        "indications": ["Avancement rapide", "Identification des ressources", "Solutions"],
-        "methods": ["Approche solutionniste", "Identification des ressources"]
-    },
-    "Thérapeute Orienté Objectifs": {
-        "category": "hypnose",
-        "short_description": "Changements rapides centrés sur des objectifs précis",
-        "full_description": "Spécialiste des changements rapides centrés sur des objectifs précis : arrêter une addiction, perdre du poids, gérer une émotion, préparer un examen. Il utilise des méthodes brèves et mesurables. Cette approche est très adaptée aux personnes qui souhaitent progresser efficacement.",
-        "indications": ["Addictions", "Perte de poids", "Gestion des émotions", "Préparation d'examens"],
-        "methods": ["Méthodes brèves", "Approche par objectifs"]
-    },
-    "Thérapeute Stratégique": {
-        "category": "hypnose",
-        "short_description": "Analyse et rupture des schémas répétitifs",
-        "full_description": "Il analyse le fonctionnement du problème et propose des solutions concrètes pour rompre les schémas répétitifs. Très utilisée pour les phobies, tocs, blocages familiaux et comportements automatiques.",
-        "indications": ["Phobies", "TOCs", "Blocages familiaux", "Comportements automatiques"],
-        "methods": ["Analyse stratégique", "Solutions concrètes"]
-    },
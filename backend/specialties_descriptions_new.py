@@ -1,12 +0,0 @@
-# Descriptions détaillées des spécialités TherapyCare
-# VERSION COMPLÈTE - 192 spécialités
-
-SPECIALTIES_DESCRIPTIONS = {
-    # CATÉGORIE 1 — PSYCHOLOGIE & PSYCHOTHÉRAPIE
-    "Psychologue": {
-        "category": "psychologie",
-        "short_description": "Professionnel diplômé spécialisé dans l'analyse du comportement humain et des émotions",
-        "full_description": "Le psychologue est un professionnel diplômé d'un Master universitaire en psychologie. Il est formé à l'analyse du comportement humain, des émotions, des mécanismes psychiques et des stratégies d'adaptation. À travers des entretiens, tests et bilans psychologiques, il identifie les difficultés (anxiété, dépression, phobies, burn-out, troubles du comportement...). Il accompagne ensuite la personne avec des outils adaptés pour améliorer sa santé mentale et sa qualité de vie.",
-        "indications": ["Anxiété", "Dépression", "Phobies", "Burn-out", "Troubles du comportement"],
-        "methods": ["Entretiens cliniques", "Tests psychologiques", "Bilans psychologiques", "Thérapies comportementales et cognitives"]
-    },
@@ -0,0 +1,102 @@
+# Autocomplétion des spécialités : trie de préfixes construit une fois à
+# l'import depuis le catalogue, avec le classement précalculé à chaque nœud.
+
+from catalog import categories, specialty_descriptions
+from normalize import tokenize
+
+MAX_SUGGESTIONS = 10
+
+# Lower ranks first: specialties, then indications, then methods
+TYPE_RANKS = {"specialty": 0, "indication": 1, "method": 2}
+
+
+class SuggestionTrie:
+    """Prefix trie over accent-folded labels.
+
+    Every word start of a label is indexed, so "couple" suggests
+    "Thérapeute de couple". Each node keeps its best MAX_SUGGESTIONS entries,
+    making a lookup O(len(query)) regardless of catalog size.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self._root = ({}, [])
+
+    def add(self, entry):
+        index = len(self.entries)
+        self.entries.append(entry)
+        tokens = tokenize(entry["label"])
+        for position in range(len(tokens)):
+            rank = (TYPE_RANKS[entry["type"]], position > 0, len(entry["label"]), entry["label"])
+            self._insert(" ".join(tokens[position:]), rank, index)
+
+    def _insert(self, key, rank, index):
+        node = self._root
+        for char in key:
+            children, top = node
+            node = children.setdefault(char, ({}, []))
+            self._offer(node[1], rank, index)
+
+    @staticmethod
+    def _offer(top, rank, index):
+        for i, (existing_rank, existing_index) in enumerate(top):
+            if existing_index == index:
+                if rank >= existing_rank:
+                    return
+                del top[i]
+                break
+        top.append((rank, index))
+        top.sort()
+        del top[MAX_SUGGESTIONS:]
+
+    def suggest(self, query, limit=MAX_SUGGESTIONS):
+        key = " ".join(tokenize(query))
+        if not key:
+            return []
+        node = self._root
+        for char in key:
+            node = node[0].get(char)
+            if node is None:
+                return []
+        return [self.entries[index] for _, index in node[1][:limit]]
+
+
+def _specialty_info(name, category_slug):
+    category = categories().get(category_slug, {})
+    return {"name": name, "category_slug": category_slug, "category_name": category.get("name", "")}
+
+
+def build_trie():
+    trie = SuggestionTrie()
+
+    seen = set()
+    for category_slug, category in categories().items():
+        for specialty in category["specialties"]:
+            if specialty in seen:
+                continue
+            seen.add(specialty)
+            trie.add({
+                "label": specialty,
+                "type": "specialty",
+                "specialties": [_specialty_info(specialty, category_slug)]
+            })
+
+    # Indications and methods point to every specialty that lists them
+    related = {"indication": {}, "method": {}}
+    for name, description in specialty_descriptions().items():
+        info = _specialty_info(name, description.get("category", ""))
+        for kind, field in (("indication", "indications"), ("method", "methods")):
+            for label in description.get(field, []):
+                related[kind].setdefault(label, []).append(info)
+    for kind, labels in related.items():
+        for label, specialties in labels.items():
+            trie.add({"label": label, "type": kind, "specialties": specialties})
+
+    return trie
+
+
+SPECIALTY_TRIE = build_trie()
+
+
+def suggest_specialties(query, limit=MAX_SUGGESTIONS):
+    return SPECIALTY_TRIE.suggest(query, limit)
@@ -1,7 +1,7 @@
 import requests
 import sys
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 
 class TherapyCareAPITester:
     def __init__(self, base_url="https://care-providers.preview.emergentagent.com"):
@@ -9,11 +9,14 @@ class TherapyCareAPITester:
         self.api_url = f"{base_url}/api"
         self.token = None
         self.practitioner_id = None
+        self.practitioner_name = None
         self.patient_id = None
+        self.patient_email = None
         self.appointment_id = None
         self.tests_run = 0
         self.tests_passed = 0
         self.test_results = []
+        self.last_response = None
 
     def log_test(self, name, success, details=""):
         """Log test result"""
@@ -52,6 +55,7 @@ class TherapyCareAPITester:
             elif method == 'DELETE':
                 response = requests.delete(url, headers=test_headers, timeout=10)
 
+            self.last_response = response
             success = response.status_code == expected_status
             
             if success:
@@ -96,6 +100,7 @@ class TherapyCareAPITester:
         if success and 'token' in response:
             self.token = response['token']
             self.practitioner_id = response['practitioner']['id']
+            self.practitioner_name = test_data['full_name']
             return True
         return False
 
@@ -217,6 +222,23 @@ class TherapyCareAPITester:
         
         return success and response.get('description') == update_data['description']
 
+    def test_practitioner_slots(self):
+        """Test free slots computed from the schedule set in test_update_profile"""
+        if not self.practitioner_id:
+            return False
+            
+        today = datetime.now().date()
+        saturday = today + timedelta(days=(5 - today.weekday()) % 7 + 7)
+        success, response = self.run_test(
+            "Get Practitioner Free Slots",
+            "GET",
+            f"public/practitioner/{self.practitioner_id}/slots?from={saturday}&to={saturday}",
+            200
+        )
+        
+        # "Sam 9h-13h": four one-hour slots
+        return success and [slot['time'] for slot in response] == ["09:00", "10:00", "11:00", "12:00"]
+
     def test_public_profile(self):
         """Test getting public practitioner profile"""
         if not self.practitioner_id:
@@ -242,6 +264,195 @@ class TherapyCareAPITester:
         
         return success
 
+    def test_public_search_pagination(self):
+        """Test cursor pagination of the public practitioner search"""
+        success, first_page = self.run_test(
+            "Public Search First Page",
+            "GET",
+            "public/practitioners?sort_by=name&limit=1",
+            200
+        )
+        if not success or len(first_page) > 1:
+            return False
+        
+        cursor = self.last_response.headers.get('X-Next-Cursor')
+        if not cursor:
+            return True  # a single practitioner in the directory
+        
+        success, second_page = self.run_test(
+            "Public Search Next Page",
+            "GET",
+            f"public/practitioners?sort_by=name&limit=1&cursor={cursor}",
+            200
+        )
+        return success and all(p['id'] != first_page[0]['id'] for p in second_page)
+
+    def test_invalid_search_cursor(self):
+        """Test that a malformed cursor is rejected"""
+        success, _ = self.run_test(
+            "Public Search Invalid Cursor (Should Fail)",
+            "GET",
+            "public/practitioners?cursor=not-a-cursor",
+            400
+        )
+        return success
+
+    def test_accent_insensitive_search(self):
+        """Test that the search ignores accents and case"""
+        success, with_accent = self.run_test(
+            "Public Search With Accent",
+            "GET",
+            "public/practitioners?specialty=Thérapeute",
+            200
+        )
+        if not success:
+            return False
+        
+        success, without_accent = self.run_test(
+            "Public Search Without Accent",
+            "GET",
+            "public/practitioners?specialty=therapeute",
+            200
+        )
+        return success and [p['id'] for p in with_accent] == [p['id'] for p in without_accent]
+
+    def test_near_search(self):
+        """Test distance-sorted search around Paris"""
+        success, response = self.run_test(
+            "Public Search Near Paris",
+            "GET",
+            "public/practitioners/near?lat=48.8566&lon=2.3522&radius_km=20",
+            200
+        )
+        distances = [p['distance_km'] for p in response] if success else []
+        return success and distances == sorted(distances) and all(d <= 20 for d in distances)
+
+    def test_available_search(self):
+        """Test that the search keeps practitioners with a free slot in the window"""
+        if not self.practitioner_name:
+            return False
+            
+        today = datetime.now().date()
+        saturday = today + timedelta(days=(5 - today.weekday()) % 7 + 7)
+        name = requests.utils.quote(self.practitioner_name)
+        success, open_day = self.run_test(
+            "Public Search Available On Saturday",
+            "GET",
+            f"public/practitioners?q={name}&available_from={saturday}&available_to={saturday}",
+            200
+        )
+        if not success:
+            return False
+        
+        # "Sam 9h-13h" leaves no 5-hour slot
+        success, too_long = self.run_test(
+            "Public Search Available For 5 Hours",
+            "GET",
+            f"public/practitioners?q={name}&available_from={saturday}&available_to={saturday}&min_duration=300",
+            200
+        )
+        return (success and self.practitioner_id in [p['id'] for p in open_day]
+                and self.practitioner_id not in [p['id'] for p in too_long])
+
+    def test_practitioner_review(self):
+        """Test that a client review updates the practitioner's rating"""
+        if not self.practitioner_id:
+            return False
+            
+        timestamp = datetime.now().strftime('%H%M%S')
+        success, response = self.run_test(
+            "Client Registration",
+            "POST",
+            "auth/register/client",
+            200,
+            data={
+                "full_name": f"Client Test {timestamp}",
+                "email": f"test.client.{timestamp}@example.com",
+                "password": "TestPassword123!"
+            }
+        )
+        if not success:
+            return False
+        client_headers = {'Authorization': f"Bearer {response['token']}"}
+        
+        endpoint = f"public/practitioner/{self.practitioner_id}/reviews"
+        success, _ = self.run_test(
+            "Post Review", "POST", endpoint, 200,
+            data={"score": 4, "text": "Très à l'écoute"}, headers=client_headers
+        )
+        if not success:
+            return False
+        
+        success, _ = self.run_test(
+            "Post Second Review (Should Fail)", "POST", endpoint, 400,
+            data={"score": 1}, headers=client_headers
+        )
+        if not success:
+            return False
+        
+        success, reviews = self.run_test("List Reviews", "GET", endpoint, 200)
+        if not success or [r['score'] for r in reviews] != [4]:
+            return False
+        
+        success, practitioner = self.run_test(
+            "Get Rated Practitioner", "GET", f"public/practitioner/{self.practitioner_id}", 200
+        )
+        return success and practitioner['rating'] == 4 and practitioner['reviews_count'] == 1
+
+    def test_specialty_suggest(self):
+        """Test specialty autocomplete"""
+        success, response = self.run_test(
+            "Specialty Suggestions",
+            "GET",
+            "specialties/suggest?q=psycho",
+            200
+        )
+        return success and len(response) > 0 and response[0]['type'] == 'specialty'
+
+    def test_catalog_etag(self):
+        """Test that catalog responses are revalidated with ETag / 304"""
+        success, _ = self.run_test(
+            "Get Categories",
+            "GET",
+            "categories",
+            200
+        )
+        etag = self.last_response.headers.get('ETag') if success else None
+        if not etag:
+            return False
+        
+        success, _ = self.run_test(
+            "Get Categories Not Modified",
+            "GET",
+            "categories",
+            304,
+            headers={'If-None-Match': etag}
+        )
+        return success
+
+    def test_category_specialties(self):
+        """Test the per-category specialty descriptions"""
+        success, response = self.run_test(
+            "Get Category Specialties",
+            "GET",
+            "categories/psychologie/specialties",
+            200
+        )
+        return success and all(d['category'] == 'psychologie' for d in response.values())
+
+    def test_registration_sets_category(self):
+        """Test that registering with a catalog specialty stamps its category"""
+        if not self.practitioner_id:
+            return False
+        
+        success, response = self.run_test(
+            "Registered Practitioner Category",
+            "GET",
+            f"public/practitioner/{self.practitioner_id}",
+            200
+        )
+        return success and response.get('category') == 'psychologie'
+
     def test_create_patient(self):
         """Test creating a patient"""
         if not self.token:
@@ -264,9 +475,34 @@ class TherapyCareAPITester:
         
         if success and 'id' in response:
             self.patient_id = response['id']
+            self.patient_email = patient_data['email']
             return True
         return False
 
+    def test_import_patients(self):
+        """Test bulk patient import with case-insensitive duplicates and an invalid row"""
+        if not self.token or not self.patient_id:
+            return False
+            
+        timestamp = datetime.now().strftime('%H%M%S')
+        rows = [
+            {"full_name": f"Import {timestamp}", "email": f"import.{timestamp}@example.com", "phone": "0600000000"},
+            {"full_name": "Doublon", "email": self.patient_email, "phone": "0600000000"},
+            {"full_name": "Doublon majuscules", "email": self.patient_email.upper(), "phone": "0600000000"},
+            {"full_name": "Sans email", "phone": "0600000000"},
+        ]
+        
+        success, response = self.run_test(
+            "Bulk Import Patients",
+            "POST",
+            "patients/import",
+            200,
+            data=rows
+        )
+        
+        statuses = [row.get('status') for row in response.get('rows', [])]
+        return success and statuses == ["created", "duplicate", "duplicate", "invalid"]
+
     def test_get_patients(self):
         """Test getting patients list"""
         if not self.token:
@@ -305,9 +541,32 @@ class TherapyCareAPITester:
         
         if success and 'id' in response:
             self.appointment_id = response['id']
-            return True
+            # Stored in UTC from the practitioner's timezone (Europe/Paris by default)
+            return response.get('start_at') == "2024-12-25T13:30:00Z"
         return False
 
+    def test_conflicting_appointment(self):
+        """Test that an overlapping booking is rejected with 409"""
+        if not self.token or not self.appointment_id:
+            return False
+            
+        success, _ = self.run_test(
+            "Overlapping Appointment (Should Conflict)",
+            "POST",
+            "appointments",
+            409,
+            data={
+                "patient_id": self.patient_id,
+                "patient_name": "Jean Martin Test",
+                "date": "2024-12-25",
+                "time": "15:00",
+                "duration": 30
+            }
+        )
+        
+        conflicts = self.last_response.json().get('detail', {}).get('conflicts', []) if success else []
+        return success and any(c['id'] == self.appointment_id for c in conflicts)
+
     def test_get_appointments(self):
         """Test getting appointments list"""
         if not self.token:
@@ -322,6 +581,142 @@ class TherapyCareAPITester:
         
         return success and isinstance(response, list)
 
+    def test_get_appointments_window(self):
+        """Test the from/to window of the appointments list (inclusive, YYYY-MM-DD)"""
+        if not self.token or not self.appointment_id:
+            return False
+        
+        success, inside = self.run_test(
+            "Get Appointments (window)",
+            "GET",
+            "appointments?from=2024-12-25&to=2024-12-25",
+            200
+        )
+        listed = success and self.appointment_id in [a['id'] for a in inside]
+        in_window = success and all(a['date'] == "2024-12-25" for a in inside)
+        self.log_test("Appointments Window Bounds", listed and in_window,
+                      f"{len(inside) if success else 0} appointment(s), created one {'listed' if listed else 'missing'}")
+        
+        success, outside = self.run_test(
+            "Get Appointments (window without it)",
+            "GET",
+            "appointments?from=2024-12-26&to=2024-12-31",
+            200
+        )
+        excluded = success and self.appointment_id not in [a['id'] for a in outside]
+        self.log_test("Appointments Window Excludes Others", excluded,
+                      "Appointment outside the window not listed" if excluded else "Appointment listed")
+        
+        invalid, _ = self.run_test(
+            "Get Appointments (invalid window)",
+            "GET",
+            "appointments?from=25/12/2024",
+            400
+        )
+        return listed and in_window and excluded and invalid
+
+    def test_patient_history(self):
+        """Test a patient's appointment history and the summary in the patient list"""
+        if not self.patient_id or not self.appointment_id:
+            return False
+            
+        success, history = self.run_test(
+            "Get Patient Appointments",
+            "GET",
+            f"patients/{self.patient_id}/appointments",
+            200
+        )
+        if not success or self.appointment_id not in [a['id'] for a in history]:
+            return False
+        
+        success, patients = self.run_test("Get Patients With History", "GET", "patients", 200)
+        summary = next((p for p in patients if p['id'] == self.patient_id), None) if success else None
+        return summary is not None and summary['appointments_count'] == len(history)
+
+    def test_export_patients(self):
+        """Test streaming the patient history as NDJSON"""
+        if not self.token or not self.patient_id:
+            return False
+            
+        self.run_test(
+            "Export Patients (NDJSON)",
+            "GET",
+            "patients/export?format=ndjson",
+            200
+        )
+        
+        lines = self.last_response.text.splitlines()
+        ids = [json.loads(line)['id'] for line in lines if line]
+        return self.patient_id in ids
+
+    def test_export_appointments_csv(self):
+        """Test streaming appointments as CSV with a date range"""
+        if not self.token or not self.appointment_id:
+            return False
+            
+        success, _ = self.run_test(
+            "Export Appointments (CSV, date range)",
+            "GET",
+            "appointments/export?format=csv&from=2024-12-01&to=2024-12-31",
+            200
+        )
+        
+        rows = self.last_response.text.splitlines()
+        return success and rows[0].startswith("id,") and any(self.appointment_id in row for row in rows[1:])
+
+    def test_appointment_series(self):
+        """Test creating a weekly series, rejecting an overlapping one, then cancelling it"""
+        if not self.token or not self.patient_id:
+            return False
+            
+        series_data = {
+            "patient_id": self.patient_id,
+            "patient_name": "Jean Martin Test",
+            "date": "2025-01-06",
+            "time": "09:00",
+            "duration": 50,
+            "frequency": "weekly",
+            "count": 4,
+            "skip_dates": ["2025-01-13"]
+        }
+        
+        success, response = self.run_test(
+            "Create Appointment Series",
+            "POST",
+            "appointments/series",
+            200,
+            data=series_data
+        )
+        if not success or [a['date'] for a in response] != ["2025-01-06", "2025-01-20", "2025-01-27"]:
+            return False
+        series_id = response[0]['series_id']
+        
+        overlap, _ = self.run_test(
+            "Overlapping Series (Should Conflict)",
+            "POST",
+            "appointments/series",
+            409,
+            data={**series_data, "time": "09:30", "count": 2, "skip_dates": []}
+        )
+        
+        deleted, response = self.run_test(
+            "Cancel Series (this and following)",
+            "DELETE",
+            f"appointments/series/{series_id}?scope=following&from_date=2025-01-20",
+            200
+        )
+        
+        following_deleted = deleted and response.get('deleted') == 2
+        
+        deleted, response = self.run_test(
+            "Cancel Series (all remaining)",
+            "DELETE",
+            f"appointments/series/{series_id}",
+            200
+        )
+        
+        return overlap and following_deleted and deleted and response.get('deleted') == 1
+
     def test_delete_appointment(self):
         """Test deleting an appointment"""
         if not self.token or not self.appointment_id:
@@ -336,6 +731,88 @@ class TherapyCareAPITester:
         
         return success
 
+    def test_statistics(self):
+        """Test that /stats follows appointment and patient creations and deletions"""
+        if not self.token:
+            return False
+        
+        # Day counters are keyed on the appointment's date, compared to today in UTC
+        today = datetime.utcnow().strftime('%Y-%m-%d')
+        counters = ["total_appointments", "total_patients", "upcoming_appointments",
+                    "appointments_this_week", "appointments_this_month", "appointments_this_year"]
+        
+        def stats(label):
+            success, response = self.run_test(f"Get Stats ({label})", "GET", "stats", 200)
+            return response if success else None
+        
+        def day_count(response):
+            return next((d['count'] for d in response['appointments_by_day'] if d['date'] == today), 0)
+        
+        def check(name, before, after, deltas, day_delta=0):
+            expected = {field: before[field] + deltas.get(field, 0) for field in counters}
+            actual = {field: after[field] for field in counters}
+            wrong = [f"{field} {actual[field]} != {expected[field]}"
+                     for field in counters if actual[field] != expected[field]]
+            if day_count(after) != day_count(before) + day_delta:
+                wrong.append(f"appointments_by_day[{today}] {day_count(after)} != {day_count(before) + day_delta}")
+            self.log_test(name, not wrong, "; ".join(wrong) or "Counters as expected")
+            return not wrong
+        
+        before = stats("before")
+        if before is None:
+            return False
+        
+        timestamp = datetime.now().strftime('%H%M%S')
+        success, patient = self.run_test(
+            "Create Patient (Stats)",
+            "POST",
+            "patients",
+            200,
+            data={"full_name": f"Stats {timestamp}", "email": f"stats.{timestamp}@example.com", "phone": "0600000000"}
+        )
+        after_patient = stats("patient created") if success else None
+        if after_patient is None:
+            return False
+        ok = check("Stats Count Created Patient", before, after_patient, {"total_patients": 1})
+        
+        success, appointment = self.run_test(
+            "Create Appointment (Stats)",
+            "POST",
+            "appointments",
+            200,
+            data={"patient_id": patient['id'], "patient_name": patient['full_name'],
+                  "date": today, "time": "23:00", "duration": 30}
+        )
+        after_appointment = stats("appointment created") if success else None
+        if after_appointment is None:
+            return False
+        ok &= check("Stats Count Created Appointment", after_patient, after_appointment, {
+            "total_appointments": 1, "upcoming_appointments": 1, "appointments_this_week": 1,
+            "appointments_this_month": 1, "appointments_this_year": 1,
+        }, day_delta=1)
+        # The practitioner's first five appointments, in creation order
+        recent_ids = [a['id'] for a in after_appointment['recent_appointments']]
+        listed = appointment['id'] in recent_ids
+        expect_listed = len(after_patient['recent_appointments']) < 5
+        self.log_test("Stats Recent Appointments", listed == expect_listed,
+                      f"new appointment {'listed' if listed else 'not listed'} among {len(recent_ids)}")
+        ok &= listed == expect_listed
+        
+        success, _ = self.run_test("Delete Appointment (Stats)", "DELETE", f"appointments/{appointment['id']}", 200)
+        after_delete = stats("appointment deleted") if success else None
+        if after_delete is None:
+            return False
+        ok &= check("Stats Count Deleted Appointment", after_patient, after_delete, {})
+        gone = appointment['id'] not in [a['id'] for a in after_delete['recent_appointments']]
+        self.log_test("Stats Recent Without Deleted", gone, "Deleted appointment not listed" if gone else "Still listed")
+        ok &= gone
+        
+        success, _ = self.run_test("Delete Patient (Stats)", "DELETE", f"patients/{patient['id']}", 200)
+        after_patient_delete = stats("patient deleted") if success else None
+        if after_patient_delete is None:
+            return False
+        return check("Stats Count Deleted Patient", before, after_patient_delete, {}) and ok
+
     def test_unauthorized_access(self):
         """Test accessing protected routes without token"""
         # Temporarily remove token
@@ -353,6 +830,102 @@ class TherapyCareAPITester:
         self.token = original_token
         return success
 
+    def test_mongo_round_trips(self):
+        """Test the MongoDB commands sent by the write endpoints.
+        
+        Counted by the server only when started with COUNT_MONGO_ROUND_TRIPS=1,
+        e.g. `COUNT_MONGO_ROUND_TRIPS=1 uvicorn server:app --port 8001` then
+        `python backend_test.py http://localhost:8001`; the test fails when the
+        X-Mongo-Round-Trips header is missing. Practitioner requests may add
+        one lookup when the worker's identity cache is cold.
+        """
+        if not self.token or not self.practitioner_id:
+            return False
+            
+        timestamp = datetime.now().strftime('%H%M%S%f')
+        practitioner = {
+            "full_name": f"Dr. Round Trips {timestamp}",
+            "email": f"round.trips.{timestamp}@example.com",
+            "specialty": "Psychologue",
+            "password": "TestPassword123!"
+        }
+        client = {
+            "full_name": f"Client Round Trips {timestamp}",
+            "email": f"round.trips.client.{timestamp}@example.com",
+            "password": "TestPassword123!"
+        }
+        patient = {
+            "full_name": f"Patient Round Trips {timestamp}",
+            "email": f"round.trips.patient.{timestamp}@example.com",
+            "phone": "06 12 34 56 78"
+        }
+        
+        def check(name, method, endpoint, expected_status, data, commands, authenticated, headers=None):
+            success, response = self.run_test(f"{name} (Round Trips)", method, endpoint, expected_status,
+                                              data=data, headers=headers)
+            if not success:
+                return False, response
+            count = self.last_response.headers.get('X-Mongo-Round-Trips')
+            if count is None:
+                self.log_test(f"{name} Round Trips", False,
+                              "X-Mongo-Round-Trips missing: start the server with COUNT_MONGO_ROUND_TRIPS=1")
+                return False, response
+            allowed = (commands, commands + 1) if authenticated else (commands,)
+            passed = int(count) in allowed
+            self.log_test(f"{name} Round Trips", passed, f"{count} command(s), expected {commands}")
+            return passed, response
+        
+        # Stop at the first missing header rather than failing every case
+        passed, _ = check("Register", "POST", "auth/register", 200, practitioner, 1, False)
+        if 'X-Mongo-Round-Trips' not in self.last_response.headers:
+            return False
+        results = [passed]
+        results.append(check("Register Duplicate", "POST", "auth/register", 400, practitioner, 1, False)[0])
+        passed, client_response = check("Register Client", "POST", "auth/register/client", 200, client, 2, False)
+        results.append(passed)
+        results.append(check("Register Client Duplicate", "POST", "auth/register/client", 400, client, 2, False)[0])
+        results.append(check("Update Profile", "PUT", "practitioner/profile", 200,
+                             {"description": f"Mise à jour {timestamp}"}, 1, True)[0])
+        
+        # Patient and appointment lifecycle: the rollups are updated in the same request
+        passed, created = check("Create Patient", "POST", "patients", 200, patient, 2, True)
+        results.append(passed)
+        if 'id' not in created:
+            return False
+        patient_id = created['id']
+        results.append(check("Update Patient", "PUT", f"patients/{patient_id}", 200,
+                             {"notes": f"Suivi {timestamp}"}, 1, True)[0])
+        results.append(check("Update Missing Patient", "PUT", "patients/invalid-id", 404, {"notes": "Suivi"}, 1, True)[0])
+        appointment = {
+            "patient_id": patient_id,
+            "patient_name": patient["full_name"],
+            "date": "2024-12-27",
+            "time": "08:00",
+            "duration": 30
+        }
+        # Lease acquire, conflict check, insert, lease release, statistics
+        passed, booked = check("Create Appointment", "POST", "appointments", 200, appointment, 5, True)
+        results.append(passed)
+        if 'id' in booked:
+            results.append(check("Delete Appointment", "DELETE", f"appointments/{booked['id']}", 200, None, 2, True)[0])
+        else:
+            results.append(False)
+        results.append(check("Delete Missing Appointment", "DELETE", "appointments/invalid-id", 404, None, 1, True)[0])
+        results.append(check("Delete Patient", "DELETE", f"patients/{patient_id}", 200, None, 2, True)[0])
+        results.append(check("Delete Missing Patient", "DELETE", "patients/invalid-id", 404, None, 1, True)[0])
+        
+        # Reviews: client lookup, insert, rating update
+        if 'token' in client_response:
+            client_headers = {'Authorization': f"Bearer {client_response['token']}"}
+            endpoint = f"public/practitioner/{self.practitioner_id}/reviews"
+            results.append(check("Post Review", "POST", endpoint, 200, {"score": 5}, 3, False,
+                                 headers=client_headers)[0])
+            results.append(check("Post Review Duplicate", "POST", endpoint, 400, {"score": 5}, 2, False,
+                                 headers=client_headers)[0])
+        else:
+            results.append(False)
+        return all(results)
+
     def run_all_tests(self):
         """Run all API tests"""
         print("🚀 Starting TherapyCare API Tests...")
@@ -371,20 +944,49 @@ class TherapyCareAPITester:
         print("\n👤 Profile Tests:")
         self.test_get_profile()
         self.test_update_profile()
+        self.test_practitioner_slots()
         self.test_public_profile()
         self.test_invalid_public_profile()
         
+        # Public search tests
+        print("\n🔎 Public Search Tests:")
+        self.test_public_search_pagination()
+        self.test_invalid_search_cursor()
+        self.test_accent_insensitive_search()
+        self.test_near_search()
+        self.test_available_search()
+        self.test_practitioner_review()
+        self.test_specialty_suggest()
+        self.test_catalog_etag()
+        self.test_category_specialties()
+        self.test_registration_sets_category()
+        
         # Patient tests
         print("\n🏥 Patient Tests:")
         self.test_create_patient()
+        self.test_import_patients()
         self.test_get_patients()
+        self.test_export_patients()
         
         # Appointment tests
         print("\n📅 Appointment Tests:")
         self.test_create_appointment()
+        self.test_conflicting_appointment()
         self.test_get_appointments()
+        self.test_get_appointments_window()
+        self.test_patient_history()
+        self.test_export_appointments_csv()
+        self.test_appointment_series()
         self.test_delete_appointment()
         
+        # Statistics tests
+        print("\n📊 Statistics Tests:")
+        self.test_statistics()
+        
+        # Round-trip tests
+        print("\n🔁 Round-trip Tests:")
+        self.test_mongo_round_trips()
+        
         # Print summary
         print("\n" + "=" * 60)
         print(f"📊 Test Summary: {self.tests_passed}/{self.tests_run} tests passed")
@@ -397,7 +999,8 @@ class TherapyCareAPITester:
             return 1
 
 def main():
-    tester = TherapyCareAPITester()
+    # Optional base URL, e.g. a local server started with COUNT_MONGO_ROUND_TRIPS=1
+    tester = TherapyCareAPITester(*sys.argv[1:2])
     return tester.run_all_tests()
 
 if __name__ == "__main__":
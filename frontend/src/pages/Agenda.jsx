@@ -30,10 +30,13 @@ const AgendaCalendar = () => {
   });
 
   useEffect(() => {
-    fetchAppointments();
     fetchPatients();
   }, []);
 
+  useEffect(() => {
+    fetchAppointments();
+  }, [currentWeekStart]);
+
   function getWeekStart(date) {
     const d = new Date(date);
     const day = d.getDay();
@@ -67,8 +70,10 @@ const AgendaCalendar = () => {
   const fetchAppointments = async () => {
     try {
       const token = localStorage.getItem('therapycare_token');
+      // Only the visible week, sorted by the API
       const response = await axios.get(`${API}/appointments`, {
-        headers: { Authorization: `Bearer ${token}` }
+        headers: { Authorization: `Bearer ${token}` },
+        params: { from: formatDate(weekDays[0]), to: formatDate(weekDays[6]) }
       });
       setAppointments(response.data);
     } catch (error) {
@@ -174,7 +179,7 @@ const AgendaCalendar = () => {
         <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4">
           <div>
             <h1 className="text-3xl font-bold text-gray-900">Mon Agenda</h1>
-            <p className="text-gray-600 mt-1">{appointments.length} rendez-vous enregistré(s)</p>
+            <p className="text-gray-600 mt-1">{appointments.length} rendez-vous cette semaine</p>
           </div>
 
           <div className="flex items-center gap-3">
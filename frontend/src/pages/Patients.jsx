@@ -120,16 +120,31 @@ const Patients = () => {
     setDialogOpen(true);
   };
 
+  const fetchPatientAppointments = async (patientId) => {
+    try {
+      const token = localStorage.getItem('therapycare_token');
+      const response = await axios.get(`${API}/patients/${patientId}/appointments`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      const now = new Date();
+      setPatientHistory(prev => ({
+        ...prev,
+        appointments: response.data.map(appointment => ({
+          ...appointment,
+          type: `Consultation (${appointment.duration} min)`,
+          status: appointment.start_at && new Date(appointment.start_at) < now ? 'Terminé' : 'À venir'
+        }))
+      }));
+    } catch (error) {
+      toast.error("Erreur lors du chargement de l'historique");
+    }
+  };
+
   const handleViewDetails = (patient) => {
     setSelectedPatient(patient);
-    // Générer des données mock pour l'historique (à remplacer par API)
+    // Notes, paiements et documents : données mock (à remplacer par API)
     setPatientHistory({
-      appointments: [
-        { id: 1, date: '2024-01-15', time: '10:00', type: 'Consultation initiale', status: 'Terminé', notes: 'Première séance. Patient anxieux concernant stress professionnel.' },
-        { id: 2, date: '2024-01-22', time: '14:30', type: 'Suivi', status: 'Terminé', notes: 'Amélioration notable. Exercices de respiration pratiqués.' },
-        { id: 3, date: '2024-02-05', time: '10:00', type: 'Suivi', status: 'Terminé', notes: 'Patient plus serein. Discussion sur gestion du temps.' },
-        { id: 4, date: '2024-02-19', time: '15:00', type: 'Suivi', status: 'À venir', notes: '' }
-      ],
+      appointments: [],
       notes: [
         { id: 1, date: '2024-01-15', title: 'Évaluation initiale', content: 'Troubles anxieux liés au travail. Antécédents familiaux de stress.', category: 'Diagnostic' },
         { id: 2, date: '2024-01-22', title: 'Observation séance 2', content: 'Bonne réceptivité aux techniques de relaxation. Sommeil amélioré.', category: 'Suivi' },
@@ -148,6 +163,7 @@ const Patients = () => {
       ]
     });
     setPatientDetailsOpen(true);
+    fetchPatientAppointments(patient.id);
   };
 
   // Filtrer les patients selon la recherche
@@ -343,7 +359,9 @@ const Patients = () => {
                       <td className="py-4 px-6">
                         <div className="flex items-center text-sm text-gray-600">
                           <Calendar className="w-4 h-4 mr-2 text-gray-400" />
-                          {patient.last_visit || 'Aucune visite'}
+                          {patient.last_appointment_at
+                            ? new Date(patient.last_appointment_at).toLocaleDateString('fr-FR')
+                            : 'Aucune visite'}
                         </div>
                       </td>
                       <td className="py-4 px-6 text-right">